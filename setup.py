@@ -8,6 +8,9 @@ extensions = [
     Extension("fsetools.lib.fse_bs_en_1993_1_2_heat_transfer_c",
               sources=[f'src{os.sep}fsetools{os.sep}lib{os.sep}fse_bs_en_1993_1_2_heat_transfer_c.pyx'],
               include_dirs=[numpy.get_include()]),
+    Extension("fsetools.lib.fse_activation_hd_c",
+              sources=[f'src{os.sep}fsetools{os.sep}lib{os.sep}fse_activation_hd_c.pyx'],
+              include_dirs=[numpy.get_include()]),
 ]
 
 setup(
@@ -1,4 +1,6 @@
-from typing import Callable
+from typing import Callable, Union
+
+import numpy as np
 
 
 def linear_solver(
@@ -65,3 +67,68 @@ def linear_solver(
         iter_count += 1
 
     raise ValueError("this shouldn't be possible, should always terminate within the while loop above")
+
+
+def linear_solver_batch(
+        func: Callable,
+        y_target: Union[float, np.ndarray],
+        x_upper: Union[float, np.ndarray],
+        x_lower: Union[float, np.ndarray],
+        y_tol: float,
+        iter_max: int = 1000,
+        func_multiplier: float = 1
+) -> tuple:
+    """Vectorised `linear_solver`, solves many single-root functions simultaneously by bracketed bisection. Each
+    element has its own convergence mask and only unsolved elements are evaluated in each iteration.
+
+    :param func:            The function to be solved, `func(x, index)` returns f(x) of the elements `index`, where `x`
+                            and `index` are 1-D arrays, `index` refers to the flattened broadcast of `y_target`,
+                            `x_upper` and `x_lower`.
+    :param y_target:        The target to be solved for, i.e. solve for `f(x)==y_target`.
+    :param x_upper:         The upper limit of the variable.
+    :param x_lower:         The lower limit of the variable.
+    :param y_tol:           Solver tolerance, i.e. actually solve for `abs(f(x)-y_target)<y_tal`.
+    :param iter_max:        Maximum iteration of the solver.
+    :param func_multiplier: 1 if f(x) is proportional to x, -1 if f(x) is inversely proportional to x.
+    :return (x, status):    The solved values and status codes in the broadcast shape of the inputs, status codes are
+                            0   solved, `abs(f(x)-y_target)<y_tol`.
+                            1   `y_target` is below f(x_lower), x_lower is returned, the same as `linear_solver`.
+                            2   `y_target` is above f(x_upper), x_upper is returned, the same as `linear_solver`.
+                            3   `iter_max` reached, nan is returned.
+    """
+    y_target, x_upper, x_lower = np.broadcast_arrays(
+        *[np.asarray(i, dtype=np.float64) for i in (y_target, x_upper, x_lower)]
+    )
+    shape = y_target.shape
+    y_target = y_target.ravel() * func_multiplier
+    x1, x3 = np.minimum(x_lower, x_upper).ravel(), np.maximum(x_lower, x_upper).ravel()
+
+    index = np.arange(y_target.size)
+    y1 = func_multiplier * np.asarray(func(x1, index), dtype=np.float64)
+    y3 = func_multiplier * np.asarray(func(x3, index), dtype=np.float64)
+
+    x = np.full(y_target.size, np.nan)
+    status = np.full(y_target.size, 3, dtype=int)
+    is_below, is_above = y_target < y1, y_target > y3
+    is_above &= ~is_below
+    x[is_below], status[is_below] = x1[is_below], 1
+    x[is_above], status[is_above] = x3[is_above], 2
+
+    is_active = ~(is_below | is_above)
+    x2 = (x1 + x3) / 2
+    for _ in range(iter_max + 2):
+        index = np.flatnonzero(is_active)
+        if index.size == 0:
+            break
+        y2 = func_multiplier * np.asarray(func(x2[index], index), dtype=np.float64)
+        is_solved = np.abs(y2 - y_target[index]) < y_tol
+        x[index[is_solved]], status[index[is_solved]] = x2[index[is_solved]], 0
+        is_active[index[is_solved]] = False
+
+        index_ = index[~is_solved & (y2 < y_target[index])]
+        x1[index_] = x2[index_]
+        index_ = index[~is_solved & (y2 > y_target[index])]
+        x3[index_] = x2[index_]
+        x2[index] = (x1[index] + x3[index]) / 2
+
+    return x.reshape(shape), status.reshape(shape)
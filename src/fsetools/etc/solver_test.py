@@ -0,0 +1,27 @@
+import numpy as np
+
+from .solver import linear_solver, linear_solver_batch
+
+
+def test_linear_solver_batch():
+    a = np.array([1., 2., 3., 0.5, 1.])
+
+    def func(x, index):
+        return a[index] * x ** 2
+
+    y_target = np.array([2., 8., 3., 100., -1.])
+    x, status = linear_solver_batch(func=func, y_target=y_target, x_upper=10, x_lower=0, y_tol=1e-6)
+
+    # the same as the scalar solver
+    for i in range(len(a)):
+        x_ = linear_solver(
+            func=lambda x_: a[i] * x_ ** 2, func_kwargs=dict(), x_name='x_', y_target=y_target[i], x_upper=10,
+            x_lower=0, y_tol=1e-6
+        )
+        assert x[i] == x_
+
+    assert np.all(status == [0, 0, 0, 2, 1])
+
+    # maximum iteration reached
+    x, status = linear_solver_batch(func=func, y_target=2, x_upper=10, x_lower=0, y_tol=1e-12, iter_max=5)
+    assert np.all(np.isnan(x)) and np.all(status == 3)
@@ -89,9 +89,31 @@ def test_points_in_ploy():
     print(res)
 
 
+def test_points_in_polygons():
+    import numpy as np
+    from fsetools.etc.transforms2d import points_in_polygons, ray_tracing_numpy
+
+    # a concave polygon and a triangle, the same as testing each polygon separately
+    x, y = np.random.default_rng(0).uniform(-10, 10, (2, 100, 100))
+    polygons = [
+        [(0, 0), (5, 0), (5, 3), (2, 1), (0, 4)],
+        [(-8, -8), (-2, -8), (-5, -2)],
+    ]
+    inside = points_in_polygons(x, y, polygons)
+    assert inside.shape == x.shape
+    assert np.array_equal(
+        inside.ravel(),
+        ray_tracing_numpy(x.ravel(), y.ravel(), polygons[0]) | ray_tracing_numpy(x.ravel(), y.ravel(), polygons[1])
+    )
+
+    # points in the notch of the concave polygon and outside all bounding boxes
+    assert list(points_in_polygons([2, 1, 4, 9], [2, 1, 1, 9], polygons)) == [False, True, True, False]
+
+
 if __name__ == '__main__':
     test_rotation_meshgrid()
     test_find_line_segment_intersection_1()
     test_find_line_segment_intersection_2()
     test_points_in_ploy()
+    test_points_in_polygons()
     test_angle_between_two_vectors()
@@ -190,3 +190,48 @@ def ray_tracing_numpy(x, y, poly):
 
         p1x, p1y = p2x, p2y
     return inside
+
+
+def points_in_polygons(x: np.ndarray, y: np.ndarray, polygons: list) -> np.ndarray:
+    """Checks whether points are inside any of the polygons, vectorised over points and polygon edges.
+
+    Points are sorted by x once, candidates of each polygon are found by binary search of its bounding box x-range and
+    filtered by its y-range before the even-odd crossing test, thus only points near a polygon are tested against its
+    edges.
+
+    :param x: point x-values, any shape.
+    :param y: point y-values, the same shape as `x`.
+    :param polygons: a list of polygons, each a sequence of (x, y) vertices, closing vertex is optional.
+    :return inside: boolean array of the same shape as `x`, True where the point is inside any polygon.
+    """
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    x_, y_ = np.ravel(x), np.ravel(y)
+    inside = np.zeros(x_.shape, dtype=bool)
+
+    order = np.argsort(x_, kind='stable')
+    x_sorted = x_[order]
+
+    for poly in polygons:
+        poly = np.asarray(poly, dtype=np.float64)
+        x1, y1 = poly[:, 0], poly[:, 1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+
+        # bounding box pre-filter
+        i1 = np.searchsorted(x_sorted, np.amin(x1), side='left')
+        i2 = np.searchsorted(x_sorted, np.amax(x1), side='right')
+        idx = order[i1:i2]
+        idx = idx[(y_[idx] >= np.amin(y1)) & (y_[idx] <= np.amax(y1))]
+        if len(idx) == 0:
+            continue
+
+        # even-odd crossing of a ray towards +x, (n_edges, n_candidates)
+        px, py = x_[idx][np.newaxis, :], y_[idx][np.newaxis, :]
+        x1_, y1_, x2_, y2_ = (i[:, np.newaxis] for i in (x1, y1, x2, y2))
+        is_straddle = (y1_ > py) != (y2_ > py)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = x1_ + (py - y1_) * (x2_ - x1_) / (y2_ - y1_)
+        is_inside = np.sum(is_straddle & (px < x_cross), axis=0) % 2 == 1
+
+        inside[idx[is_inside]] = True
+
+    return inside.reshape(x.shape)
@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Union
 
 import numpy as np
@@ -10,11 +12,64 @@ from ..libstd.pd_7974_1_2019 import eq_27_axisymmetric_ceiling_jet_velocity
 from ..libstd.pd_7974_1_2019 import eq_55_activation_of_heat_detector_device
 
 
+def _plume_or_jet(
+        Q_dot_c_kW: float,
+        z_0: float,
+        z_H: np.ndarray,
+        r: np.ndarray,
+        ambient_gravity_acceleration: float,
+        ambient_gas_temperature: float,
+        ambient_gas_specific_heat: float,
+        ambient_gas_density: float,
+) -> tuple:
+    # gas temperature rise and velocity at detectors, plume (eq. 14 and 15) or ceiling jet (eq. 26 and 27) is selected
+    # for each detector by r / (z_H - z_0)
+    is_jet = (r / (z_H - z_0) > 0.134) & (r / (z_H - z_0) > 0.246)
+    air_type = np.where(is_jet, 2, 1)  # 2 jet, 1 plume
+
+    theta_jet_rise = np.zeros_like(r)
+    u_jet = np.zeros_like(r)
+    if not np.all(is_jet):
+        theta_jet_rise[~is_jet] = eq_14_plume_temperature(
+            T_0=ambient_gas_temperature,
+            g=ambient_gravity_acceleration,
+            c_p_0_kJ_kg_K=ambient_gas_specific_heat,
+            rho_0=ambient_gas_density,
+            Q_dot_c_kW=Q_dot_c_kW,
+            z=z_H[~is_jet],
+            z_0=z_0
+        )
+        u_jet[~is_jet] = eq_15_plume_velocity(
+            T_0=ambient_gas_temperature,
+            g=ambient_gravity_acceleration,
+            c_p_0_kJ_kg_K=ambient_gas_specific_heat,
+            rho_0=ambient_gas_density,
+            Q_dot_c_kW=Q_dot_c_kW,
+            z=z_H[~is_jet],
+            z_0=z_0,
+        )
+    if np.any(is_jet):
+        theta_jet_rise[is_jet] = eq_26_axisymmetric_ceiling_jet_temperature(
+            Q_dot_c_kW=Q_dot_c_kW,
+            z_H=z_H[is_jet],
+            z_0=z_0,
+            r=r[is_jet],
+        )
+        u_jet[is_jet] = eq_27_axisymmetric_ceiling_jet_velocity(
+            Q_dot_c_kW=Q_dot_c_kW,
+            z_H=z_H[is_jet],
+            z_0=z_0,
+            r=r[is_jet],
+        )
+
+    return air_type, theta_jet_rise, u_jet
+
+
 def heat_detector_temperature_pd7974(
         fire_time: Union[np.ndarray, list],
         fire_hrr_kW: Union[np.ndarray, list],
-        detector_to_fire_vertical_distance: float,
-        detector_to_fire_horizontal_distance: float,
+        detector_to_fire_vertical_distance: Union[float, np.ndarray],
+        detector_to_fire_horizontal_distance: Union[float, np.ndarray],
         detector_response_time_index: float,
         detector_conduction_factor: float,
         fire_hrr_density_kWm2: float,
@@ -27,6 +82,16 @@ def heat_detector_temperature_pd7974(
     """This function calculates heat detector device time - temperature revolution based on specified fire heat release
     rate.
 
+    Detector distances may be arrays (broadcast against each other) to solve many detectors of the same fire together,
+    all detectors are advanced in the same time loop with plume or ceiling jet correlation selected for each detector.
+    Detector results are then of shape (*detector shape, n_time), fire diameter and virtual origin are 1-D.
+
+    The plume or ceiling jet correlation is re-selected for each detector at every time step, as the virtual origin
+    moves with the fire, the selected correlation is returned in the air type array (1 plume, 2 ceiling jet).
+
+    Detector temperature is integrated by explicit Euler over `fire_time`, which requires small time steps. See
+    `fse_activation_hd_c.heat_detector_temperature_pd7974` for a compiled exponential integrator accurate at large steps.
+
     :param fire_time:
     :param fire_hrr_kW:
     :param detector_to_fire_vertical_distance:
@@ -42,9 +107,13 @@ def heat_detector_temperature_pd7974(
     :return:
     """
 
-    # refactor with common variable names
-    z_H = detector_to_fire_vertical_distance
-    r = detector_to_fire_horizontal_distance
+    # refactor with common variable names, detectors are flattened and reshaped back when results are packed
+    z_H, r = np.broadcast_arrays(
+        np.asarray(detector_to_fire_vertical_distance, dtype=float),
+        np.asarray(detector_to_fire_horizontal_distance, dtype=float),
+    )
+    detector_shape = z_H.shape
+    z_H, r = z_H.ravel(), r.ravel()
 
     # Check and convert input types
     if isinstance(fire_time, list):
@@ -63,17 +132,17 @@ def heat_detector_temperature_pd7974(
     # =================
 
     fire_diameter = np.zeros_like(fire_time, dtype=float)
-    jet_temperature = np.zeros_like(fire_time, dtype=float)
-    jet_velocity = np.zeros_like(fire_time, dtype=float)
-    detector_temperature = np.zeros_like(fire_time, dtype=float)
     virtual_origin = np.zeros_like(fire_time, dtype=float)
-    air_type_arr = np.zeros_like(fire_time, dtype=int)
+    jet_temperature = np.zeros((len(r), len(fire_time)), dtype=float)
+    jet_velocity = np.zeros((len(r), len(fire_time)), dtype=float)
+    detector_temperature = np.zeros((len(r), len(fire_time)), dtype=float)
+    air_type_arr = np.zeros((len(r), len(fire_time)), dtype=int)
 
     # assign initial conditions
     fire_diameter[0] = ((fire_hrr_kW[0] * fire_conv_frac / fire_hrr_density_kWm2) / 3.1415926) ** 0.5 * 2
-    jet_temperature[0] = ambient_gas_temperature
-    detector_temperature[0] = ambient_gas_temperature
-    air_type_arr[0] = -1
+    jet_temperature[:, 0] = ambient_gas_temperature
+    detector_temperature[:, 0] = ambient_gas_temperature
+    air_type_arr[:, 0] = -1
 
     # Main heat detector temperature calculation starts
     # =================================================
@@ -96,54 +165,18 @@ def heat_detector_temperature_pd7974(
         # -----------------------------
         z_0 = eq_10_virtual_origin(D=D, Q_dot_kW=fire_hrr_kW[i])
 
-        # Decide whehter to use plume or jet
-        # ----------------------------------
-        if (r / (z_H - z_0) > 0.134) and (r / (z_H - z_0) > 0.246):
-            air_type = 2  # jet
-        else:
-            air_type = 1  # plume
-
-        if i > 2 and air_type_arr[i - 1] != air_type:
-            raise ValueError(f'Air temperature correlation transitioned between Jet and Plume at {fire_time[i]} s '
-                             f'with r / (z_H - z_0) = {r / (z_H - z_0):g}. '
-                             f'This is currently not supported by this function.')
-
-        # Calculate ceiling jet temperature and velocity
-        # ----------------------------------------------
-        if air_type == 1:
-            theta_jet_rise = eq_14_plume_temperature(
-                T_0=ambient_gas_temperature,
-                g=ambient_gravity_acceleration,
-                c_p_0_kJ_kg_K=ambient_gas_specific_heat,
-                rho_0=ambient_gas_density,
-                Q_dot_c_kW=Q_dot_c_kW,
-                z=detector_to_fire_vertical_distance,
-                z_0=z_0
-            )
-            u_jet = eq_15_plume_velocity(
-                T_0=ambient_gas_temperature,
-                g=ambient_gravity_acceleration,
-                c_p_0_kJ_kg_K=ambient_gas_specific_heat,
-                rho_0=ambient_gas_density,
-                Q_dot_c_kW=Q_dot_c_kW,
-                z=detector_to_fire_vertical_distance,
-                z_0=z_0,
-            )
-        elif air_type == 2:
-            theta_jet_rise = eq_26_axisymmetric_ceiling_jet_temperature(
-                Q_dot_c_kW=Q_dot_c_kW,
-                z_H=detector_to_fire_vertical_distance,
-                z_0=z_0,
-                r=detector_to_fire_horizontal_distance,
-            )
-            u_jet = eq_27_axisymmetric_ceiling_jet_velocity(
-                Q_dot_c_kW=Q_dot_c_kW,
-                z_H=detector_to_fire_vertical_distance,
-                z_0=z_0,
-                r=detector_to_fire_horizontal_distance,
-            )
-        else:
-            raise ValueError(f'Unknown `air_type` {air_type}')
+        # Calculate ceiling jet temperature and velocity, plume or jet for each detector
+        # ------------------------------------------------------------------------------
+        air_type, theta_jet_rise, u_jet = _plume_or_jet(
+            Q_dot_c_kW=Q_dot_c_kW,
+            z_0=z_0,
+            z_H=z_H,
+            r=r,
+            ambient_gravity_acceleration=ambient_gravity_acceleration,
+            ambient_gas_temperature=ambient_gas_temperature,
+            ambient_gas_specific_heat=ambient_gas_specific_heat,
+            ambient_gas_density=ambient_gas_density,
+        )
 
         theta_jet = theta_jet_rise + ambient_gas_temperature
 
@@ -153,31 +186,35 @@ def heat_detector_temperature_pd7974(
             u=u_jet,
             RTI=detector_response_time_index,
             Delta_T_g=theta_jet - ambient_gas_temperature,
-            Delta_T_e=detector_temperature[i - 1] - ambient_gas_temperature,
+            Delta_T_e=detector_temperature[:, i - 1] - ambient_gas_temperature,
             C=detector_conduction_factor
         )
         d_Delta_Te = d_Delta_Te_dt * dt
-        Delta_Te = d_Delta_Te + detector_temperature[i - 1]
+        Delta_Te = d_Delta_Te + detector_temperature[:, i - 1]
 
         # Record results
         # --------------
         fire_diameter[i] = D
         virtual_origin[i] = z_0
-        air_type_arr[i] = air_type
-        jet_velocity[i] = u_jet
-        jet_temperature[i] = theta_jet
-        detector_temperature[i] = Delta_Te
+        air_type_arr[:, i] = air_type
+        jet_velocity[:, i] = u_jet
+        jet_temperature[:, i] = theta_jet
+        detector_temperature[:, i] = Delta_Te
 
     # Pack up results
     # ===============
+    air_type_arr, jet_velocity, jet_temperature, detector_temperature = (
+        v.reshape(*detector_shape, len(fire_time)) for v in
+        (air_type_arr, jet_velocity, jet_temperature, detector_temperature)
+    )
     return fire_diameter, virtual_origin, air_type_arr, jet_velocity, jet_temperature, detector_temperature,
 
 
 def heat_detector_temperature_pd7974_dict(
         fire_time: Union[np.ndarray, list],
         fire_hrr_kW: Union[np.ndarray, list],
-        detector_to_fire_vertical_distance: float,
-        detector_to_fire_horizontal_distance: float,
+        detector_to_fire_vertical_distance: Union[float, np.ndarray],
+        detector_to_fire_horizontal_distance: Union[float, np.ndarray],
         detector_response_time_index: float,
         detector_conduction_factor: float,
         fire_hrr_density_kWm2: float,
@@ -218,3 +255,224 @@ def heat_detector_temperature_pd7974_dict(
         jet_temperature=jet_temperature,
         detector_temperature=detector_temperature,
     )
+
+
+def heat_detector_activation_time_pd7974(
+        fire_time: Union[np.ndarray, list],
+        fire_hrr_kW: Union[np.ndarray, list],
+        detector_to_fire_vertical_distance: Union[float, np.ndarray],
+        detector_to_fire_horizontal_distance: Union[float, np.ndarray],
+        detector_activation_temperature: Union[float, np.ndarray],
+        detector_response_time_index: float,
+        detector_conduction_factor: float,
+        fire_hrr_density_kWm2: float,
+        fire_conv_frac: float,
+        ambient_gravity_acceleration: Optional[float] = 9.81,
+        ambient_gas_temperature: Optional[float] = 293.15,
+        ambient_gas_specific_heat: Optional[float] = 1.2,
+        ambient_gas_density: Optional[float] = 1.0,
+) -> tuple:
+    """This function calculates heat detector activation time, the same integration as
+    `heat_detector_temperature_pd7974` without storing temperature history. Activated detectors are dropped from the
+    active set and integration stops once all detectors are activated or at the end of the fire. The plume or ceiling
+    jet correlation is re-selected for each active detector at every time step.
+
+    :param fire_time: in s, fire time.
+    :param fire_hrr_kW: in kW, fire heat release rate.
+    :param detector_to_fire_vertical_distance: in m, scalar or array of detectors.
+    :param detector_to_fire_horizontal_distance: in m, scalar or array of detectors.
+    :param detector_activation_temperature: in K, scalar or array of detectors.
+    :param detector_response_time_index: see `heat_detector_temperature_pd7974`.
+    :param detector_conduction_factor: see `heat_detector_temperature_pd7974`.
+    :param fire_hrr_density_kWm2: see `heat_detector_temperature_pd7974`.
+    :param fire_conv_frac: see `heat_detector_temperature_pd7974`.
+    :param ambient_gravity_acceleration: see `heat_detector_temperature_pd7974`.
+    :param ambient_gas_temperature: see `heat_detector_temperature_pd7974`.
+    :param ambient_gas_specific_heat: see `heat_detector_temperature_pd7974`.
+    :param ambient_gas_density: see `heat_detector_temperature_pd7974`.
+    :return activation_time: in s, activation time linearly interpolated within the time step, NaN if not activated.
+    :return activation_hrr_kW: in kW, fire heat release rate at activation time, NaN if not activated.
+    """
+    z_H, r, T_act = np.broadcast_arrays(
+        np.asarray(detector_to_fire_vertical_distance, dtype=float),
+        np.asarray(detector_to_fire_horizontal_distance, dtype=float),
+        np.asarray(detector_activation_temperature, dtype=float),
+    )
+    detector_shape = z_H.shape
+    z_H, r, T_act = z_H.ravel(), r.ravel(), T_act.ravel()
+
+    fire_time = np.asarray(fire_time, dtype=float)
+    fire_hrr_kW = np.asarray(fire_hrr_kW, dtype=float)
+    if len(fire_time) != len(fire_hrr_kW):
+        raise ValueError('Fire time `fire_time` and heat release rate `fire_hrr_kW` length do not match.')
+
+    activation_time = np.full(len(r), np.nan)
+    activation_hrr_kW = np.full(len(r), np.nan)
+
+    # active detectors, indices and their current temperature
+    active = np.arange(len(r))
+    detector_temperature = np.full(len(r), float(ambient_gas_temperature))
+
+    for i in range(1, len(fire_time), 1):
+        if len(active) == 0:
+            break
+
+        dt = fire_time[i] - fire_time[i - 1]
+        Q_dot_c_kW = fire_hrr_kW[i] * fire_conv_frac
+        D = ((fire_hrr_kW[i] / fire_hrr_density_kWm2) / 3.1415926) ** 0.5 * 2
+        z_0 = eq_10_virtual_origin(D=D, Q_dot_kW=fire_hrr_kW[i])
+
+        _, theta_jet_rise, u_jet = _plume_or_jet(
+            Q_dot_c_kW=Q_dot_c_kW,
+            z_0=z_0,
+            z_H=z_H[active],
+            r=r[active],
+            ambient_gravity_acceleration=ambient_gravity_acceleration,
+            ambient_gas_temperature=ambient_gas_temperature,
+            ambient_gas_specific_heat=ambient_gas_specific_heat,
+            ambient_gas_density=ambient_gas_density,
+        )
+
+        d_Delta_Te_dt = eq_55_activation_of_heat_detector_device(
+            u=u_jet,
+            RTI=detector_response_time_index,
+            Delta_T_g=theta_jet_rise,
+            Delta_T_e=detector_temperature[active] - ambient_gas_temperature,
+            C=detector_conduction_factor
+        )
+        T_0, T_1 = detector_temperature[active], detector_temperature[active] + d_Delta_Te_dt * dt
+
+        # activation within this step, interpolated between the temperatures at the start and end of the step
+        is_activated = T_1 >= T_act[active]
+        if np.any(is_activated):
+            j = active[is_activated]
+            f = (T_act[j] - T_0[is_activated]) / (T_1[is_activated] - T_0[is_activated])
+            activation_time[j] = fire_time[i - 1] + f * dt
+            activation_hrr_kW[j] = fire_hrr_kW[i - 1] + f * (fire_hrr_kW[i] - fire_hrr_kW[i - 1])
+
+        detector_temperature[active] = T_1
+        active = active[~is_activated]
+
+    return activation_time.reshape(detector_shape), activation_hrr_kW.reshape(detector_shape)
+
+
+def _heat_detector_activation_time_worker(kwargs: dict) -> tuple:
+    return heat_detector_activation_time_pd7974(**kwargs)
+
+
+def heat_detector_activation_sweep_pd7974(
+        head_xy: np.ndarray,
+        fire_xy: np.ndarray,
+        fire_time: Union[np.ndarray, list],
+        fire_hrr_kW: Union[np.ndarray, list],
+        detector_to_fire_vertical_distance: Union[float, np.ndarray],
+        detector_activation_temperature: Union[float, np.ndarray],
+        detector_response_time_index: float,
+        detector_conduction_factor: float,
+        fire_hrr_density_kWm2: float,
+        fire_conv_frac: float,
+        ambient_gravity_acceleration: Optional[float] = 9.81,
+        ambient_gas_temperature: Optional[float] = 293.15,
+        ambient_gas_specific_heat: Optional[float] = 1.2,
+        ambient_gas_density: Optional[float] = 1.0,
+        search_radius: Optional[float] = None,
+        distance_decimals: int = 3,
+        n_processes: int = 1,
+) -> tuple:
+    """This function calculates the first detector (or sprinkler head) activation of a head layout for each fire
+    position, e.g. the worst case of a layout is the maximum over all fire positions.
+
+    The activation only depends on the fire-head horizontal distance and the head vertical distance, thus each distinct
+    (r, z_H, activation temperature) is solved once by `heat_detector_activation_time_pd7974` and shared by all
+    fire-head pairs with the same distances (rounded to `distance_decimals`).
+
+    :param head_xy: in m, (n_heads, 2) head plan locations.
+    :param fire_xy: in m, (n_fires, 2) fire plan locations.
+    :param fire_time: in s, fire time.
+    :param fire_hrr_kW: in kW, fire heat release rate.
+    :param detector_to_fire_vertical_distance: in m, scalar or (n_heads,) array.
+    :param detector_activation_temperature: in K, scalar or (n_heads,) array.
+    :param detector_response_time_index: see `heat_detector_temperature_pd7974`.
+    :param detector_conduction_factor: see `heat_detector_temperature_pd7974`.
+    :param fire_hrr_density_kWm2: see `heat_detector_temperature_pd7974`.
+    :param fire_conv_frac: see `heat_detector_temperature_pd7974`.
+    :param ambient_gravity_acceleration: see `heat_detector_temperature_pd7974`.
+    :param ambient_gas_temperature: see `heat_detector_temperature_pd7974`.
+    :param ambient_gas_specific_heat: see `heat_detector_temperature_pd7974`.
+    :param ambient_gas_density: see `heat_detector_temperature_pd7974`.
+    :param search_radius: in m, optional, only heads within this horizontal distance of a fire are considered.
+    :param distance_decimals: number of decimals distances are rounded to before being cached.
+    :param n_processes: number of worker processes to solve distinct distances, `None` to use all available CPUs.
+    :return activation_time: in s, (n_fires,) first activation time, NaN if no head activated.
+    :return activation_head: (n_fires,) index of the first activated head, -1 if no head activated.
+    :return activation_hrr_kW: in kW, (n_fires,) fire heat release rate at the first activation, NaN if no head
+        activated.
+    """
+    head_xy = np.reshape(np.asarray(head_xy, dtype=float), (-1, 2))
+    fire_xy = np.reshape(np.asarray(fire_xy, dtype=float), (-1, 2))
+    n_heads, n_fires = len(head_xy), len(fire_xy)
+
+    # (n_fires, n_heads) distances, pairs beyond `search_radius` are excluded
+    r = np.round(np.hypot(*(fire_xy[:, np.newaxis, :] - head_xy[np.newaxis, :, :]).transpose(2, 0, 1)),
+                 distance_decimals)
+    z_H = np.broadcast_to(np.round(np.asarray(detector_to_fire_vertical_distance, dtype=float), distance_decimals),
+                          (n_heads,))
+    T_act = np.broadcast_to(np.asarray(detector_activation_temperature, dtype=float), (n_heads,))
+    is_near = np.ones_like(r, dtype=bool) if search_radius is None else r <= search_radius
+
+    # distinct cases, solved once each
+    cases = np.column_stack(
+        [r[is_near], np.broadcast_to(z_H, r.shape)[is_near], np.broadcast_to(T_act, r.shape)[is_near]]
+    )
+    cases, inverse = np.unique(cases, axis=0, return_inverse=True)
+    inverse = np.ravel(inverse)
+
+    kwargs = dict(
+        fire_time=fire_time,
+        fire_hrr_kW=fire_hrr_kW,
+        detector_response_time_index=detector_response_time_index,
+        detector_conduction_factor=detector_conduction_factor,
+        fire_hrr_density_kWm2=fire_hrr_density_kWm2,
+        fire_conv_frac=fire_conv_frac,
+        ambient_gravity_acceleration=ambient_gravity_acceleration,
+        ambient_gas_temperature=ambient_gas_temperature,
+        ambient_gas_specific_heat=ambient_gas_specific_heat,
+        ambient_gas_density=ambient_gas_density,
+    )
+
+    if n_processes is None:
+        n_processes = os.cpu_count()
+    chunks = np.array_split(np.arange(len(cases)), max(min(n_processes, len(cases)), 1))
+    kwargs_list = [
+        dict(
+            kwargs,
+            detector_to_fire_horizontal_distance=cases[chunk, 0],
+            detector_to_fire_vertical_distance=cases[chunk, 1],
+            detector_activation_temperature=cases[chunk, 2],
+        )
+        for chunk in chunks
+    ]
+    if n_processes <= 1 or len(chunks) <= 1:
+        results = [_heat_detector_activation_time_worker(i) for i in kwargs_list]
+    else:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(_heat_detector_activation_time_worker, kwargs_list))
+    case_time = np.concatenate([i[0] for i in results]) if results else np.zeros(0)
+    case_hrr = np.concatenate([i[1] for i in results]) if results else np.zeros(0)
+
+    # map distinct cases back to fire-head pairs and find the first activation of each fire position
+    pair_time = np.full(r.shape, np.inf)
+    pair_time[is_near] = np.where(np.isnan(case_time[inverse]), np.inf, case_time[inverse])
+    pair_hrr = np.full(r.shape, np.nan)
+    pair_hrr[is_near] = case_hrr[inverse]
+
+    activation_head = np.argmin(pair_time, axis=1)
+    activation_time = pair_time[np.arange(n_fires), activation_head]
+    activation_hrr_kW = pair_hrr[np.arange(n_fires), activation_head]
+
+    is_activated = np.isfinite(activation_time)
+    activation_head = np.where(is_activated, activation_head, -1)
+    activation_time = np.where(is_activated, activation_time, np.nan)
+    activation_hrr_kW = np.where(is_activated, activation_hrr_kW, np.nan)
+
+    return activation_time, activation_head, activation_hrr_kW
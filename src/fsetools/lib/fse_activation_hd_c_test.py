@@ -0,0 +1,67 @@
+import numpy as np
+
+
+def __test_kwargs():
+    return dict(
+        detector_to_fire_vertical_distance=np.array([3.6, 3., 3.]),
+        detector_to_fire_horizontal_distance=np.array([2.83, 2.5, 0.3]),
+        detector_response_time_index=115,
+        detector_conduction_factor=0.4,
+        fire_hrr_density_kWm2=510,
+        fire_conv_frac=0.7,
+    )
+
+
+def __t_squared_fire(dt: float):
+    from fsetools.libstd.pd_7974_1_2019 import eq_22_t_squared_fire_growth
+    t = np.arange(0, 600 + 0.5 * dt, dt)
+    return t, eq_22_t_squared_fire_growth(alpha=0.0117, t=t) / 1000.
+
+
+def test_heat_detector_temperature_pd7974_convergence():
+    from fsetools.lib.fse_activation_hd import heat_detector_temperature_pd7974
+    from fsetools.lib.fse_activation_hd_c import heat_detector_temperature_pd7974 as heat_detector_temperature_pd7974_c
+
+    # explicit Euler at fine time step as reference, plume and ceiling jet detectors
+    t_ref, q_ref = __t_squared_fire(0.05)
+    T_ref = heat_detector_temperature_pd7974(fire_time=t_ref, fire_hrr_kW=q_ref, **__test_kwargs())[-1]
+
+    for dt, tol in ((0.05, 0.05), (1., 0.1), (5., 0.1)):
+        t, q = __t_squared_fire(dt)
+        T = heat_detector_temperature_pd7974_c(fire_time=t, fire_hrr_kW=q, **__test_kwargs())
+        assert T.shape == (3, len(t))
+        assert np.amax(np.abs(T - T_ref[:, ::int(round(dt / 0.05))])) < tol
+
+        # activation time at 68 deg.C
+        for T_, T_ref_ in zip(T, T_ref):
+            assert abs(np.interp(68 + 273.15, T_, t) - np.interp(68 + 273.15, T_ref_, t_ref)) < 0.2
+
+    # explicit Euler at the same large time step is far off
+    t, q = __t_squared_fire(5.)
+    T = heat_detector_temperature_pd7974(fire_time=t, fire_hrr_kW=q, **__test_kwargs())[-1]
+    assert np.amax(np.abs(T - T_ref[:, ::100])) > 1.
+
+
+def test_heat_detector_temperature_pd7974_scalar():
+    from fsetools.lib.fse_activation_hd_c import heat_detector_temperature_pd7974 as heat_detector_temperature_pd7974_c
+
+    t, q = __t_squared_fire(1.)
+    kwargs = __test_kwargs()
+    T = heat_detector_temperature_pd7974_c(fire_time=t, fire_hrr_kW=q, **kwargs)
+    kwargs.update(detector_to_fire_vertical_distance=3.6, detector_to_fire_horizontal_distance=2.83)
+    T_ = heat_detector_temperature_pd7974_c(fire_time=t, fire_hrr_kW=q, **kwargs)
+    assert T_.shape == (len(t),)
+    assert np.allclose(T_, T[0])
+
+    # a detector changing from ceiling jet to plume mid-fire, the same as explicit Euler at fine time step
+    from fsetools.lib.fse_activation_hd import heat_detector_temperature_pd7974
+    kwargs.update(detector_to_fire_vertical_distance=3., detector_to_fire_horizontal_distance=0.8)
+    T_ = heat_detector_temperature_pd7974_c(fire_time=t, fire_hrr_kW=q, **kwargs)
+    t_ref, q_ref = __t_squared_fire(0.05)
+    T_ref = heat_detector_temperature_pd7974(fire_time=t_ref, fire_hrr_kW=q_ref, **kwargs)[-1]
+    assert np.amax(np.abs(T_ - T_ref[::20])) < 1.
+
+
+if __name__ == '__main__':
+    test_heat_detector_temperature_pd7974_convergence()
+    test_heat_detector_temperature_pd7974_scalar()
@@ -53,6 +53,157 @@ def test_heat_detector_activation_ceiling_pd7974_2():
     assert abs(calculated_activation_time - given_activation_time) <= 1.
 
 
+def test_heat_detector_temperature_pd7974_array():
+    from ..libstd.pd_7974_1_2019 import eq_22_t_squared_fire_growth
+
+    t = np.arange(0, 600, 0.5)
+    kwargs = dict(
+        fire_time=t,
+        fire_hrr_kW=eq_22_t_squared_fire_growth(0.0117, t) / 1000.,
+        detector_response_time_index=115,
+        detector_conduction_factor=0.4,
+        fire_hrr_density_kWm2=510,
+        fire_conv_frac=0.7,
+    )
+
+    # detectors in plume and ceiling jet are solved together, the same as solved one by one
+    z_H = np.array([3., 3.6, 3., 5.])
+    r = np.array([2.5, 2.83, 0.3, 4.])
+    res = heat_detector_temperature_pd7974_dict(
+        detector_to_fire_vertical_distance=z_H, detector_to_fire_horizontal_distance=r, **kwargs
+    )
+    assert res['detector_temperature'].shape == (4, len(t))
+    assert list(res['air_type'][:, -1]) == [2, 2, 1, 2]
+    for i in range(4):
+        res_ = heat_detector_temperature_pd7974_dict(
+            detector_to_fire_vertical_distance=z_H[i], detector_to_fire_horizontal_distance=r[i], **kwargs
+        )
+        assert res_['detector_temperature'].shape == (len(t),)
+        for k in ('air_type', 'jet_velocity', 'jet_temperature', 'detector_temperature'):
+            assert np.allclose(res[k][i], res_[k])
+
+    # a detector changes from ceiling jet to plume mid-fire as the virtual origin descends, others are unaffected
+    r = np.array([0.8, 2.5])
+    res = heat_detector_temperature_pd7974_dict(
+        detector_to_fire_vertical_distance=3., detector_to_fire_horizontal_distance=r, **kwargs
+    )
+    assert res['air_type'][0, 1] == 2 and res['air_type'][0, -1] == 1
+    assert np.all(np.isfinite(res['detector_temperature']))
+    for i in range(2):
+        res_ = heat_detector_temperature_pd7974_dict(
+            detector_to_fire_vertical_distance=3., detector_to_fire_horizontal_distance=r[i], **kwargs
+        )
+        assert np.allclose(res['detector_temperature'][i], res_['detector_temperature'])
+
+
+def test_heat_detector_activation_time_pd7974():
+    from ..libstd.pd_7974_1_2019 import eq_22_t_squared_fire_growth
+
+    t = np.arange(0, 600, 0.5)
+    kwargs = dict(
+        fire_time=t,
+        fire_hrr_kW=eq_22_t_squared_fire_growth(0.0117, t) / 1000.,
+        detector_response_time_index=115,
+        detector_conduction_factor=0.4,
+        fire_hrr_density_kWm2=510,
+        fire_conv_frac=0.7,
+    )
+    z_H = np.array([3.6, 3., 3., 20.])
+    r = np.array([2.83, 2.5, 0.3, 30.])
+    T_act = 68 + 273.15
+
+    activation_time, activation_hrr = heat_detector_activation_time_pd7974(
+        detector_to_fire_vertical_distance=z_H, detector_to_fire_horizontal_distance=r,
+        detector_activation_temperature=T_act, **kwargs
+    )
+
+    # the same as interpolated from the full temperature history, the same cases as the tests above
+    detector_temperature = heat_detector_temperature_pd7974_dict(
+        detector_to_fire_vertical_distance=z_H, detector_to_fire_horizontal_distance=r, **kwargs
+    )['detector_temperature']
+    for i in range(3):
+        assert abs(activation_time[i] - np.interp(T_act, detector_temperature[i], t)) < 1e-6
+    assert abs(activation_time[0] - 333) <= 1.
+    assert abs(activation_time[1] - 287) <= 1.
+    assert np.allclose(activation_hrr[:3], np.interp(activation_time[:3], t, kwargs['fire_hrr_kW']), rtol=1e-3)
+
+    # not activated by the end of the fire
+    assert np.isnan(activation_time[3]) and np.isnan(activation_hrr[3])
+
+    # one detector changes from ceiling jet to plume at 466 s before its activation, the others are unaffected
+    r = np.array([0.9, 2.5, 0.9])
+    T_act = np.array([300, 68, 68]) + 273.15
+    activation_time, _ = heat_detector_activation_time_pd7974(
+        detector_to_fire_vertical_distance=3., detector_to_fire_horizontal_distance=r,
+        detector_activation_temperature=T_act, **kwargs
+    )
+    res = heat_detector_temperature_pd7974_dict(
+        detector_to_fire_vertical_distance=3., detector_to_fire_horizontal_distance=r, **kwargs
+    )
+    assert res['air_type'][0, 1] == 2 and res['air_type'][0, -1] == 1
+    assert activation_time[0] > t[np.argmax(res['air_type'][0, 1:] == 1) + 1]
+    for i in range(3):
+        assert abs(activation_time[i] - np.interp(T_act[i], res['detector_temperature'][i], t)) < 1e-6
+
+
+def test_heat_detector_activation_sweep_pd7974():
+    from ..libstd.pd_7974_1_2019 import eq_22_t_squared_fire_growth
+
+    t = np.arange(0, 600, 0.5)
+    kwargs = dict(
+        fire_time=t,
+        fire_hrr_kW=eq_22_t_squared_fire_growth(0.0117, t) / 1000.,
+        detector_to_fire_vertical_distance=3.,
+        detector_activation_temperature=68 + 273.15,
+        detector_response_time_index=115,
+        detector_conduction_factor=0.4,
+        fire_hrr_density_kWm2=510,
+        fire_conv_frac=0.7,
+    )
+
+    # 3 m x 3 m head layout and fire positions at 1 m grid
+    head_xy = np.stack(np.meshgrid(np.arange(0, 10, 3), np.arange(0, 10, 3)), axis=-1).reshape(-1, 2)
+    fire_xy = np.stack(np.meshgrid(np.arange(0, 10, 1), np.arange(0, 10, 1)), axis=-1).reshape(-1, 2)
+    activation_time, activation_head, activation_hrr = heat_detector_activation_sweep_pd7974(
+        head_xy=head_xy, fire_xy=fire_xy, **kwargs
+    )
+
+    # the same as solving every fire-head pair, to the rounding of distances
+    kwargs_ = dict(kwargs)
+    kwargs_.pop('detector_to_fire_vertical_distance')
+    r = np.hypot(*(fire_xy[:, np.newaxis, :] - head_xy[np.newaxis, :, :]).transpose(2, 0, 1))
+    pair_time, _ = heat_detector_activation_time_pd7974(
+        detector_to_fire_vertical_distance=3., detector_to_fire_horizontal_distance=r, **kwargs_
+    )
+    assert np.allclose(activation_time, np.nanmin(pair_time, axis=1), rtol=1e-3)
+    assert np.allclose(pair_time[np.arange(len(fire_xy)), activation_head], activation_time, rtol=1e-3)
+    assert np.allclose(activation_hrr, np.interp(activation_time, t, kwargs['fire_hrr_kW']), rtol=1e-3)
+
+    # worst case is the fire position furthest from its nearest head
+    assert np.amin(r, axis=1)[np.argmax(activation_time)] == np.amax(np.amin(r, axis=1))
+
+    # heads beyond the search radius are not considered, results are the same with worker processes
+    activation_time_, activation_head_, _ = heat_detector_activation_sweep_pd7974(
+        head_xy=head_xy, fire_xy=fire_xy, search_radius=1., n_processes=2, **kwargs
+    )
+    assert np.allclose(activation_time_[np.amin(r, axis=1) <= 1], activation_time[np.amin(r, axis=1) <= 1])
+    assert np.all(np.isnan(activation_time_[np.amin(r, axis=1) > 1]))
+    assert np.all(activation_head_[np.amin(r, axis=1) > 1] == -1)
+
+    # 3 m head grid over 0-12 m and fires at 0.25 m grid, some fire-head pairs change from ceiling jet to plume mid-fire
+    head_xy = np.stack(np.meshgrid(np.arange(0, 13, 3), np.arange(0, 13, 3)), axis=-1).reshape(-1, 2)
+    fire_xy = np.stack(np.meshgrid(np.arange(0, 12.1, 0.25), np.arange(0, 12.1, 0.25)), axis=-1).reshape(-1, 2)
+    activation_time, activation_head, _ = heat_detector_activation_sweep_pd7974(
+        head_xy=head_xy, fire_xy=fire_xy, **kwargs
+    )
+    assert np.all(np.isfinite(activation_time)) and np.all(activation_head >= 0)
+    r = np.hypot(*(fire_xy[:, np.newaxis, :] - head_xy[np.newaxis, :, :]).transpose(2, 0, 1))
+    assert np.amin(r, axis=1)[np.argmax(activation_time)] == np.amax(np.amin(r, axis=1))
+
+
 if __name__ == '__main__':
     test_heat_detector_activation_ceiling_pd7974()
     test_heat_detector_activation_ceiling_pd7974_2()
+    test_heat_detector_temperature_pd7974_array()
+    test_heat_detector_activation_time_pd7974()
+    test_heat_detector_activation_sweep_pd7974()
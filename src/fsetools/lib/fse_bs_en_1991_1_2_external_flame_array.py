@@ -0,0 +1,243 @@
+"""
+Numeric engine of the external flame calculation in Clause B.4, BS EN 1991-1-2 (2002), evaluates many openings at once.
+
+The same calculation chain as `ExternalFlameNoForcedDraught` and `ExternalFlameForcedDraught` but all inputs are arrays
+(or scalars) broadcast together, each element is an opening, branches are selected per element with masks and results
+are columnar, i.e. a dict of arrays. LaTeX report objects are only built on request, see `external_flame_report`.
+"""
+
+from typing import Optional, Union
+
+import numpy as np
+
+
+def _dw_ratio(W_1, W_2, A_v, A_v1, L_c, W_c, is_windows_on_more_than_one_wall, is_central_core) -> np.ndarray:
+    """Clause B.2 (2) to (4), `DW_ratio` per opening, the same conditions as `ExternalFlameNoForcedDraught`. Raises
+    `ValueError` if any input required by the clause selected for an opening is missing (NaN)."""
+    is_b_2_2 = ~is_windows_on_more_than_one_wall & ~is_central_core
+    is_b_2_3 = is_windows_on_more_than_one_wall & ~is_central_core
+    is_b_2_4 = is_central_core
+
+    for clause, mask, required in (
+            ('B.2 (2)', is_b_2_2, dict(W_1=W_1, W_2=W_2)),
+            ('B.2 (3)', is_b_2_3, dict(W_1=W_1, W_2=W_2, A_v1=A_v1)),
+            ('B.2 (4)', is_b_2_4, dict(W_1=W_1, W_2=W_2, A_v1=A_v1, L_c=L_c, W_c=W_c)),
+    ):
+        for k, v in required.items():
+            is_missing = mask & np.isnan(v)
+            if np.any(is_missing):
+                raise ValueError(f'`{k}` is required by Clause {clause} to calculate `DW_ratio` but missing for '
+                                 f'{np.count_nonzero(is_missing)} opening(s), provide `{k}`, `DW_ratio` or `Q`.')
+
+    DW_ratio = np.full(W_1.shape, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):  # only selected elements are kept
+        DW_ratio[is_b_2_2] = (W_2 / W_1)[is_b_2_2]
+        DW_ratio[is_b_2_3] = ((W_2 / W_1) * (A_v1 / A_v))[is_b_2_3]
+        DW_ratio[is_b_2_4] = (((W_2 - L_c) * A_v1) / ((W_1 - W_c) * A_v))[is_b_2_4]
+    return DW_ratio
+
+
+def external_flame_no_forced_draught_array(
+        w_t: Union[float, np.ndarray],
+        h_eq: Union[float, np.ndarray],
+        A_f: Union[float, np.ndarray],
+        A_t: Union[float, np.ndarray],
+        q_fd: Union[float, np.ndarray],
+        L_x: Union[float, np.ndarray],
+        W_1: Union[float, np.ndarray] = np.nan,
+        W_2: Union[float, np.ndarray] = np.nan,
+        A_v1: Union[float, np.ndarray] = np.nan,
+        L_c: Union[float, np.ndarray] = np.nan,
+        W_c: Union[float, np.ndarray] = np.nan,
+        is_windows_on_more_than_one_wall: Union[bool, np.ndarray] = False,
+        is_central_core: Union[bool, np.ndarray] = False,
+        is_wall_above_opening: Union[bool, np.ndarray] = True,
+        d_ow: Union[float, np.ndarray] = np.inf,
+        tau_F: Union[float, np.ndarray] = 1200.,
+        rho_g: float = 0.45,
+        g: float = 9.81,
+        T_0: float = 293.15,
+        DW_ratio: Optional[Union[float, np.ndarray]] = None,
+        Q: Optional[Union[float, np.ndarray]] = None,
+) -> dict:
+    """
+    Calculates external flame characteristics of many openings as per Clause B.4.1, BS EN 1991-1-2 (2002), no forced
+    draught, i.e. `ExternalFlameNoForcedDraught` over arrays. See `SYMBOLS` in
+    `libstd.bs_en_1991_1_2_2002_annex_b` for the meaning and units of the parameters.
+
+    :param w_t:                                 [m] sum of window widths.
+    :param h_eq:                                [m] weighted average of window heights.
+    :param A_f:                                 [m2] floor area.
+    :param A_t:                                 [m2] total area of enclosure.
+    :param q_fd:                                [MJ/m2] design fire load density.
+    :param L_x:                                 [m] axis length from the window to the point of measurement.
+    :param W_1:                                 [m] width of wall 1, required if `DW_ratio` and `Q` are not provided.
+    :param W_2:                                 [m] width of the wall perpendicular to wall 1, required if `DW_ratio`
+                                                and `Q` are not provided.
+    :param A_v1:                                [m2] window area on wall 1, required for Clause B.2 (3) and (4).
+    :param L_c:                                 [m] length of the core, required for Clause B.2 (4).
+    :param W_c:                                 [m] width of the core, required for Clause B.2 (4).
+    :param is_windows_on_more_than_one_wall:    Clause B.2 (3) or (4) if True.
+    :param is_central_core:                     Clause B.2 (4) if True.
+    :param is_wall_above_opening:               see `clause_b_4_1_6_L_H`.
+    :param d_ow:                                [m] distance to any other window, infinite if not provided.
+    :param tau_F:                               [s] free burning fire duration.
+    :param rho_g:                               [kg/m3] gas density.
+    :param g:                                   [m/s2] gravity acceleration.
+    :param T_0:                                 [K] ambient temperature.
+    :param DW_ratio:                            [-] optional, calculated as per Clause B.2 if not provided.
+    :param Q:                                   [MW] optional, calculated as per Clause B.4.1 (1) if not provided.
+    :return:    A dict of arrays, all with the broadcast shape of the inputs, containing inputs and `A_v`, `O`,
+                `Omega`, `DW_ratio`, `Q`, `T_f`, `L_L`, `L_H`, `L_f`, `T_w`, `T_z` and `is_out_of_range`, where
+                `is_out_of_range` is True where the condition L_f * w_t / Q < 1 of Clause B.4.1 (8) is not satisfied
+                and `T_w` and `T_z` are NaN.
+    :raises ValueError: if `DW_ratio` and `Q` are not provided and any Clause B.2 input required by an opening is
+                missing, see `W_1`, `W_2`, `A_v1`, `L_c` and `W_c`.
+    """
+    w_t, h_eq, A_f, A_t, q_fd, L_x, W_1, W_2, A_v1, L_c, W_c, d_ow, tau_F = np.broadcast_arrays(
+        *(np.asarray(i, dtype=float) for i in (w_t, h_eq, A_f, A_t, q_fd, L_x, W_1, W_2, A_v1, L_c, W_c, d_ow, tau_F))
+    )
+    is_windows_on_more_than_one_wall, is_central_core, is_wall_above_opening = (
+        np.broadcast_to(np.asarray(i, dtype=bool), w_t.shape)
+        for i in (is_windows_on_more_than_one_wall, is_central_core, is_wall_above_opening)
+    )
+
+    A_v = w_t * h_eq
+    O = h_eq ** 0.5 * A_v / A_t
+    Omega = A_f * q_fd / (A_v * A_t) ** 0.5
+
+    # Clause B.2 and B.4.1 (1), heat release rate
+    overrides = tuple(k for k, v in (('DW_ratio', DW_ratio), ('Q', Q)) if v is not None)
+    if Q is None:
+        if DW_ratio is None:
+            DW_ratio = _dw_ratio(W_1, W_2, A_v, A_v1, L_c, W_c, is_windows_on_more_than_one_wall, is_central_core)
+        DW_ratio = np.broadcast_to(np.asarray(DW_ratio, dtype=float), w_t.shape)
+        Q = np.minimum(A_f * q_fd / tau_F, 3.15 * (1 - np.exp(-0.036 / O)) * A_v * (h_eq / DW_ratio) ** 0.5)
+    else:
+        DW_ratio = np.broadcast_to(np.nan if DW_ratio is None else np.asarray(DW_ratio, dtype=float), w_t.shape)
+    Q = np.broadcast_to(np.asarray(Q, dtype=float), w_t.shape)
+
+    # Clause B.4.1 (2) and (3), compartment temperature and flame height
+    T_f = 6000 * (1 - np.exp(-0.1 / O)) * O ** 0.5 * (1 - np.exp(-0.00286 * Omega)) + T_0
+    L_L = np.maximum(0, h_eq * (2.37 * (Q / (A_v * rho_g * (h_eq * g) ** 0.5)) ** (2 / 3) - 1))
+
+    # Clause B.4.1 (6), flame horizontal projection
+    is_b_8 = is_wall_above_opening & (h_eq <= 1.25 * w_t)
+    is_b_9 = is_wall_above_opening & ~is_b_8 & (d_ow > 4 * w_t)
+    is_b_10 = is_wall_above_opening & ~is_b_8 & ~is_b_9
+    L_H = np.empty(w_t.shape)
+    L_H[is_b_8] = h_eq[is_b_8] / 3
+    L_H[is_b_9] = 0.3 * h_eq[is_b_9] * (h_eq[is_b_9] / w_t[is_b_9]) ** 0.54
+    L_H[is_b_10] = 0.454 * h_eq[is_b_10] * (h_eq[is_b_10] / (2 * w_t[is_b_10])) ** 0.54
+    L_H[~is_wall_above_opening] = 0.6 * h_eq[~is_wall_above_opening] * (
+            L_L[~is_wall_above_opening] / h_eq[~is_wall_above_opening]) ** (1 / 3)
+
+    # Clause B.4.1 (7), flame length, Equation B.12 or B.13
+    L_f = np.where(is_b_8, L_L + h_eq / 2, (L_L ** 2 + (L_H - h_eq / 3) ** 2) ** 0.5 + h_eq / 2)
+
+    # Clause B.4.1 (8) and (10), flame temperatures
+    with np.errstate(divide='ignore', invalid='ignore'):
+        is_out_of_range = ~(L_f * w_t / Q < 1)
+        T_w = np.where(is_out_of_range, np.nan, 520 / (1 - 0.4725 * (L_f * w_t / Q)) + T_0)
+        T_z = (T_w - T_0) * (1 - 0.4725 * (L_x * w_t / Q)) + T_0
+
+    return dict(
+        w_t=w_t, h_eq=h_eq, A_f=A_f, A_t=A_t, q_fd=q_fd, L_x=L_x, W_1=W_1, W_2=W_2, A_v1=A_v1, L_c=L_c, W_c=W_c,
+        is_windows_on_more_than_one_wall=is_windows_on_more_than_one_wall, is_central_core=is_central_core,
+        is_wall_above_opening=is_wall_above_opening, d_ow=d_ow, tau_F=tau_F, rho_g=rho_g, g=g, T_0=T_0,
+        A_v=A_v, O=O, Omega=Omega, DW_ratio=DW_ratio, Q=Q, T_f=T_f, L_L=L_L, L_H=L_H, L_f=L_f, T_w=T_w, T_z=T_z,
+        is_out_of_range=is_out_of_range, is_forced_draught=False, _overrides=overrides,
+    )
+
+
+def external_flame_forced_draught_array(
+        w_t: Union[float, np.ndarray],
+        h_eq: Union[float, np.ndarray],
+        A_f: Union[float, np.ndarray],
+        A_t: Union[float, np.ndarray],
+        q_fd: Union[float, np.ndarray],
+        L_x: Union[float, np.ndarray],
+        u: Union[float, np.ndarray] = 6.,
+        tau_F: Union[float, np.ndarray] = 1200.,
+        T_0: float = 293.15,
+        Q: Optional[Union[float, np.ndarray]] = None,
+) -> dict:
+    """
+    Calculates external flame characteristics of many openings as per Clause B.4.2, BS EN 1991-1-2 (2002), forced
+    draught, i.e. `ExternalFlameForcedDraught` over arrays. `DW_ratio` is not required as the heat release rate in
+    Clause B.4.2 (1) does not depend on it.
+
+    :param w_t:     [m] sum of window widths.
+    :param h_eq:    [m] weighted average of window heights.
+    :param A_f:     [m2] floor area.
+    :param A_t:     [m2] total area of enclosure.
+    :param q_fd:    [MJ/m2] design fire load density.
+    :param L_x:     [m] axis length from the window to the point of measurement.
+    :param u:       [m/s] wind speed.
+    :param tau_F:   [s] free burning fire duration.
+    :param T_0:     [K] ambient temperature.
+    :param Q:       [MW] optional, calculated as per Clause B.4.2 (1) if not provided.
+    :return:    A dict of arrays, all with the broadcast shape of the inputs, containing inputs and `A_v`, `O`,
+                `Omega`, `Q`, `T_f`, `L_L`, `L_H`, `w_f`, `L_f`, `T_w`, `T_z` and `is_out_of_range`, where
+                `is_out_of_range` is True where the condition L_f * A_v ** 0.5 / Q < 1 of Clause B.4.2 (7) is not
+                satisfied and `T_w` and `T_z` are NaN.
+    """
+    w_t, h_eq, A_f, A_t, q_fd, L_x, u, tau_F = np.broadcast_arrays(
+        *(np.asarray(i, dtype=float) for i in (w_t, h_eq, A_f, A_t, q_fd, L_x, u, tau_F))
+    )
+
+    A_v = w_t * h_eq
+    O = h_eq ** 0.5 * A_v / A_t
+    Omega = A_f * q_fd / (A_v * A_t) ** 0.5
+
+    # Clause B.4.2 (1) to (6)
+    overrides = ('Q',) if Q is not None else tuple()
+    Q = np.broadcast_to(np.asarray(A_f * q_fd / tau_F if Q is None else Q, dtype=float), w_t.shape)
+    T_f = 1200 * (1 - np.exp(-0.00228 * Omega)) + T_0
+    L_L = 1.366 * (1 / u) ** 0.43 * Q / A_v ** 0.5 - h_eq
+    L_H = 0.605 * (u ** 2 / h_eq) ** 0.22 * (L_L + h_eq)
+    w_f = w_t + 0.4 * L_H
+    L_f = (L_L ** 2 + L_H ** 2) ** 0.5
+
+    # Clause B.4.2 (7) and (9), flame temperatures
+    with np.errstate(divide='ignore', invalid='ignore'):
+        is_out_of_range = ~(L_f * A_v ** 0.5 / Q < 1)
+        T_w = np.where(is_out_of_range, np.nan, 520 / (1 - 0.3325 * L_f * A_v ** 0.5 / Q) + T_0)
+        T_z = (1 - 0.3325 * L_x * A_v ** 0.5 / Q) * (T_w - T_0) + T_0
+
+    return dict(
+        w_t=w_t, h_eq=h_eq, A_f=A_f, A_t=A_t, q_fd=q_fd, L_x=L_x, u=u, tau_F=tau_F, T_0=T_0,
+        A_v=A_v, O=O, Omega=Omega, Q=Q, T_f=T_f, L_L=L_L, L_H=L_H, w_f=w_f, L_f=L_f, T_w=T_w, T_z=T_z,
+        is_out_of_range=is_out_of_range, is_forced_draught=True, _overrides=overrides,
+    )
+
+
+def external_flame_report(results: dict, index: Union[int, tuple]):
+    """
+    Builds the LaTeX report object of one opening from columnar results of `external_flame_no_forced_draught_array`
+    or `external_flame_forced_draught_array`, i.e. `ExternalFlameNoForcedDraught` or `ExternalFlameForcedDraught`.
+
+    :param results: columnar results.
+    :param index:   index of the opening.
+    :return:        report object, see `make_latex` and `make_latex_sections`.
+    """
+    if results['is_forced_draught']:
+        from .fse_bs_en_1991_1_2_external_flame_forced_draught import ExternalFlameForcedDraught as Report
+        keys = ('w_t', 'h_eq', 'A_f', 'A_t', 'q_fd', 'L_x', 'u', 'tau_F', 'T_0')
+        # `DW_ratio` is calculated but not used by `ExternalFlameForcedDraught`
+        kwargs = dict(is_windows_on_more_than_one_wall=False, is_central_core=False, W_1=np.nan, W_2=np.nan)
+    else:
+        from .fse_bs_en_1991_1_2_external_flame_no_forced_draught import ExternalFlameNoForcedDraught as Report
+        keys = (
+            'w_t', 'h_eq', 'A_f', 'A_t', 'q_fd', 'L_x', 'W_1', 'W_2', 'A_v1', 'L_c', 'W_c',
+            'is_windows_on_more_than_one_wall', 'is_central_core', 'is_wall_above_opening', 'd_ow', 'tau_F', 'rho_g',
+            'g', 'T_0',
+        )
+        kwargs = dict()
+
+    # user provided values are passed on, others are calculated again by the report with LaTeX
+    for k in keys + results['_overrides']:
+        v = results[k]
+        v = v[index] if isinstance(v, np.ndarray) else v
+        kwargs[k] = v.item() if isinstance(v, np.generic) else v
+    return Report(**kwargs)
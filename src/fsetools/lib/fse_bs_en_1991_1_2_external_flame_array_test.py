@@ -0,0 +1,96 @@
+import numpy as np
+
+from .fse_bs_en_1991_1_2_external_flame_array import *
+
+
+def _openings(n: int = 60, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    w_t = rng.uniform(1, 5, n)
+    h_eq = rng.uniform(1, 4, n)
+    W_1 = w_t + rng.uniform(1, 5, n)
+    W_2 = rng.uniform(3, 15, n)
+    return dict(
+        w_t=w_t, h_eq=h_eq, A_f=W_1 * W_2, A_t=2 * (W_1 * W_2 + (W_1 + W_2) * 3.), q_fd=rng.uniform(300, 900, n),
+        L_x=rng.uniform(0, 1, n), W_1=W_1, W_2=W_2, A_v1=w_t * h_eq * rng.uniform(0.5, 1, n), L_c=1., W_c=1.,
+    )
+
+
+def test_external_flame_no_forced_draught_array():
+    rng = np.random.default_rng(1)
+    kwargs = _openings()
+    n = len(kwargs['w_t'])
+    res = external_flame_no_forced_draught_array(
+        **kwargs,
+        is_windows_on_more_than_one_wall=rng.uniform(size=n) > 0.5,
+        is_central_core=rng.uniform(size=n) > 0.7,
+        is_wall_above_opening=rng.uniform(size=n) > 0.3,
+        d_ow=rng.uniform(1, 30, n),
+    )
+    assert all(res[k].shape == (n,) for k in ('DW_ratio', 'Q', 'T_f', 'L_L', 'L_H', 'L_f', 'T_w', 'T_z'))
+
+    # the same as `ExternalFlameNoForcedDraught` for each opening, all branches are covered
+    assert np.any(res['is_out_of_range']) and not np.all(res['is_out_of_range'])
+    for i in range(n):
+        try:
+            output_kwargs = external_flame_report(res, i).output_kwargs
+        except AssertionError:
+            # Clause B.4.1 (8) condition unsatisfied
+            assert res['is_out_of_range'][i] and np.isnan(res['T_w'][i])
+            continue
+        assert not res['is_out_of_range'][i]
+        for k in ('DW_ratio', 'Q', 'T_f', 'L_L', 'L_H', 'L_f', 'T_w', 'T_z'):
+            assert abs(res[k][i] - output_kwargs[k]) < 1e-9
+
+    # provided heat release rate
+    res = external_flame_no_forced_draught_array(w_t=1.82, h_eq=1.1, A_f=14.88, A_t=70.3, q_fd=870, L_x=0, Q=2.)
+    assert res['Q'] == 2. and np.isnan(res['DW_ratio'])
+
+    # missing Clause B.2 inputs are not silently reported as out of range
+    for kwargs_ in (
+            dict(),
+            dict(W_1=1.82),
+            dict(W_1=1.82, W_2=5.46, is_windows_on_more_than_one_wall=True),
+            dict(W_1=1.82, W_2=5.46, A_v1=1., is_central_core=np.array([False, True])),
+    ):
+        try:
+            external_flame_no_forced_draught_array(w_t=1.82, h_eq=1.1, A_f=14.88, A_t=70.3, q_fd=870, L_x=0, **kwargs_)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'`ValueError` is expected for missing Clause B.2 inputs {kwargs_}')
+    res = external_flame_no_forced_draught_array(w_t=1.82, h_eq=1.1, A_f=14.88, A_t=70.3, q_fd=870, L_x=0, DW_ratio=3.)
+    assert np.isfinite(res['Q'])
+
+
+def test_external_flame_forced_draught_array():
+    kwargs = _openings()
+    n = len(kwargs['w_t'])
+    res = external_flame_forced_draught_array(
+        **{k: kwargs[k] for k in ('w_t', 'h_eq', 'A_f', 'A_t', 'q_fd', 'L_x')}, u=np.linspace(2, 10, n)
+    )
+
+    # the same as `ExternalFlameForcedDraught` for each opening
+    for i in range(n):
+        try:
+            output_kwargs = external_flame_report(res, i).output_kwargs
+        except ValueError:
+            # Clause B.4.2 (7) condition unsatisfied
+            assert res['is_out_of_range'][i] and np.isnan(res['T_w'][i])
+            continue
+        assert not res['is_out_of_range'][i]
+        for k in ('Q', 'T_f', 'L_L', 'L_H', 'w_f', 'L_f', 'T_w', 'T_z'):
+            assert abs(res[k][i] - output_kwargs[k]) < 1e-9
+
+    # the same as `_test_1` in `fse_bs_en_1991_1_2_external_flame_forced_draught`
+    res = external_flame_forced_draught_array(
+        w_t=20.87, h_eq=3.3, A_f=85.8 * 25.1, A_t=2 * (85.8 * 25.1 + 25.1 * 3.3 + 3.3 * 85.8), q_fd=400, L_x=0.1, u=6,
+        Q=80,
+    )
+    assert abs(res['T_f'] - 1450.36828) < 1e-4
+    assert abs(res['T_w'] - 973.54189) < 1e-4
+    assert res['_overrides'] == ('Q',)
+
+
+if __name__ == '__main__':
+    test_external_flame_no_forced_draught_array()
+    test_external_flame_forced_draught_array()
@@ -1,3 +1,10 @@
+from typing import Union
+
+import numpy as np
+
+from ..libstd.pd_7974_1_2019 import eq_5_dimensionless_hrr
+
+
 def mean_flame_height_pd_7974(
         Q_dot_star: float,
         fuel_type: int,
@@ -48,3 +55,80 @@ def mean_flame_height_pd_7974(
         raise ValueError('Unknown fuel type.')
 
     return flame_height
+
+
+def mean_flame_height_pd_7974_array(
+        Q_dot_star: Union[float, np.ndarray],
+        fuel_type: int,
+        fire_diameter: Union[float, np.ndarray],
+) -> tuple:
+    """Calculates mean flame height in accordance with Clause 8.3.2 in PD 7974-1:2019, the same as
+    `mean_flame_height_pd_7974` but `Q_dot_star` and `fire_diameter` are broadcast together and the correlation is
+    selected per element. Elements outside the range of the correlation are flagged in the returned mask instead of
+    raising an error.
+
+    :param Q_dot_star:  dimensionless heat release rate, scalar or array.
+    :param fuel_type:   see `mean_flame_height_pd_7974`.
+    :param fire_diameter: in m, fire source diameter, scalar or array.
+    :return flame_height: in m, calculated mean fire height, NaN where out of range.
+    :return is_out_of_range: True where `Q_dot_star` is outside the range of the correlation, see Table 1 in
+        PD 7974-1:2019.
+    """
+    Q_dot_star, fire_diameter = np.broadcast_arrays(
+        np.asarray(Q_dot_star, dtype=float), np.asarray(fire_diameter, dtype=float)
+    )
+    flame_height = np.full(Q_dot_star.shape, np.nan)
+
+    if fuel_type == 0:
+        m_1 = Q_dot_star < 0.15
+        m_2 = (0.15 <= Q_dot_star) & (Q_dot_star < 1.0)
+        m_3 = (1.0 <= Q_dot_star) & (Q_dot_star < 40)
+        flame_height[m_1] = fire_diameter[m_1] * 40 * Q_dot_star[m_1] ** 2
+        flame_height[m_2] = fire_diameter[m_2] * 3.3 * Q_dot_star[m_2] ** (2 / 3)
+        flame_height[m_3] = fire_diameter[m_3] * 3.3 * Q_dot_star[m_3] ** (2 / 5)
+        is_out_of_range = ~(m_1 | m_2 | m_3)
+    elif fuel_type == 1:
+        m_1 = (0.75 < Q_dot_star) & (Q_dot_star < 8.8)
+        flame_height[m_1] = fire_diameter[m_1] * 3.4 * Q_dot_star[m_1] ** 0.61
+        is_out_of_range = ~m_1
+    elif fuel_type == 2:
+        m_1 = (0.12 < Q_dot_star) & (Q_dot_star < 12000)
+        flame_height[m_1] = fire_diameter[m_1] * (3.7 * Q_dot_star[m_1] ** (2 / 5) - 1.02)
+        is_out_of_range = ~m_1
+    else:
+        raise ValueError('Unknown fuel type.')
+
+    return flame_height[()], is_out_of_range[()]
+
+
+def mean_flame_height_hrr_pd_7974_array(
+        Q_dot_kW: Union[float, np.ndarray],
+        fuel_type: int,
+        fire_diameter: Union[float, np.ndarray],
+        rho_0: float = 1.2,
+        c_p_0_kJ_kg_K: float = 1.,
+        T_0: float = 293.15,
+        g: float = 9.81,
+) -> tuple:
+    """Calculates mean flame height from fire heat release rate, e.g. over a design fire time history, by chaining
+    `eq_5_dimensionless_hrr` in PD 7974-1:2019 and `mean_flame_height_pd_7974_array`.
+
+    :param Q_dot_kW: in kW, fire heat release rate, scalar or array.
+    :param fuel_type: see `mean_flame_height_pd_7974`.
+    :param fire_diameter: in m, fire source diameter, scalar or array.
+    :param rho_0: in kg/m^3, density of ambient air.
+    :param c_p_0_kJ_kg_K: in kJ/kg/K, specific heat capacity of ambient air.
+    :param T_0: in K, ambient air temperature.
+    :param g: in m/s^2, acceleration due to gravity.
+    :return flame_height: in m, calculated mean fire height, NaN where out of range.
+    :return is_out_of_range: True where the dimensionless heat release rate is outside the range of the correlation.
+    """
+    Q_dot_star = eq_5_dimensionless_hrr(
+        Q_dot_kW=np.asarray(Q_dot_kW, dtype=float),
+        rho_0=rho_0,
+        c_p_0_kJ_kg_K=c_p_0_kJ_kg_K,
+        T_0=T_0,
+        g=g,
+        D=np.asarray(fire_diameter, dtype=float),
+    )
+    return mean_flame_height_pd_7974_array(Q_dot_star=Q_dot_star, fuel_type=fuel_type, fire_diameter=fire_diameter)
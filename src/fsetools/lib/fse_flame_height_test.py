@@ -25,3 +25,39 @@ def test_mean_flame_height_pd_7974():
     assert abs(function_result_14 - pre_calc_result_14) < 0.0001
     assert abs(function_result_22 - pre_calc_result_22) < 0.0001
     assert abs(function_result_32 - pre_calc_result_32) < 0.0001
+
+
+def test_mean_flame_height_pd_7974_array():
+    import numpy as np
+
+    # out of range elements are flagged instead of raising
+    for fuel_type, Q_dot_star in (
+            (0, [0.14, 0.16, 0.5, 20, 50]),
+            (1, [0.5, 5, 8, 10]),
+            (2, [0.1, 0.5, 500, 20000]),
+    ):
+        flame_height, is_out_of_range = mean_flame_height_pd_7974_array(
+            Q_dot_star=np.array(Q_dot_star), fuel_type=fuel_type, fire_diameter=1.
+        )
+        for i, Q_dot_star_ in enumerate(Q_dot_star):
+            try:
+                flame_height_ = mean_flame_height_pd_7974(Q_dot_star_, fuel_type=fuel_type, fire_diameter=1.)
+            except AssertionError:
+                flame_height_ = np.nan
+            assert is_out_of_range[i] == np.isnan(flame_height_)
+            assert np.isclose(flame_height[i], flame_height_, equal_nan=True)
+
+    # a t-squared design fire, early small fires are flagged
+    t = np.arange(0, 600, 10.)
+    Q_dot_kW = 0.0117 * t ** 2
+    flame_height, is_out_of_range = mean_flame_height_hrr_pd_7974_array(Q_dot_kW, fuel_type=2, fire_diameter=1.)
+    Q_dot_star = eq_5_dimensionless_hrr(Q_dot_kW=Q_dot_kW, rho_0=1.2, c_p_0_kJ_kg_K=1., T_0=293.15, g=9.81, D=1.)
+    assert flame_height.shape == t.shape
+    assert np.array_equal(is_out_of_range, Q_dot_star <= 0.12)
+    assert np.all(np.diff(flame_height[~is_out_of_range]) > 0)
+    assert abs(flame_height[-1] - mean_flame_height_pd_7974(Q_dot_star[-1], fuel_type=2, fire_diameter=1.)) < 1e-9
+
+
+if __name__ == '__main__':
+    test_mean_flame_height_pd_7974()
+    test_mean_flame_height_pd_7974_array()
@@ -0,0 +1,125 @@
+from typing import Optional, Union
+
+import numpy as np
+
+from ..libstd.pd_7974_1_2019 import eq_10_virtual_origin
+from ..libstd.pd_7974_2_2019 import eq_62_A_v
+from ..libstd.pd_7974_2_2019 import eq_63_A_v
+
+
+def plume_mass_flow_heskestad(
+        Q_dot_kW: Union[float, np.ndarray],
+        Q_dot_c_kW: Union[float, np.ndarray],
+        fire_diameter: Union[float, np.ndarray],
+        z: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """Calculates axisymmetric plume mass flow rate at height `z` above the fire source, Heskestad correlation with the
+    virtual origin in Equation 10 of PD 7974-1:2019. All inputs are broadcast together.
+
+        m = 0.071 * Q_c^(1/3) * (z - z_0)^(5/3) + 0.0018 * Q_c,     z > L
+        m = 0.0056 * Q_c * z / L,                                  z <= L
+
+    where L = 0.235 * Q^(2/5) - 1.02 * D is the mean flame height.
+
+    :param Q_dot_kW: in kW, fire heat release rate.
+    :param Q_dot_c_kW: in kW, convective heat release rate.
+    :param fire_diameter: in m, fire diameter.
+    :param z: in m, height above the fire source, i.e. smoke layer base (clear layer) height.
+    :return m_dot_smoke: in kg/s, plume mass flow rate.
+    """
+    Q_dot_kW, Q_dot_c_kW, fire_diameter, z = np.broadcast_arrays(
+        *(np.asarray(i, dtype=float) for i in (Q_dot_kW, Q_dot_c_kW, fire_diameter, z))
+    )
+
+    z_0 = eq_10_virtual_origin(D=fire_diameter, Q_dot_kW=Q_dot_kW)
+    L = 0.235 * Q_dot_kW ** (2 / 5) - 1.02 * fire_diameter
+
+    is_far = z > L
+    m_dot_smoke = np.empty(Q_dot_kW.shape)
+    m_dot_smoke[is_far] = 0.071 * Q_dot_c_kW[is_far] ** (1 / 3) * (z[is_far] - z_0[is_far]) ** (5 / 3) + \
+                          0.0018 * Q_dot_c_kW[is_far]
+    m_dot_smoke[~is_far] = 0.0056 * Q_dot_c_kW[~is_far] * z[~is_far] / L[~is_far]
+
+    return m_dot_smoke[()]
+
+
+def smoke_vent_area_pd_7974_2(
+        Q_dot_kW: Union[float, np.ndarray],
+        fire_diameter: Union[float, np.ndarray],
+        ceiling_height: float,
+        layer_depth: Union[float, np.ndarray],
+        fire_conv_frac: float = 0.7,
+        C_v: float = 0.6,
+        A_in: Optional[float] = None,
+        C_in: float = 0.6,
+        T_0: float = 293.15,
+        c_p_0: float = 1.0,
+        rho_0: float = 1.2,
+        g: float = 9.81,
+) -> tuple:
+    """Calculates natural (outlet) smoke vent area required over design fires and smoke layer depths, by composing the
+    plume mass flow rate `plume_mass_flow_heskestad` into Equation 62 (or Equation 63 for very large inlet areas) of
+    PD 7974-2:2019.
+
+    The smoke layer base is at `ceiling_height - layer_depth` above the fire source and the depth of smoke below the
+    vent centreline is taken as the layer depth (i.e. roof vents). The smoke layer excess temperature is
+    Q_c / (m * c_p_0).
+
+    `Q_dot_kW` has time on its first axis, e.g. (n_time,) for a design fire or (n_time, n_fires) for many design fires,
+    and `fire_diameter` is broadcast with it. Results are calculated for every combination of `Q_dot_kW` and
+    `layer_depth` elements in one pass, i.e. with shape (*Q_dot_kW.shape, *layer_depth.shape).
+
+    :param Q_dot_kW: in kW, fire heat release rate, time on the first axis.
+    :param fire_diameter: in m, fire diameter, scalar or broadcastable with `Q_dot_kW`.
+    :param ceiling_height: in m, height of the ceiling above the fire source.
+    :param layer_depth: in m, smoke layer depth, scalar or array.
+    :param fire_conv_frac: convective fraction of the fire heat release rate.
+    :param C_v: coefficient of discharge of the outlet vent.
+    :param A_in: in m2, inlet vent area, Equation 63 (very large inlet area) is used if not provided.
+    :param C_in: coefficient of discharge of the inlet vent, only used with `A_in`.
+    :param T_0: in K, ambient air temperature.
+    :param c_p_0: in kJ/kg/K, ambient air specific heat at constant pressure.
+    :param rho_0: in kg/m3, ambient air density.
+    :param g: in m/s2, gravity acceleration.
+    :return A_v_envelope: in m2, maximum vent area required over time, shape (*Q_dot_kW.shape[1:], *layer_depth.shape).
+        NaN if `A_in` is too small to vent the smoke at any time.
+    :return A_v: in m2, vent area required, shape (*Q_dot_kW.shape, *layer_depth.shape), zero where there is no fire.
+    :return m_dot_smoke: in kg/s, smoke mass flow rate, the same shape as `A_v`.
+    """
+    Q_dot_kW = np.asarray(Q_dot_kW, dtype=float)
+    fire_diameter = np.broadcast_to(np.asarray(fire_diameter, dtype=float), Q_dot_kW.shape)
+    layer_depth = np.asarray(layer_depth, dtype=float)
+
+    # outer grid of design fire and layer depth elements
+    expand = (Ellipsis,) + (np.newaxis,) * layer_depth.ndim
+    Q_dot_kW, fire_diameter, layer_depth = np.broadcast_arrays(
+        Q_dot_kW[expand], fire_diameter[expand], layer_depth
+    )
+    Q_dot_c_kW = Q_dot_kW * fire_conv_frac
+
+    m_dot_smoke = np.zeros(Q_dot_kW.shape)
+    A_v = np.zeros(Q_dot_kW.shape)
+
+    # only where there is a fire, i.e. zero vent area is required for zero heat release rate
+    is_fire = Q_dot_c_kW > 0
+    m = plume_mass_flow_heskestad(
+        Q_dot_kW=Q_dot_kW[is_fire],
+        Q_dot_c_kW=Q_dot_c_kW[is_fire],
+        fire_diameter=fire_diameter[is_fire],
+        z=ceiling_height - layer_depth[is_fire],
+    )
+    m_dot_smoke[is_fire] = m
+    if A_in is None:
+        A_v[is_fire] = eq_63_A_v(
+            m_dot_smoke=m, T_0=T_0, c_p_0=c_p_0, rho_0=rho_0, C_v=C_v, g=g, d_v=layer_depth[is_fire],
+            Q_dot_c=Q_dot_c_kW[is_fire],
+        )
+    else:
+        theta_1 = Q_dot_c_kW[is_fire] / (m * c_p_0)
+        with np.errstate(invalid='ignore'):  # negative square root where `A_in` is too small
+            A_v[is_fire] = eq_62_A_v(
+                m_dot_smoke=m, T_0=T_0, T_1=T_0 + theta_1, rho_0=rho_0, C_v=C_v, g=g, d_v=layer_depth[is_fire],
+                theta_1=theta_1, A_in=A_in, C_in=C_in,
+            )
+
+    return np.amax(A_v, axis=0), A_v, m_dot_smoke
@@ -0,0 +1,56 @@
+import numpy as np
+
+from .fse_smoke_vent import *
+
+
+def test_plume_mass_flow_heskestad():
+    # within and above the flame, 1 MW fire with 1 m diameter
+    L = 0.235 * 1000 ** 0.4 - 1.02
+    m = plume_mass_flow_heskestad(Q_dot_kW=1000, Q_dot_c_kW=700, fire_diameter=1., z=np.array([1., 2.7, 5.]))
+    assert abs(m[0] - 0.0056 * 700 * 1. / L) < 1e-9
+    assert abs(m[2] - (0.071 * 700 ** (1 / 3) * (5 - (-1.02 + 0.083 * 1000 ** 0.4)) ** (5 / 3) + 0.0018 * 700)) < 1e-9
+
+    # continuous at the flame height
+    m = plume_mass_flow_heskestad(1000, 700, 1., np.array([L - 1e-9, L + 1e-9]))
+    assert abs(m[0] - m[1]) / m[0] < 0.05
+
+
+def test_smoke_vent_area_pd_7974_2():
+    # t-squared fire to 2.5 MW steady and layer depths
+    t = np.arange(0, 900, 30.)
+    Q_dot_kW = np.minimum(0.0469 * t ** 2, 2500)
+    D = 2 * (Q_dot_kW / 500 / np.pi) ** 0.5
+    layer_depth = np.array([1., 2., 3.])
+
+    A_v_envelope, A_v, m_dot_smoke = smoke_vent_area_pd_7974_2(
+        Q_dot_kW=Q_dot_kW, fire_diameter=D, ceiling_height=10., layer_depth=layer_depth
+    )
+    assert A_v.shape == m_dot_smoke.shape == (len(t), 3) and A_v_envelope.shape == (3,)
+    assert np.all(A_v[0] == 0) and np.all(A_v_envelope == np.amax(A_v, axis=0))
+
+    # the same as scalar Eq. 63
+    for i in range(1, len(t), 5):
+        for j, d in enumerate(layer_depth):
+            m = plume_mass_flow_heskestad(Q_dot_kW[i], 0.7 * Q_dot_kW[i], D[i], 10 - d)
+            assert abs(m - m_dot_smoke[i, j]) < 1e-9
+            A_v_ = eq_63_A_v(m_dot_smoke=m, T_0=293.15, c_p_0=1., rho_0=1.2, C_v=0.6, g=9.81, d_v=d,
+                             Q_dot_c=0.7 * Q_dot_kW[i])
+            assert abs(A_v_ - A_v[i, j]) < 1e-9
+
+    # many design fires, and a finite inlet area requires larger vents
+    A_v_envelope_2, A_v_2, _ = smoke_vent_area_pd_7974_2(
+        Q_dot_kW=np.stack([Q_dot_kW, Q_dot_kW * 0.5], axis=1), fire_diameter=D[:, np.newaxis], ceiling_height=10.,
+        layer_depth=layer_depth, A_in=100.,
+    )
+    assert A_v_2.shape == (len(t), 2, 3) and A_v_envelope_2.shape == (2, 3)
+    assert np.all(A_v_envelope_2[0] > A_v_envelope)
+    assert np.allclose(A_v_envelope_2[1], smoke_vent_area_pd_7974_2(Q_dot_kW * 0.5, D, 10., layer_depth, A_in=100.)[0])
+
+    # inlet area too small
+    A_v_envelope_3, _, _ = smoke_vent_area_pd_7974_2(Q_dot_kW, D, 10., layer_depth, A_in=1.)
+    assert np.all(np.isnan(A_v_envelope_3))
+
+
+if __name__ == '__main__':
+    test_plume_mass_flow_heskestad()
+    test_smoke_vent_area_pd_7974_2()
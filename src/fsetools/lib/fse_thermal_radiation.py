@@ -3,6 +3,8 @@
 import math
 from statistics import median
 
+import numpy as np
+
 from ..libstd.bre_br_187_2014 import eq_A4_phi_parallel_corner
 from ..libstd.bre_br_187_2014 import eq_A5_phi_perpendicular_corner
 
@@ -28,6 +30,100 @@ def phi_perpendicular_any_br187(W_m, H_m, w_m, h_m, S_m):
     return sum(phi)
 
 
+def _phi_parallel_corner_array(W_m, H_m, S_m):
+    # BR 187 eq. A4, zero where either side of the rectangle is zero
+    X, Y = W_m / S_m, H_m / S_m
+    return 1 / 2 / np.pi * (
+            X / np.sqrt(1 + X ** 2) * np.arctan(Y / np.sqrt(1 + X ** 2)) +
+            Y / np.sqrt(1 + Y ** 2) * np.arctan(X / np.sqrt(1 + Y ** 2))
+    )
+
+
+def _phi_perpendicular_corner_array(W_m, H_m, S_m):
+    # BR 187 eq. A5, zero where either side of the rectangle is zero
+    X, Y = W_m / S_m, H_m / S_m
+    return 1 / 2 / np.pi * (np.arctan(X) - np.arctan(X / np.sqrt(Y ** 2 + 1)) / np.sqrt(Y ** 2 + 1))
+
+
+def _phi_any_array(phi_corner, W_m, H_m, w_m, h_m, S_m) -> np.ndarray:
+    # superposition of the four corner rectangles between the receiver (w, h) and the emitter corners, a corner
+    # rectangle is added or subtracted depending on which side of the receiver the emitter corner lies, this covers all
+    # cases of `four_planes`, i.e. receiver at corner, on edge, within or outside the emitter.
+    W_m, H_m, w_m, h_m, S_m = np.broadcast_arrays(*[np.asarray(i, dtype=np.float64) for i in (W_m, H_m, w_m, h_m, S_m)])
+    is_front = S_m > 0
+    S_m = np.where(is_front, S_m, 1.)
+
+    def corner(a, b):
+        return np.sign(a) * np.sign(b) * phi_corner(np.abs(a), np.abs(b), S_m)
+
+    phi = corner(W_m - w_m, H_m - h_m) - corner(-w_m, H_m - h_m) - corner(W_m - w_m, -h_m) + corner(-w_m, -h_m)
+    return np.where(is_front, phi, 0.)
+
+
+def phi_parallel_any_br187_array(W_m, H_m, w_m, h_m, S_m) -> np.ndarray:
+    """Array version of `phi_parallel_any_br187`, all parameters are broadcast against each other.
+
+    :param W_m: in m, width of emitter panel.
+    :param H_m: in m, height of emitter panel.
+    :param w_m: in m, receiver horizontal location measured from the emitter left edge.
+    :param h_m: in m, receiver vertical location measured from the emitter bottom edge.
+    :param S_m: in m, separation distance from emitter surface to receiver.
+    :return phi: configuration factor, zero where `S_m` <= 0, i.e. receiver is on or behind the emitter plane.
+    """
+    return _phi_any_array(_phi_parallel_corner_array, W_m, H_m, w_m, h_m, S_m)
+
+
+def phi_perpendicular_any_br187_array(W_m, H_m, w_m, h_m, S_m) -> np.ndarray:
+    """Array version of `phi_perpendicular_any_br187`, all parameters are broadcast against each other.
+
+    :param W_m: in m, width of emitter panel.
+    :param H_m: in m, height of emitter panel.
+    :param w_m: in m, receiver horizontal location measured from the emitter left edge.
+    :param h_m: in m, receiver vertical location measured from the emitter bottom edge.
+    :param S_m: in m, separation distance from emitter surface to receiver.
+    :return phi: configuration factor, zero where `S_m` <= 0, i.e. receiver is on or behind the emitter plane.
+    """
+    return _phi_any_array(_phi_perpendicular_corner_array, W_m, H_m, w_m, h_m, S_m)
+
+
+def phi_matrix(phi_list: list) -> np.ndarray:
+    """Assembles the receivers x emitters configuration factor matrix.
+
+    :param phi_list: a list of configuration factor arrays, one for each emitter, of the same receiver grid.
+    :return phi_matrix: (n_receivers, n_emitters) array, receivers are the flattened (C order) receiver grid.
+    """
+    return np.column_stack([np.ravel(phi) for phi in phi_list])
+
+
+def heat_flux_time_series(phi_matrix: np.ndarray, heat_flux, chunk_size: int = None):
+    """Calculates receiver heat flux time series as a matrix product of the configuration factor matrix and emitter heat
+    flux time series, i.e. the geometry is solved once for all time steps.
+
+    :param phi_matrix: (n_receivers, n_emitters) configuration factor matrix, see `phi_matrix`.
+    :param heat_flux: (n_emitters, n_time) emitter heat flux array, or an iterable of (n_emitters, n_time_chunk) arrays
+        to stream emitter heat flux in time chunks.
+    :param chunk_size: optional, number of time steps per chunk, ignored when `heat_flux` is an iterable of chunks.
+    :return heat_flux: (n_receivers, n_time) receiver heat flux when `heat_flux` is an array and `chunk_size` is not
+        provided, otherwise a generator yielding (time slice, (n_receivers, n_time_chunk) receiver heat flux).
+    """
+    if isinstance(heat_flux, (np.ndarray, list, tuple)):
+        heat_flux = np.asarray(heat_flux, dtype=np.float64)
+        if chunk_size is None:
+            return phi_matrix @ heat_flux
+        chunks = (heat_flux[:, i:i + chunk_size] for i in range(0, heat_flux.shape[1], chunk_size))
+    else:
+        chunks = heat_flux
+
+    def time_series():
+        i = 0
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=np.float64)
+            yield slice(i, i + chunk.shape[1]), phi_matrix @ chunk
+            i += chunk.shape[1]
+
+    return time_series()
+
+
 def four_planes(W_m: float, H_m: float, w_m: float, h_m: float) -> tuple:
     """
     :param W_m:
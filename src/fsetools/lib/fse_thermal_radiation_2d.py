@@ -0,0 +1,1386 @@
+import functools
+import hashlib
+import inspect
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .fse_thermal_radiation import phi_matrix as _phi_matrix, heat_flux_time_series as _heat_flux_time_series
+from ..etc.transforms2d import rotation_meshgrid, angle_between_two_vectors_2d, points_in_polygons
+
+# shared memory blocks attached by each worker process, see `_init_worker`
+_WORKER_SHARED = dict()
+
+# configuration factor tables in emitter local coordinates, see `phi_table`
+_PHI_TABLES = dict()
+
+
+def update_emitter_list(emitter_list: list) -> tuple:
+    """Resolves emitter width and height and nudges zero length emitters for numerical stability.
+
+    :param emitter_list: a list of emitter dict objects, see `main`.
+    :return (z1, z2): the lowest and highest z-values of all emitters.
+    """
+    z2, z1 = -np.inf, np.inf
+
+    for emitter in emitter_list:
+        emitter.update(
+            dict(
+                # width of the rectangle
+                width=np.sum(
+                    (emitter['x'][0] - emitter['x'][1]) ** 2 +
+                    (emitter['y'][0] - emitter['y'][1]) ** 2
+                ) ** 0.5,
+                height=abs(emitter['z'][0] - emitter['z'][1]),
+            )
+        )
+
+        if emitter['x'][0] == emitter['x'][1]:
+            emitter['x'] = (emitter['x'][0], emitter['x'][1] + 1e-9)
+        if emitter['y'][0] == emitter['y'][1]:
+            emitter['y'] = (emitter['y'][0], emitter['y'][1] + 1e-9)
+
+        if min(emitter['z']) < z1:
+            z1 = min(emitter['z'])
+        if max(emitter['z']) > z2:
+            z2 = max(emitter['z'])
+
+    return z1, z2
+
+
+def solver_domain_meshgrid(params_dict: dict) -> tuple:
+    """Returns the receiver mesh grid (xx, yy) described by `solver_domain` and `solver_delta`."""
+    x1, x2 = params_dict['solver_domain']['x']
+    y1, y2 = params_dict['solver_domain']['y']
+    delta = params_dict['solver_delta']
+    xx, yy = np.arange(x1, x2 + 0.5 * delta, delta), np.arange(y1, y2 + 0.5 * delta, delta)
+    return np.meshgrid(xx, yy)
+
+
+def solver_domain_zz(params_dict: dict, z1: float, z2: float, delta_z: float = None):
+    """Returns the receiver z-levels described by `solver_domain`.
+
+    :param params_dict: see `main`.
+    :param z1: the lowest emitter z-value, used when `solver_domain:z` is not provided.
+    :param z2: the highest emitter z-value, used when `solver_domain:z` is not provided.
+    :param delta_z: z-level spacing when `solver_domain:z` is a range, `solver_delta` is used when not provided.
+    :return zz: z-levels.
+    """
+    delta = params_dict['solver_delta']
+    if delta_z is None:
+        delta_z = delta
+
+    if params_dict['solver_domain']['z']:
+        if len(params_dict['solver_domain']['z']) == 2:
+            if params_dict['solver_domain']['z'][0] == params_dict['solver_domain']['z'][1]:
+                zz = [params_dict['solver_domain']['z'][0]]
+            else:
+                zz = np.arange(params_dict['solver_domain']['z'][0], params_dict['solver_domain']['z'][1] + 0.5 * delta_z,
+                               delta_z)
+        elif len(params_dict['solver_domain']['z']) == 1:
+            zz = params_dict['solver_domain']['z']
+        else:
+            raise ValueError('solver_domain:z length can only be 1 or 2.')
+    else:
+        zz = np.arange(z1, z2 + 0.5 * delta, delta)
+
+    return zz
+
+
+def emitter_geometry_hash(
+        emitter: dict,
+        params_dict: dict,
+        zz: typing.Union[list, tuple, np.ndarray],
+        solver_phi_2d: typing.Callable,
+) -> str:
+    """Returns a hash of everything the configuration factor of an emitter depends on, i.e. emitter geometry (x, y, z),
+    solver domain, solver delta, z-levels, the solver itself and `solver_dtype` the stored configuration factors are
+    cast to. Heat flux is excluded as it only scales the results, unless `solver_cull_tolerance` is provided in which
+    case which receivers are solved depends on the heat flux.
+
+    :param emitter: an emitter dict object, see `main`.
+    :param params_dict: see `main`.
+    :param zz: receiver z-levels.
+    :param solver_phi_2d: configuration factor solver.
+    :return: hex digest.
+    """
+    geometry = (
+        _solver_name(solver_phi_2d),
+        tuple(float(i) for i in emitter['x']),
+        tuple(float(i) for i in emitter['y']),
+        tuple(float(i) for i in emitter['z']),
+        tuple(float(i) for i in params_dict['solver_domain']['x']),
+        tuple(float(i) for i in params_dict['solver_domain']['y']),
+        float(params_dict['solver_delta']),
+        tuple(f'{z:.3f}' for z in zz),
+        np.dtype(params_dict.get('solver_dtype', 'float64')).str,
+    )
+    if 'solver_cull_tolerance' in params_dict and params_dict['solver_cull_tolerance']:
+        geometry += (
+            float(params_dict['solver_cull_tolerance']),
+            int(params_dict.get('solver_cull_tile', 16)),
+            abs(float(emitter['heat_flux'])),
+        )
+    if 'solver_mask' in params_dict and params_dict['solver_mask']:
+        geometry += (
+            tuple(tuple(tuple(float(i) for i in xy) for xy in polygon) for polygon in params_dict['solver_mask']),
+        )
+    return hashlib.sha1(repr(geometry).encode()).hexdigest()
+
+
+def _solver_name(solver_phi_2d: typing.Callable) -> str:
+    if isinstance(solver_phi_2d, functools.partial):
+        keywords = sorted(
+            (k, _solver_name(v) if callable(v) else v) for k, v in solver_phi_2d.keywords.items()
+        )
+        return f'{_solver_name(solver_phi_2d.func)}{solver_phi_2d.args}{keywords}'
+    return f'{solver_phi_2d.__module__}.{solver_phi_2d.__qualname__}'
+
+
+def emitter_solver_phi_2d(emitter: dict, solver_phi_2d: typing.Callable) -> typing.Callable:
+    """Returns the configuration factor solver of an emitter, emitters of different types can be mixed in one
+    `emitter_list`.
+
+    :param emitter: an emitter dict object, with optional `type`, one of 'parallel', 'perpendicular' or 'angled', and
+        `theta` the angle between the receiver and emitter planes in radians, required by 'angled'.
+    :param solver_phi_2d: the default solver for emitters without `type`.
+    :return solver_phi_2d: the emitter solver, `theta` is bound when accepted by the solver.
+    """
+    if 'type' in emitter and emitter['type']:
+        if emitter['type'] == 'parallel':
+            from .fse_thermal_radiation_2d_parallel import solver_phi_2d
+        elif emitter['type'] == 'perpendicular':
+            from .fse_thermal_radiation_2d_perpendicular import solver_phi_2d
+        elif emitter['type'] == 'angled':
+            from .fse_thermal_radiation_2d_angled import solver_phi_2d
+        else:
+            raise ValueError(f'Unknown emitter type {emitter["type"]}.')
+
+    if 'theta' in inspect.signature(solver_phi_2d).parameters:
+        solver_phi_2d = functools.partial(solver_phi_2d, theta=float(emitter['theta']))
+
+    return solver_phi_2d
+
+
+def emitter_local_coordinates(
+        emitter_xy1: typing.Union[list, tuple, np.ndarray],
+        emitter_xy2: typing.Union[list, tuple, np.ndarray],
+        xx: np.ndarray,
+        yy: np.ndarray,
+) -> tuple:
+    """Transforms receiver points into the emitter local frame, i.e. rotated so that the emitter is aligned with the
+    x-axis from `emitter_xy1` to `emitter_xy2`, the same as `solver_phi_2d` in the parallel and perpendicular modules.
+
+    :param emitter_xy1: the first point of the emitter line segment on z-plane.
+    :param emitter_xy2: the second point of the emitter line segment on z-plane.
+    :param xx: receiver mesh grid x-values.
+    :param yy: receiver mesh grid y-values.
+    :return (uu, ss): receiver horizontal offset from the emitter centre, positive towards `emitter_xy2`, and distance
+        to the emitter surface, points with ss <= 0 are behind the emitter.
+    """
+    theta_in_radians = angle_between_two_vectors_2d(v1=np.subtract(emitter_xy2, emitter_xy1), v2=(1, 0))
+    xx, yy = rotation_meshgrid(xx, yy, theta_in_radians)
+    emitter_x, emitter_y = rotation_meshgrid(
+        np.array((emitter_xy1[0], emitter_xy2[0])), np.array((emitter_xy1[1], emitter_xy2[1])), theta_in_radians
+    )
+    return xx - np.average(emitter_x), yy - emitter_y[0, 0]
+
+
+def _build_phi_table(solver_phi_2d: typing.Callable, width: float, height: float, z: float, delta: float,
+                     u_max: float, s_max: float) -> dict:
+    n_u = int(np.ceil(u_max / delta))
+    uu, ss = np.meshgrid(
+        np.arange(-n_u, n_u + 1) * delta,
+        np.arange(0, int(np.ceil(s_max / delta)) + 1) * delta,
+    )
+    # the first row holds the limit on the emitter surface (s -> 0+), the solver itself returns 0 at s = 0
+    ss_ = ss.copy()
+    ss_[0, :] = delta * 1e-6
+    phi = solver_phi_2d(
+        emitter_xy1=(-0.5 * width, 0), emitter_xy2=(0.5 * width, 0), emitter_z=(0, height), xx=uu, yy=ss_, z=z
+    )
+
+    # second differences approximate h^2 * d2phi/du2 and h^2 * d2phi/ds2 at each node, edges take their neighbours
+    d2u, d2s = np.zeros_like(phi), np.zeros_like(phi)
+    if phi.shape[1] > 2:
+        d2u[:, 1:-1] = np.abs(phi[:, :-2] - 2 * phi[:, 1:-1] + phi[:, 2:])
+        d2u[:, 0], d2u[:, -1] = d2u[:, 1], d2u[:, -2]
+    if phi.shape[0] > 2:
+        d2s[1:-1, :] = np.abs(phi[:-2, :] - 2 * phi[1:-1, :] + phi[2:, :])
+        d2s[0, :], d2s[-1, :] = d2s[1, :], d2s[-2, :]
+    # bilinear interpolation error within a cell: |e| <= (h^2 max|phi_uu| + h^2 max|phi_ss|) / 8, the nodal second
+    # differences underestimate the maximum where the curvature varies within a cell, thus a safety factor of 2
+    d2u = np.maximum.reduce([d2u[:-1, :-1], d2u[1:, :-1], d2u[:-1, 1:], d2u[1:, 1:]])
+    d2s = np.maximum.reduce([d2s[:-1, :-1], d2s[1:, :-1], d2s[:-1, 1:], d2s[1:, 1:]])
+    error = 2 * (d2u + d2s) / 8
+
+    # phi has a slope discontinuity across the emitter edge lines (u = +/- width / 2) and at the emitter surface
+    # (s -> 0), and steep curvature close to the surface, where the above is not a bound, receivers in cells touching
+    # the edge lines or within two cells of the surface are solved exactly
+    u = uu[0, :]
+    is_exact = np.zeros((max(phi.shape[0] - 1, 0), max(phi.shape[1] - 1, 0)), dtype=bool)
+    is_exact[:2, :] = True
+    for u_edge in (-0.5 * width, 0.5 * width):
+        is_exact[:, (u[:-1] <= u_edge) & (u_edge <= u[1:])] = True
+
+    return dict(
+        phi=phi,
+        error=np.where(is_exact, 0., error),
+        is_exact=is_exact,
+        delta=delta,
+        u_max=uu[0, -1],
+        s_max=ss[-1, 0],
+    )
+
+
+def phi_table(
+        solver_phi_2d: typing.Callable,
+        width: float,
+        height: float,
+        z: float,
+        delta: float,
+        u_max: float,
+        s_max: float,
+) -> dict:
+    """Returns the cached configuration factor table of an emitter size in its local frame.
+
+    Configuration factor of an emitter depends only on the receiver offset in the emitter local frame, i.e. (u, s) see
+    `emitter_local_coordinates`, for a given emitter width, height and receiver z-level. Tables are computed once by
+    `solver_phi_2d` over a u-s grid with spacing `delta` and kept in a module level cache keyed by (solver, width,
+    height, z, delta). A cached table is rebuilt when a larger extent is requested.
+
+    :param solver_phi_2d: configuration factor solver, i.e. `solver_phi_2d` in the parallel or perpendicular module.
+    :param width: emitter width.
+    :param height: emitter height.
+    :param z: receiver z-level.
+    :param delta: table resolution.
+    :param u_max: the largest absolute receiver offset from the emitter centre to be covered by the table, the table
+        covers both sides of the emitter centre as the angled emitter is not symmetrical.
+    :param s_max: the largest receiver distance to the emitter surface to be covered by the table.
+    :return table: a dict object, `phi` the tabulated configuration factors, `error` the interpolation error bound of
+        each table cell, `is_exact` cells where receivers are solved exactly (zero `error`), `delta`, `u_max` and
+        `s_max`.
+    """
+    key = (_solver_name(solver_phi_2d), round(float(width), 6), round(float(height), 6), f'{z:.3f}', float(delta))
+    table = _PHI_TABLES.get(key)
+    if table is None or table['u_max'] < u_max or table['s_max'] < s_max:
+        if table is not None:
+            u_max, s_max = max(u_max, table['u_max']), max(s_max, table['s_max'])
+        table = _build_phi_table(solver_phi_2d, width, height, z, delta, u_max, s_max)
+        _PHI_TABLES[key] = table
+    return table
+
+
+def clear_phi_tables():
+    """Empties the configuration factor table cache, see `phi_table`."""
+    _PHI_TABLES.clear()
+
+
+def _phi_table_lookup(
+        emitter_xy1: typing.Union[list, tuple, np.ndarray],
+        emitter_xy2: typing.Union[list, tuple, np.ndarray],
+        emitter_z: typing.Union[list, tuple, np.ndarray],
+        xx: np.ndarray,
+        yy: np.ndarray,
+        z: float,
+        solver_phi_2d: typing.Callable,
+        delta: float,
+) -> tuple:
+    uu, ss = emitter_local_coordinates(emitter_xy1, emitter_xy2, xx, yy)
+    table = phi_table(
+        solver_phi_2d=solver_phi_2d,
+        width=sum(np.square(np.subtract(emitter_xy1, emitter_xy2))) ** 0.5,
+        height=abs(emitter_z[0] - emitter_z[1]),
+        z=z,
+        delta=delta,
+        u_max=np.amax(np.abs(uu)),
+        s_max=np.amax(ss),
+    )
+    phi = table['phi']
+    ss = np.maximum(ss, 0)
+    uu = np.maximum(uu + table['u_max'], 0)
+    i = np.minimum((ss / delta).astype(int), max(phi.shape[0] - 2, 0))
+    j = np.minimum((uu / delta).astype(int), max(phi.shape[1] - 2, 0))
+    ti = np.clip(ss / delta - i, 0, 1)
+    tj = np.clip(uu / delta - j, 0, 1)
+    i_, j_ = np.minimum(i + 1, phi.shape[0] - 1), np.minimum(j + 1, phi.shape[1] - 1)
+    return table, ss > 0, i, j, ti, tj, i_, j_
+
+
+def solver_phi_2d_table(
+        emitter_xy1: typing.Union[list, tuple, np.ndarray],
+        emitter_xy2: typing.Union[list, tuple, np.ndarray],
+        emitter_z: typing.Union[list, tuple, np.ndarray],
+        xx: np.ndarray,
+        yy: np.ndarray,
+        z: float,
+        solver_phi_2d: typing.Callable,
+        delta: float,
+) -> np.ndarray:
+    """Configuration factor solver with the same signature as `solver_phi_2d`, resamples the cached table of the
+    emitter size (see `phi_table`) at the receiver points transformed into the emitter local frame, by bilinear
+    interpolation. Points behind the emitter are zero, the same as `solver_phi_2d`.
+
+    The interpolation error of each receiver point is bounded by (h^2 max|phi_uu| + h^2 max|phi_ss|) / 8 over the table
+    cell containing the point, h being `delta`, where the maximum curvature is taken as twice the largest second
+    difference of the cell nodes, returned by `solver_phi_2d_table_error`. phi is not smooth across the emitter edge
+    lines and at the emitter surface, receivers in table cells touching the edge lines or within 2 * `delta` of the
+    emitter surface are solved exactly by `solver_phi_2d` and have zero error. Angled emitters also have a slope
+    discontinuity where receivers stop seeing the emitter, phi is close to zero there and the bound may be exceeded by
+    a negligible amount.
+
+    :param emitter_xy1: the first point of the emitter line segment on z-plane.
+    :param emitter_xy2: the second point of the emitter line segment on z-plane.
+    :param emitter_z: the bottom and top of the emitter.
+    :param xx: receiver mesh grid x-values.
+    :param yy: receiver mesh grid y-values.
+    :param z: receiver z-level.
+    :param solver_phi_2d: configuration factor solver used to build the table.
+    :param delta: table resolution.
+    :return phi: configuration factors at the receiver points.
+    """
+    table, mask, i, j, ti, tj, i_, j_ = _phi_table_lookup(
+        emitter_xy1, emitter_xy2, emitter_z, xx, yy, z, solver_phi_2d, delta
+    )
+    phi = table['phi']
+    phi = (
+            (1 - ti) * ((1 - tj) * phi[i, j] + tj * phi[i, j_]) +
+            ti * ((1 - tj) * phi[i_, j] + tj * phi[i_, j_])
+    )
+    phi = np.where(mask, phi, 0.)
+
+    # receivers in cells touching the emitter edges or surface, see `_build_phi_table`
+    is_exact = table['is_exact']
+    if is_exact.size > 0:
+        is_exact = mask & is_exact[np.minimum(i, is_exact.shape[0] - 1), np.minimum(j, is_exact.shape[1] - 1)]
+        if np.any(is_exact):
+            phi[is_exact] = np.reshape(solver_phi_2d(
+                emitter_xy1=emitter_xy1, emitter_xy2=emitter_xy2, emitter_z=emitter_z,
+                xx=np.asarray(xx, dtype=float)[is_exact], yy=np.asarray(yy, dtype=float)[is_exact], z=z,
+            ), -1)
+    return phi
+
+
+def solver_phi_2d_table_error(
+        emitter_xy1: typing.Union[list, tuple, np.ndarray],
+        emitter_xy2: typing.Union[list, tuple, np.ndarray],
+        emitter_z: typing.Union[list, tuple, np.ndarray],
+        xx: np.ndarray,
+        yy: np.ndarray,
+        z: float,
+        solver_phi_2d: typing.Callable,
+        delta: float,
+) -> np.ndarray:
+    """Returns the interpolation error bound of `solver_phi_2d_table` at the receiver points, zero where receivers are
+    solved exactly, parameters are the same as `solver_phi_2d_table`."""
+    table, mask, i, j, *_ = _phi_table_lookup(emitter_xy1, emitter_xy2, emitter_z, xx, yy, z, solver_phi_2d, delta)
+    error = table['error']
+    if error.size == 0:
+        return np.zeros_like(np.asarray(xx, dtype=np.float64))
+    return np.where(mask, error[np.minimum(i, error.shape[0] - 1), np.minimum(j, error.shape[1] - 1)], 0.)
+
+
+def _bbox_distance(bbox_1: np.ndarray, bbox_2: np.ndarray) -> np.ndarray:
+    # plan distance between axis aligned boxes (x1, y1, x2, y2), zero where overlapping
+    dx = np.maximum(0, np.maximum(bbox_1[..., 0] - bbox_2[..., 2], bbox_2[..., 0] - bbox_1[..., 2]))
+    dy = np.maximum(0, np.maximum(bbox_1[..., 1] - bbox_2[..., 3], bbox_2[..., 1] - bbox_1[..., 3]))
+    return np.sqrt(dx ** 2 + dy ** 2)
+
+
+def cull_emitters(emitter_list: list, xx: np.ndarray, yy: np.ndarray, tolerance: float, tile_size: int = 16) -> list:
+    """Splits the receiver mesh grid into tiles and finds emitters that can contribute more than `tolerance` to each
+    tile, all other emitters are skipped and their contribution is bounded.
+
+    Configuration factor of an emitter of area A to any receiver at distance d or further is bounded by min(1, A/(pi
+    d^2)), where d is taken as the plan distance between the emitter and tile bounding boxes, i.e. not greater than the
+    true distance. Emitters are indexed by a uniform grid of their bounding boxes with cells of the tile size. For each
+    tile, only emitters in the grid cells within R = max(sqrt(|q| A / (pi tolerance))) of the tile are checked, emitters
+    beyond are bounded together by (sum(|q| A) - sum(|q| A) of checked emitters) / (pi R^2).
+
+    :param emitter_list: a list of emitter dict objects, see `main`, `update_emitter_list` should have been applied.
+    :param xx: receiver mesh grid x-values.
+    :param yy: receiver mesh grid y-values.
+    :param tolerance: heat flux below which an emitter is skipped.
+    :param tile_size: number of receiver cells along each side of a tile.
+    :return tiles: a list of (tile slice, indices of emitters to be solved, bound of skipped heat flux).
+    """
+    n_y, n_x = np.shape(xx)
+    bbox = np.array([
+        (min(emitter['x']), min(emitter['y']), max(emitter['x']), max(emitter['y'])) for emitter in emitter_list
+    ], dtype=np.float64).reshape(-1, 4)
+    qa = np.array([abs(emitter['heat_flux']) * emitter['width'] * emitter['height'] for emitter in emitter_list])
+    q = np.array([abs(emitter['heat_flux']) for emitter in emitter_list])
+    radius = np.sqrt(np.amax(qa, initial=0) / np.pi / tolerance)
+
+    # uniform grid index of emitter bounding boxes
+    x0, y0 = np.amin(xx), np.amin(yy)
+    cell = max(
+        tile_size * (np.amax(xx) - x0) / max(n_x - 1, 1), tile_size * (np.amax(yy) - y0) / max(n_y - 1, 1), 1.
+    )
+    index = dict()
+    for i, (x1, y1, x2, y2) in enumerate(bbox):
+        for ci in range(int(np.floor((x1 - x0) / cell)), int(np.floor((x2 - x0) / cell)) + 1):
+            for cj in range(int(np.floor((y1 - y0) / cell)), int(np.floor((y2 - y0) / cell)) + 1):
+                index.setdefault((ci, cj), list()).append(i)
+    # extent of the index, queries are clipped to it
+    ci_min, cj_min = np.amin(list(index), axis=0) if index else (0, 0)
+    ci_max, cj_max = np.amax(list(index), axis=0) if index else (-1, -1)
+
+    tiles = list()
+    for j0 in range(0, n_y, tile_size):
+        for i0 in range(0, n_x, tile_size):
+            tile = (slice(j0, j0 + tile_size), slice(i0, i0 + tile_size))
+            tile_bbox = np.array([np.amin(xx[tile]), np.amin(yy[tile]), np.amax(xx[tile]), np.amax(yy[tile])])
+
+            # candidates from index cells within `radius`
+            near = set()
+            for ci in range(max(int(np.floor((tile_bbox[0] - radius - x0) / cell)), ci_min),
+                            min(int(np.floor((tile_bbox[2] + radius - x0) / cell)), ci_max) + 1):
+                for cj in range(max(int(np.floor((tile_bbox[1] - radius - y0) / cell)), cj_min),
+                                min(int(np.floor((tile_bbox[3] + radius - y0) / cell)), cj_max) + 1):
+                    near.update(index.get((ci, cj), ()))
+            near = np.array(sorted(near), dtype=int)
+
+            with np.errstate(divide='ignore'):
+                bound = q[near] * np.minimum(1, qa[near] / np.maximum(q[near], 1e-300) / np.pi / _bbox_distance(
+                    tile_bbox, bbox[near]) ** 2)
+            is_solved = bound >= tolerance
+            error = np.sum(bound[~is_solved])
+            if radius > 0:
+                error += max(np.sum(qa) - np.sum(qa[near]), 0) / np.pi / radius ** 2
+
+            tiles.append((tile, near[is_solved], error))
+    return tiles
+
+
+def _emitter_solver_kwargs(emitter: dict) -> dict:
+    return dict(
+        emitter_xy1=(emitter['x'][0], emitter['y'][0]),
+        emitter_xy2=(emitter['x'][1], emitter['y'][1]),
+        emitter_z=emitter['z'],
+    )
+
+
+def _init_worker(shm_name_xy: str, shm_name_phi: str, shape_xy: tuple, shape_phi: tuple):
+    # attach shared memory blocks once per worker process, kept alive in `_WORKER_SHARED`
+    shm_xy = shared_memory.SharedMemory(name=shm_name_xy)
+    shm_phi = shared_memory.SharedMemory(name=shm_name_phi)
+    _WORKER_SHARED.update(
+        shm_xy=shm_xy,
+        shm_phi=shm_phi,
+        xy=np.ndarray(shape_xy, dtype=np.float64, buffer=shm_xy.buf),
+        phi=np.ndarray(shape_phi, dtype=np.float64, buffer=shm_phi.buf),
+    )
+
+
+def _solver_phi_2d_worker(solver_phi_2d: typing.Callable, solver_kwargs: dict, z: float, i_z: int, i_emitter: int):
+    xy, phi = _WORKER_SHARED['xy'], _WORKER_SHARED['phi']
+    phi[i_z, i_emitter] = solver_phi_2d(xx=xy[0], yy=xy[1], z=z, **solver_kwargs)
+    return i_z, i_emitter
+
+
+def solve_phi_dict(
+        emitter_list: list,
+        xx: np.ndarray,
+        yy: np.ndarray,
+        zz: typing.Union[list, tuple, np.ndarray],
+        solver_phi_2d: typing.Union[typing.Callable, list],
+        n_processes: int = 1,
+        QtCore_ProgressSignal=None,
+        tiles: list = None,
+):
+    """Calculates configuration factor of every emitter at every z-level and stores them in `emitter['phi_dict']`.
+
+    Each (emitter, z) pair is independent. When `n_processes` is greater than 1, the receiver mesh grid is placed in
+    shared memory and the pairs are farmed out to a process pool, workers write directly into a shared result block
+    which is copied to `phi_dict` once all pairs are solved. Results are identical to the serial path.
+
+    :param emitter_list: a list of emitter dict objects, see `main`.
+    :param xx: receiver mesh grid x-values.
+    :param yy: receiver mesh grid y-values.
+    :param zz: receiver z-levels.
+    :param solver_phi_2d: configuration factor solver, i.e. `solver_phi_2d` in the parallel or perpendicular module, or a
+        list of solvers, one for each emitter.
+    :param n_processes: number of worker processes, `None` to use all available CPUs, 1 to solve in serial.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :param tiles: optional, a list of (tile slice, indices of `emitter_list`) to only solve the listed emitters within
+        each receiver tile, configuration factors are zero elsewhere, see `cull_emitters`. A tile may also be a pair of
+        (1, n) row and column index arrays, see `mask_tiles`. Solved in serial.
+    """
+    n_calc = len(zz) * len(emitter_list)
+    n_count = 0
+
+    if callable(solver_phi_2d):
+        solver_phi_2d = [solver_phi_2d] * len(emitter_list)
+
+    if tiles is not None:
+        for emitter in emitter_list:
+            emitter['phi_dict'] = {f'{z:.3f}': np.zeros_like(xx, dtype=np.float64) for z in zz}
+        n_calc = max(len(tiles), 1)
+        for tile, indices in tiles:
+            if QtCore_ProgressSignal:
+                QtCore_ProgressSignal.emit(n_count / n_calc * 100)
+            for i in indices:
+                for z in zz:
+                    emitter_list[i]['phi_dict'][f'{z:.3f}'][tile] = solver_phi_2d[i](
+                        xx=xx[tile], yy=yy[tile], z=z, **_emitter_solver_kwargs(emitter_list[i])
+                    )
+            n_count += 1
+        return
+
+    if n_processes is None:
+        n_processes = os.cpu_count()
+
+    if n_processes <= 1 or n_calc <= 1:
+        for z in zz:
+            for emitter, solver in zip(emitter_list, solver_phi_2d):
+                if QtCore_ProgressSignal:
+                    QtCore_ProgressSignal.emit(n_count / n_calc * 100)
+                phi_ = solver(xx=xx, yy=yy, z=z, **_emitter_solver_kwargs(emitter))
+                if 'phi_dict' in emitter:
+                    emitter['phi_dict'][f'{z:.3f}'] = phi_
+                else:
+                    emitter['phi_dict'] = {f'{z:.3f}': phi_}
+                n_count += 1
+        return
+
+    shape_xy = (2, *np.shape(xx))
+    shape_phi = (len(zz), len(emitter_list), *np.shape(xx))
+    shm_xy = shared_memory.SharedMemory(create=True, size=int(np.prod(shape_xy)) * 8)
+    shm_phi = shared_memory.SharedMemory(create=True, size=int(np.prod(shape_phi)) * 8)
+    try:
+        xy = np.ndarray(shape_xy, dtype=np.float64, buffer=shm_xy.buf)
+        xy[0], xy[1] = xx, yy
+        phi = np.ndarray(shape_phi, dtype=np.float64, buffer=shm_phi.buf)
+
+        with ProcessPoolExecutor(
+                max_workers=min(n_processes, n_calc),
+                initializer=_init_worker,
+                initargs=(shm_xy.name, shm_phi.name, shape_xy, shape_phi)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _solver_phi_2d_worker, solver_phi_2d[i_emitter], _emitter_solver_kwargs(emitter), z, i_z, i_emitter
+                )
+                for i_z, z in enumerate(zz)
+                for i_emitter, emitter in enumerate(emitter_list)
+            ]
+            if QtCore_ProgressSignal:
+                QtCore_ProgressSignal.emit(0)
+            for future in as_completed(futures):
+                future.result()
+                n_count += 1
+                if QtCore_ProgressSignal:
+                    QtCore_ProgressSignal.emit(n_count / n_calc * 100)
+
+        # copy results out of the shared block before it is released
+        for i_z, z in enumerate(zz):
+            for i_emitter, emitter in enumerate(emitter_list):
+                if 'phi_dict' in emitter:
+                    emitter['phi_dict'][f'{z:.3f}'] = phi[i_z, i_emitter].copy()
+                else:
+                    emitter['phi_dict'] = {f'{z:.3f}': phi[i_z, i_emitter].copy()}
+        del xy, phi
+    finally:
+        shm_xy.close()
+        shm_xy.unlink()
+        shm_phi.close()
+        shm_phi.unlink()
+
+
+def mask_tiles(tiles: list, is_masked: np.ndarray) -> list:
+    """Converts tiles to (1, n) row and column index arrays of receivers that are not masked, tiles with all receivers
+    masked are dropped.
+
+    :param tiles: a list of (tile slice, indices of `emitter_list`), see `solve_phi_dict`.
+    :param is_masked: boolean array of the receiver mesh grid shape, True where receivers are excluded.
+    :return tiles: a list of ((rows, columns), indices of `emitter_list`).
+    """
+    jj, ii = np.indices(np.shape(is_masked))
+    tiles_ = list()
+    for tile, indices in tiles:
+        is_solved = ~is_masked[tile]
+        if np.any(is_solved):
+            tiles_.append(((jj[tile][is_solved][np.newaxis, :], ii[tile][is_solved][np.newaxis, :]), indices))
+    return tiles_
+
+
+def solve_heat_flux_max(
+        emitter_list: list,
+        xx: np.ndarray,
+        yy: np.ndarray,
+        zz: typing.Union[list, tuple, np.ndarray],
+        solver_phi_2d: list,
+        tiles: list = None,
+        dtype=np.float64,
+        QtCore_ProgressSignal=None,
+) -> tuple:
+    """Calculates the maximum resultant heat flux over all z-levels without storing configuration factors, only the
+    summed heat flux of the current z-level and the running maximum are kept in memory.
+
+    :param emitter_list: a list of emitter dict objects, see `main`.
+    :param xx: receiver mesh grid x-values.
+    :param yy: receiver mesh grid y-values.
+    :param zz: receiver z-levels.
+    :param solver_phi_2d: a list of configuration factor solvers, one for each emitter.
+    :param tiles: optional, a list of (tile slice, indices of `emitter_list`), see `solve_phi_dict`.
+    :param dtype: data type of the heat flux arrays.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :return heat_flux: maximum resultant heat flux over all z-levels.
+    :return heat_flux_z: z-level of the maximum resultant heat flux.
+    """
+    if tiles is None:
+        tiles = [((slice(None), slice(None)), range(len(emitter_list)))]
+
+    heat_flux = np.full(np.shape(xx), -np.inf, dtype=dtype)
+    heat_flux_z = np.zeros(np.shape(xx), dtype=dtype)
+    for i_z, z in enumerate(zz):
+        if QtCore_ProgressSignal:
+            QtCore_ProgressSignal.emit(i_z / len(zz) * 100)
+        heat_flux_ = np.zeros(np.shape(xx), dtype=dtype)
+        for tile, indices in tiles:
+            for i in indices:
+                heat_flux_[tile] += emitter_list[i]['heat_flux'] * solver_phi_2d[i](
+                    xx=xx[tile], yy=yy[tile], z=z, **_emitter_solver_kwargs(emitter_list[i])
+                )
+        is_max = heat_flux_ > heat_flux
+        heat_flux[is_max] = heat_flux_[is_max]
+        heat_flux_z[is_max] = z
+    return heat_flux, heat_flux_z
+
+
+def main(
+        params_dict: dict,
+        solver_phi_2d: typing.Callable,
+        QtCore_ProgressSignal=None,
+        delta_z: float = None,
+        phi_cache: dict = None,
+):
+    """Solves resultant heat flux of all emitters over the receiver domain, shared by the 2-D radiation modules.
+
+    Configuration factors are cached by `emitter_geometry_hash`. An emitter is only solved when its hash differs from
+    `emitter['phi_hash']` stored by a previous run (or is missing from `phi_cache`), all other emitters reuse their
+    `phi_dict` and are rescaled by their current `heat_flux`.
+
+    When `solver_phi_table` is provided, configuration factors are resampled from tables shared by all emitters of the
+    same width and height (see `phi_table` and `solver_phi_2d_table`) and the interpolation error bound of `heat_flux`
+    is stored in `heat_flux_error`. Table resampling is solved in the calling process, `solver_processes` is not used.
+
+    When `solver_cull_tolerance` is provided, the receiver domain is split into tiles of `solver_cull_tile` cells and
+    only emitters that may contribute more than the tolerance to a tile are solved for it (see `cull_emitters`), the
+    upper bound of the skipped heat flux is stored in `heat_flux_cull_error`. Culled emitters are solved in the calling
+    process, `solver_processes` is not used.
+
+    When `solver_store_phi` is False, configuration factors and `heat_flux_dict` are not stored, only the running
+    maximum heat flux and its z-level are kept in memory (see `solve_heat_flux_max`), emitters are solved in the calling
+    process and are not cached. `solver_dtype` sets the data type of stored arrays, e.g. 'float32' to halve memory use.
+    The z-level of the maximum heat flux is stored in `heat_flux_z`.
+
+    When `solver_mask` is provided, receivers inside any of its polygons (e.g. building footprints) are not solved, see
+    `points_in_polygons`, their heat flux is NaN and the mask is stored in `heat_flux_mask`. Masked receivers are solved
+    in the calling process, `solver_processes` is not used.
+
+    :param params_dict: see `main` in `fse_thermal_radiation_2d_parallel`.
+    :param solver_phi_2d: configuration factor solver.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :param delta_z: z-level spacing when `solver_domain:z` is a range, `solver_delta` is used when not provided.
+    :param phi_cache: optional, a dict object to share `phi_dict` between runs, i.e. {geometry hash: phi_dict}.
+    :return params_dict: the same as the input `params_dict` with calculated heat flux and configuration factors.
+    """
+    # ========================
+    # prepare input parameters
+    # ========================
+    z1, z2 = update_emitter_list(params_dict['emitter_list'])
+
+    # ==============================
+    # calculate configuration factor
+    # ==============================
+    xx, yy = solver_domain_meshgrid(params_dict)
+    zz = solver_domain_zz(params_dict, z1, z2, delta_z)
+
+    if 'solver_processes' in params_dict:
+        n_processes = params_dict['solver_processes']
+    else:
+        n_processes = 1
+
+    if 'solver_store_phi' in params_dict:
+        is_store_phi = params_dict['solver_store_phi']
+    else:
+        is_store_phi = True
+
+    if 'solver_dtype' in params_dict:
+        dtype = np.dtype(params_dict['solver_dtype'])
+    else:
+        dtype = np.dtype(np.float64)
+
+    # solver of each emitter, i.e. by emitter `type`, see `emitter_solver_phi_2d`
+    solver_dict = {id(emitter): emitter_solver_phi_2d(emitter, solver_phi_2d) for emitter in params_dict['emitter_list']}
+
+    # resample cached tables of each emitter size in place of evaluating every emitter, see `phi_table`
+    is_phi_table = 'solver_phi_table' in params_dict and params_dict['solver_phi_table']
+    if is_phi_table:
+        solver_table_dict = {
+            k: functools.partial(solver_phi_2d_table, solver_phi_2d=v, delta=params_dict['solver_phi_table'])
+            for k, v in solver_dict.items()
+        }
+    else:
+        solver_table_dict = solver_dict
+
+    # only solve emitters with changed geometry, others reuse cached configuration factors
+    emitter_list = list()
+    for emitter in params_dict['emitter_list']:
+        if not is_store_phi:
+            emitter.pop('phi_dict', None)
+            emitter.pop('phi_hash', None)
+            emitter_list.append(emitter)
+            continue
+        phi_hash = emitter_geometry_hash(emitter, params_dict, zz, solver_table_dict[id(emitter)])
+        if 'phi_dict' in emitter and emitter.get('phi_hash') == phi_hash:
+            pass
+        elif phi_cache is not None and phi_hash in phi_cache:
+            emitter['phi_dict'] = dict(phi_cache[phi_hash])
+        else:
+            emitter['phi_dict'] = dict()
+            emitter_list.append(emitter)
+        emitter['phi_hash'] = phi_hash
+
+    if is_phi_table:
+        # build each table once with the extent required by all emitters of the same size, the resample is cheap
+        # compared to building the tables thus solved in this process
+        extent_dict = dict()
+        for emitter in emitter_list:
+            solver_kwargs = _emitter_solver_kwargs(emitter)
+            uu, ss = emitter_local_coordinates(solver_kwargs['emitter_xy1'], solver_kwargs['emitter_xy2'], xx, yy)
+            key = (_solver_name(solver_dict[id(emitter)]), emitter['width'], emitter['height'])
+            solver, u_max, s_max = extent_dict.get(key, (solver_dict[id(emitter)], 0, 0))
+            extent_dict[key] = solver, max(u_max, np.amax(np.abs(uu))), max(s_max, np.amax(ss))
+        for (_, width, height), (solver, u_max, s_max) in extent_dict.items():
+            for z in zz:
+                phi_table(solver, width, height, z, params_dict['solver_phi_table'], u_max, s_max)
+        n_processes = 1
+
+    # skip emitters that can not contribute more than the tolerance to a receiver tile, see `cull_emitters`
+    is_cull = 'solver_cull_tolerance' in params_dict and params_dict['solver_cull_tolerance']
+    if is_cull:
+        tiles = cull_emitters(
+            params_dict['emitter_list'], xx, yy, params_dict['solver_cull_tolerance'],
+            params_dict.get('solver_cull_tile', 16)
+        )
+        index_dict = {id(emitter): i for i, emitter in enumerate(emitter_list)}
+        tiles_solve = list()
+        heat_flux_cull_error = np.zeros_like(xx, dtype=np.float64)
+        for tile, indices, error in tiles:
+            indices = [params_dict['emitter_list'][i] for i in indices]
+            tiles_solve.append((tile, [index_dict[id(i)] for i in indices if id(i) in index_dict]))
+            heat_flux_cull_error[tile] = error
+        params_dict['heat_flux_cull_error'] = heat_flux_cull_error
+        n_processes = 1
+    else:
+        tiles_solve = None
+
+    # exclude receivers inside mask polygons, e.g. building footprints
+    is_mask = 'solver_mask' in params_dict and params_dict['solver_mask']
+    if is_mask:
+        is_masked = points_in_polygons(xx, yy, params_dict['solver_mask'])
+        if tiles_solve is None:
+            tiles_solve = [((slice(None), slice(None)), list(range(len(emitter_list))))]
+        tiles_solve = mask_tiles(tiles_solve, is_masked)
+        params_dict['heat_flux_mask'] = is_masked
+        n_processes = 1
+
+    if is_store_phi:
+        solve_phi_dict(
+            emitter_list=emitter_list,
+            xx=xx,
+            yy=yy,
+            zz=zz,
+            solver_phi_2d=[solver_table_dict[id(emitter)] for emitter in emitter_list],
+            n_processes=n_processes,
+            QtCore_ProgressSignal=QtCore_ProgressSignal,
+            tiles=tiles_solve,
+        )
+        for emitter in emitter_list:
+            emitter['phi_dict'] = {k: v.astype(dtype, copy=False) for k, v in emitter['phi_dict'].items()}
+
+        if phi_cache is not None:
+            for emitter in emitter_list:
+                phi_cache[emitter['phi_hash']] = emitter['phi_dict']
+    else:
+        # only the running maximum is kept, configuration factors are discarded once summed
+        heat_flux, heat_flux_z = solve_heat_flux_max(
+            emitter_list=emitter_list,
+            xx=xx,
+            yy=yy,
+            zz=zz,
+            solver_phi_2d=[solver_table_dict[id(emitter)] for emitter in emitter_list],
+            tiles=tiles_solve,
+            dtype=dtype,
+            QtCore_ProgressSignal=QtCore_ProgressSignal,
+        )
+        params_dict.pop('heat_flux_dict', None)
+
+    if QtCore_ProgressSignal:
+        QtCore_ProgressSignal.emit(100)
+
+    # =============================
+    # calculate resultant heat flux
+    # =============================
+
+    if is_store_phi:
+        heat_flux = np.full_like(xx, -np.inf, dtype=dtype)
+        heat_flux_z = np.zeros_like(xx, dtype=dtype)
+        for z in zz:
+            heat_flux_ = np.zeros_like(xx, dtype=dtype)
+            for emitter in params_dict['emitter_list']:
+                heat_flux_ += emitter['heat_flux'] * emitter['phi_dict'][f'{z:.3f}']
+            if 'heat_flux_dict' in params_dict:
+                params_dict['heat_flux_dict'][f'{z:.3f}'] = heat_flux_
+            else:
+                params_dict['heat_flux_dict'] = {f'{z:.3f}': heat_flux_}
+            # running maximum in place of stacking all z-levels
+            is_max = heat_flux_ > heat_flux
+            heat_flux[is_max] = heat_flux_[is_max]
+            heat_flux_z[is_max] = z
+
+    heat_flux[heat_flux == 0] = -1
+    if is_mask:
+        heat_flux[is_masked] = np.nan
+    params_dict['heat_flux'] = heat_flux
+    params_dict['heat_flux_z'] = heat_flux_z
+
+    if is_phi_table:
+        # |max_z(a) - max_z(b)| <= max_z|a - b|, thus the error bound of the maximum heat flux is the largest of all z
+        heat_flux_error = np.zeros_like(xx, dtype=np.float64)
+        for z in zz:
+            heat_flux_error_z = np.zeros_like(xx, dtype=np.float64)
+            for emitter in params_dict['emitter_list']:
+                heat_flux_error_z += abs(emitter['heat_flux']) * solver_phi_2d_table_error(
+                    xx=xx, yy=yy, z=z, solver_phi_2d=solver_dict[id(emitter)], delta=params_dict['solver_phi_table'],
+                    **_emitter_solver_kwargs(emitter)
+                )
+            heat_flux_error = np.maximum(heat_flux_error, heat_flux_error_z)
+        params_dict['heat_flux_error'] = heat_flux_error
+
+    return params_dict
+
+
+def heat_flux_at_points(
+        emitter_list: list,
+        x: np.ndarray,
+        y: np.ndarray,
+        zz: typing.Union[list, tuple, np.ndarray],
+        solver_phi_2d: typing.Callable,
+) -> np.ndarray:
+    """Returns the maximum resultant heat flux over all z-levels at scattered receiver points.
+
+    :param emitter_list: a list of emitter dict objects, see `main`, `update_emitter_list` should have been applied.
+    :param x: receiver x-values, 1-D.
+    :param y: receiver y-values, 1-D.
+    :param zz: receiver z-levels.
+    :param solver_phi_2d: configuration factor solver, see `emitter_solver_phi_2d`.
+    :return heat_flux: heat flux at the receiver points, 1-D.
+    """
+    x, y = np.reshape(x, (1, -1)).astype(np.float64), np.reshape(y, (1, -1)).astype(np.float64)
+    solver_list = [emitter_solver_phi_2d(emitter, solver_phi_2d) for emitter in emitter_list]
+    heat_flux = np.zeros(x.shape[1], dtype=np.float64)
+    for z in zz:
+        heat_flux_z = np.zeros_like(heat_flux)
+        for emitter, solver in zip(emitter_list, solver_list):
+            heat_flux_z += emitter['heat_flux'] * solver(
+                xx=x, yy=y, z=z, **_emitter_solver_kwargs(emitter)
+            )[0]
+        heat_flux = np.maximum(heat_flux, heat_flux_z)
+    return heat_flux
+
+
+def phi_points(
+        emitter_list: list,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: typing.Union[float, np.ndarray],
+        solver_phi_2d: typing.Callable,
+) -> np.ndarray:
+    """Returns configuration factors of all emitters at scattered receiver points, each emitter is solved in one call
+    over all points, i.e. cost scales with the number of points rather than their bounding box.
+
+    :param emitter_list: a list of emitter dict objects, see `main`, `update_emitter_list` should have been applied.
+    :param x: receiver x-values, 1-D.
+    :param y: receiver y-values, 1-D.
+    :param z: receiver z-values, 1-D of the same length as `x` or a scalar for all receivers.
+    :param solver_phi_2d: configuration factor solver, see `emitter_solver_phi_2d`, `z` is passed as an array.
+    :return phi: (n_points, n_emitters) configuration factors.
+    """
+    x, y = np.reshape(x, (1, -1)).astype(np.float64), np.reshape(y, (1, -1)).astype(np.float64)
+    z = np.broadcast_to(np.asarray(z, dtype=np.float64), (x.shape[1],)).reshape(1, -1)
+    phi = np.zeros((x.shape[1], len(emitter_list)), dtype=np.float64)
+    for i, emitter in enumerate(emitter_list):
+        phi[:, i] = emitter_solver_phi_2d(emitter, solver_phi_2d)(
+            xx=x, yy=y, z=z, **_emitter_solver_kwargs(emitter)
+        )[0]
+    return phi
+
+
+def main_points(params_dict: dict, solver_phi_2d: typing.Callable, QtCore_ProgressSignal=None):
+    """Solves configuration factors and resultant heat flux at scattered receiver points, e.g. window centres on a
+    neighbouring facade, in place of a full `solver_domain` grid.
+
+    :param params_dict: see `main`, `receiver_points` (n_points, 3) array of (x, y, z) is required and `solver_domain`
+        and `solver_delta` are not used.
+    :param solver_phi_2d: configuration factor solver.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :return params_dict: the same as the input `params_dict` with `receiver_phi` (n_points, n_emitters) and
+        `receiver_heat_flux` (n_points,), i.e. `receiver_phi` weighted by emitter heat flux.
+    """
+    update_emitter_list(params_dict['emitter_list'])
+    receiver_points = np.reshape(params_dict['receiver_points'], (-1, 3))
+
+    if QtCore_ProgressSignal:
+        QtCore_ProgressSignal.emit(0)
+
+    phi = phi_points(
+        params_dict['emitter_list'], receiver_points[:, 0], receiver_points[:, 1], receiver_points[:, 2], solver_phi_2d
+    )
+
+    if QtCore_ProgressSignal:
+        QtCore_ProgressSignal.emit(100)
+
+    params_dict['receiver_phi'] = phi
+    params_dict['receiver_heat_flux'] = phi @ np.array([emitter['heat_flux'] for emitter in params_dict['emitter_list']],
+                                                       dtype=np.float64)
+    return params_dict
+
+
+def _cell_straddles(points: dict, i: int, j: int, step: int, level: float) -> bool:
+    # corners and any hanging nodes on the cell boundary left by refined neighbours
+    above = below = False
+    for k in range(step + 1):
+        for ij in ((i + k, j), (i + k, j + step), (i, j + k), (i + step, j + k)):
+            if ij in points:
+                if points[ij] >= level:
+                    above = True
+                else:
+                    below = True
+                if above and below:
+                    return True
+    return False
+
+
+def _contour_segments(q: np.ndarray, x: np.ndarray, y: np.ndarray, level: float) -> list:
+    # marching squares of a single cell, corners are ordered (x1, y1), (x2, y1), (x2, y2), (x1, y2)
+    def cross(a, b):
+        # interpolate with canonical corner order so that neighbouring cells share identical end points
+        if (x[a], y[a]) > (x[b], y[b]):
+            a, b = b, a
+        t = (level - q[a]) / (q[b] - q[a])
+        return x[a] + t * (x[b] - x[a]), y[a] + t * (y[b] - y[a])
+
+    edges = [(0, 1), (1, 2), (2, 3), (3, 0)]
+    crossed = [e for e in edges if (q[e[0]] >= level) != (q[e[1]] >= level)]
+    if len(crossed) == 2:
+        return [(cross(*crossed[0]), cross(*crossed[1]))]
+    if len(crossed) == 4:
+        # saddle, resolved by the cell centre value
+        if (np.average(q) >= level) == (q[0] >= level):
+            return [(cross(0, 1), cross(1, 2)), (cross(2, 3), cross(3, 0))]
+        return [(cross(3, 0), cross(0, 1)), (cross(1, 2), cross(2, 3))]
+    return []
+
+
+def _join_segments(segments: list) -> list:
+    # chain segments sharing end points into polylines
+    key = lambda p: (round(p[0], 9), round(p[1], 9))
+    connections = dict()
+    for n, (p1, p2) in enumerate(segments):
+        connections.setdefault(key(p1), list()).append(n)
+        connections.setdefault(key(p2), list()).append(n)
+
+    used = [False] * len(segments)
+    polylines = list()
+    for n in range(len(segments)):
+        if used[n]:
+            continue
+        used[n] = True
+        line = list(segments[n])
+        for forward in (True, False):
+            while True:
+                end = line[-1] if forward else line[0]
+                n_next = [m for m in connections[key(end)] if not used[m]]
+                if not n_next:
+                    break
+                used[n_next[0]] = True
+                p1, p2 = segments[n_next[0]]
+                p = p2 if key(p1) == key(end) else p1
+                if forward:
+                    line.append(p)
+                else:
+                    line.insert(0, p)
+        polylines.append(np.array(line))
+    return polylines
+
+
+def main_adaptive(
+        params_dict: dict,
+        solver_phi_2d: typing.Callable,
+        critical_heat_flux: float = 12.6,
+        QtCore_ProgressSignal=None,
+        delta_z: float = None,
+):
+    """Solves the critical heat flux contour with an adaptive quadtree, shared by the 2-D radiation modules.
+
+    The `solver_domain` is solved on a coarse grid of `solver_delta`, cells are split into four until
+    `solver_delta_min` only where their corner (and hanging node) heat fluxes straddle `critical_heat_flux`. The contour
+    polyline is obtained by marching squares over the finest cells, its accuracy is the same as a uniform grid of
+    `solver_delta_min` provided the contour is detected on the coarse grid, i.e. features of the contour smaller than
+    `solver_delta` can be missed. The coarse grid is extended beyond `solver_domain` to a whole number of coarse cells.
+
+    :param params_dict: see `main` in `fse_thermal_radiation_2d_parallel`, with additional optional `solver_delta_min`,
+        the finest cell size, default 0.05.
+    :param solver_phi_2d: configuration factor solver.
+    :param critical_heat_flux: the heat flux level to be resolved.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :param delta_z: z-level spacing when `solver_domain:z` is a range, `solver_delta` is used when not provided.
+    :return params_dict: the same as the input `params_dict` with
+        `heat_flux_points`  (n, 3) array of x, y and heat flux of all evaluated points,
+        `heat_flux_cells`   (m, 3) array of x, y of the lower left corner and size of all leaf cells,
+        `heat_flux_contour` a list of (k, 2) arrays, polylines of the `critical_heat_flux` contour.
+    """
+    z1, z2 = update_emitter_list(params_dict['emitter_list'])
+    zz = solver_domain_zz(params_dict, z1, z2, delta_z)
+
+    x1, x2 = params_dict['solver_domain']['x']
+    y1, y2 = params_dict['solver_domain']['y']
+    delta = params_dict['solver_delta']
+    if 'solver_delta_min' in params_dict:
+        delta_min = params_dict['solver_delta_min']
+    else:
+        delta_min = 0.05
+
+    # points are indexed on the finest grid, coarse cells span `step` finest cells
+    n_level = max(int(np.ceil(np.log2(delta / delta_min) - 1e-9)), 0)
+    step = 2 ** n_level
+    delta_min = delta / step
+    nx, ny = int(np.ceil((x2 - x1) / delta - 1e-9)), int(np.ceil((y2 - y1) / delta - 1e-9))
+
+    points = dict()
+
+    def evaluate(ij_list):
+        ij_list = [ij for ij in dict.fromkeys(ij_list) if ij not in points]
+        if ij_list:
+            ij = np.array(ij_list)
+            heat_flux = heat_flux_at_points(
+                params_dict['emitter_list'], x1 + ij[:, 0] * delta_min, y1 + ij[:, 1] * delta_min, zz, solver_phi_2d
+            )
+            points.update(zip(ij_list, heat_flux))
+
+    cells = [(i * step, j * step, step) for i in range(nx) for j in range(ny)]
+    evaluate([(i * step, j * step) for i in range(nx + 1) for j in range(ny + 1)])
+
+    for n in range(n_level):
+        if QtCore_ProgressSignal:
+            QtCore_ProgressSignal.emit(n / max(n_level, 1) * 100)
+        # a split leaves hanging nodes on neighbours, repeat until no leaf at this level straddles
+        step_ = step // 2 ** (n + 1)
+        while True:
+            cells_split = [c for c in cells if c[2] > step_ and _cell_straddles(points, *c, critical_heat_flux)]
+            if not cells_split:
+                break
+            cells_split_set = set(cells_split)
+            cells = [c for c in cells if c not in cells_split_set]
+            for i, j, s in cells_split:
+                h = s // 2
+                cells.extend([(i, j, h), (i + h, j, h), (i, j + h, h), (i + h, j + h, h)])
+            evaluate([
+                ij for i, j, s in cells_split
+                for ij in ((i + s // 2, j), (i, j + s // 2), (i + s // 2, j + s // 2), (i + s, j + s // 2),
+                           (i + s // 2, j + s))
+            ])
+
+    # contour from marching squares over the finest cells
+    segments = list()
+    for i, j, s in cells:
+        if s == 1 and _cell_straddles(points, i, j, s, critical_heat_flux):
+            ij = ((i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1))
+            segments.extend(_contour_segments(
+                q=np.array([points[k] for k in ij]),
+                x=np.array([x1 + k[0] * delta_min for k in ij]),
+                y=np.array([y1 + k[1] * delta_min for k in ij]),
+                level=critical_heat_flux,
+            ))
+
+    if QtCore_ProgressSignal:
+        QtCore_ProgressSignal.emit(100)
+
+    ij, heat_flux = np.array(list(points.keys())), np.array(list(points.values()))
+    params_dict['heat_flux_points'] = np.column_stack(
+        [x1 + ij[:, 0] * delta_min, y1 + ij[:, 1] * delta_min, heat_flux]
+    )
+    cells = np.array(cells, dtype=np.float64)
+    params_dict['heat_flux_cells'] = np.column_stack(
+        [x1 + cells[:, 0] * delta_min, y1 + cells[:, 1] * delta_min, cells[:, 2] * delta_min]
+    )
+    params_dict['heat_flux_contour'] = _join_segments(segments)
+
+    return params_dict
+
+
+def main_rays(
+        params_dict: dict,
+        solver_phi_2d: typing.Callable,
+        critical_heat_flux: float = 12.6,
+        QtCore_ProgressSignal=None,
+        delta_z: float = None,
+):
+    """Solves the distance at which heat flux falls to `critical_heat_flux` along rays, shared by the 2-D radiation
+    modules. No receiver mesh grid is built, heat flux is only evaluated at points along the rays.
+
+    Each ray is sampled every `ray_delta` to bracket its outermost crossing, i.e. the last sample at or above
+    `critical_heat_flux` and the next sample, all rays are then refined simultaneously by bisection to `ray_tolerance`.
+
+    :param params_dict: see `main` in `fse_thermal_radiation_2d_parallel`, `solver_domain` and `solver_delta` are only
+        used for z-levels and are optional, z-levels are every 0.5 between the lowest and highest emitter z-values when
+        not provided. With additional
+            ray_origin      optional, (x, y) origin of the rays, default the centre of all emitters.
+            ray_angles      optional, ray directions in degrees anticlockwise from x-axis, default every 5 degrees.
+            ray_segments    optional, a list of ((x1, y1), (x2, y2)) boundary segments, each searched from the first
+                            to the second point. Replaces `ray_origin`, `ray_angles` and `ray_length` when provided.
+            ray_length      optional, search distance along rays, default 50.
+            ray_delta       optional, sampling interval along rays, default 0.5.
+            ray_tolerance   optional, bisection tolerance, default 0.001.
+    :param solver_phi_2d: configuration factor solver.
+    :param critical_heat_flux: the heat flux level to be resolved.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :param delta_z: z-level spacing when `solver_domain:z` is a range, `solver_delta` is used when not provided.
+    :return params_dict: the same as the input `params_dict` with
+        `ray_distance`  distance from the ray origin to the crossing, `nan` where critical heat flux is not reached and
+                        the ray length where it is still exceeded at the end of the ray.
+        `ray_boundary`  (n, 2) array, the boundary polygon, i.e. the crossing point of each ray, the ray origin where
+                        critical heat flux is not reached and the ray end where it is still exceeded.
+    """
+    z1, z2 = update_emitter_list(params_dict['emitter_list'])
+    if 'solver_domain' in params_dict:
+        zz = solver_domain_zz(params_dict, z1, z2, delta_z)
+    else:
+        zz = np.arange(z1, z2 + 0.25, 0.5)
+
+    ray_delta = params_dict['ray_delta'] if 'ray_delta' in params_dict else 0.5
+    ray_tolerance = params_dict['ray_tolerance'] if 'ray_tolerance' in params_dict else 1e-3
+
+    if 'ray_segments' in params_dict:
+        xy1, xy2 = np.array([i[0] for i in params_dict['ray_segments']], dtype=np.float64), \
+                   np.array([i[1] for i in params_dict['ray_segments']], dtype=np.float64)
+        length = np.linalg.norm(xy2 - xy1, axis=1)
+        direction = (xy2 - xy1) / length[:, np.newaxis]
+        origin = xy1
+    else:
+        if 'ray_origin' in params_dict:
+            ray_origin = params_dict['ray_origin']
+        else:
+            ray_origin = (
+                np.average([np.average(emitter['x']) for emitter in params_dict['emitter_list']]),
+                np.average([np.average(emitter['y']) for emitter in params_dict['emitter_list']]),
+            )
+        if 'ray_angles' in params_dict:
+            angles = np.radians(np.asarray(params_dict['ray_angles'], dtype=np.float64))
+        else:
+            angles = np.radians(np.arange(0, 360, 5, dtype=np.float64))
+        direction = np.column_stack([np.cos(angles), np.sin(angles)])
+        origin = np.tile(np.asarray(ray_origin, dtype=np.float64), (len(angles), 1))
+        length = np.full(len(angles), params_dict['ray_length'] if 'ray_length' in params_dict else 50.)
+
+    def heat_flux(origin_, direction_, t):
+        xy = origin_ + t[:, np.newaxis] * direction_
+        return heat_flux_at_points(params_dict['emitter_list'], xy[:, 0], xy[:, 1], zz, solver_phi_2d)
+
+    # bracket the outermost crossing, all rays are sampled at the same number of steps scaled to their length
+    n_step = int(np.ceil(np.amax(length) / ray_delta))
+    tt = length[:, np.newaxis] * np.linspace(0, 1, n_step + 1)[np.newaxis, :]
+    exceeded = heat_flux(
+        np.repeat(origin, n_step + 1, axis=0), np.repeat(direction, n_step + 1, axis=0), tt.ravel()
+    ).reshape(tt.shape) >= critical_heat_flux
+    if QtCore_ProgressSignal:
+        QtCore_ProgressSignal.emit(50)
+
+    is_reached = np.any(exceeded, axis=1)
+    i_last = n_step - np.argmax(exceeded[:, ::-1], axis=1)
+    is_beyond = is_reached & (i_last == n_step)
+    is_bracketed = is_reached & ~is_beyond
+
+    distance = np.where(is_beyond, length, np.nan)
+    t1, t2 = tt[is_bracketed, i_last[is_bracketed]], tt[is_bracketed, i_last[is_bracketed] + 1]
+    while t1.size and np.amax(t2 - t1) > ray_tolerance:
+        t = 0.5 * (t1 + t2)
+        is_exceeded = heat_flux(origin[is_bracketed], direction[is_bracketed], t) >= critical_heat_flux
+        t1, t2 = np.where(is_exceeded, t, t1), np.where(is_exceeded, t2, t)
+    distance[is_bracketed] = 0.5 * (t1 + t2)
+
+    if QtCore_ProgressSignal:
+        QtCore_ProgressSignal.emit(100)
+
+    params_dict['ray_distance'] = distance
+    params_dict['ray_boundary'] = origin + np.nan_to_num(distance, nan=0.)[:, np.newaxis] * direction
+
+    return params_dict
+
+
+def _tiled_hash(params_dict: dict, zz, solver_dict: dict, tile_size: int, dtype) -> str:
+    # everything the tiled output depends on, a different hash starts a new set of tiles
+    emitters = tuple(
+        (
+            _solver_name(solver_dict[id(emitter)]),
+            tuple(float(i) for i in emitter['x']),
+            tuple(float(i) for i in emitter['y']),
+            tuple(float(i) for i in emitter['z']),
+            float(emitter['heat_flux']),
+        )
+        for emitter in params_dict['emitter_list']
+    )
+    options = (
+        tuple(float(i) for i in params_dict['solver_domain']['x']),
+        tuple(float(i) for i in params_dict['solver_domain']['y']),
+        float(params_dict['solver_delta']),
+        tuple(f'{z:.3f}' for z in zz),
+        params_dict.get('solver_cull_tolerance'),
+        params_dict.get('solver_cull_tile', 16),
+        int(tile_size),
+        str(dtype),
+    )
+    return hashlib.sha1(repr((emitters, options)).encode()).hexdigest()
+
+
+def main_tiled(
+        params_dict: dict,
+        solver_phi_2d: typing.Callable,
+        file_path: str,
+        tile_size: int = 512,
+        QtCore_ProgressSignal=None,
+        delta_z: float = None,
+):
+    """Solves the maximum resultant heat flux over the `solver_domain` tile by tile into a memory-mapped `.npy` file,
+    for domains too large to hold the receiver mesh grid and heat flux in memory.
+
+    Receiver coordinates are generated for each tile from `solver_domain` and `solver_delta`, the same points as `main`,
+    and each tile is solved by `solve_heat_flux_max` without storing configuration factors. Solved tiles are recorded
+    in a sidecar `<file_path>.<hash>.done.npy` once written and flushed to disk, running again with the same inputs
+    resumes from the unsolved tiles. Changing any input changes the hash and all tiles are solved again.
+    `solver_cull_tolerance` is applied within each tile, `solver_phi_table` and `solver_processes` are not used.
+
+    :param params_dict: see `main` in `fse_thermal_radiation_2d_parallel`.
+    :param solver_phi_2d: configuration factor solver.
+    :param file_path: path of the `.npy` file to write the heat flux (n_y, n_x) to.
+    :param tile_size: number of receiver cells along each side of a tile.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :param delta_z: z-level spacing when `solver_domain:z` is a range, `solver_delta` is used when not provided.
+    :return params_dict: the same as the input `params_dict` with `heat_flux` as a memory-mapped array.
+    """
+    z1, z2 = update_emitter_list(params_dict['emitter_list'])
+    zz = solver_domain_zz(params_dict, z1, z2, delta_z)
+
+    x1, x2 = params_dict['solver_domain']['x']
+    y1, y2 = params_dict['solver_domain']['y']
+    delta = params_dict['solver_delta']
+    n_x = len(np.arange(x1, x2 + 0.5 * delta, delta))
+    n_y = len(np.arange(y1, y2 + 0.5 * delta, delta))
+
+    if 'solver_dtype' in params_dict:
+        dtype = np.dtype(params_dict['solver_dtype'])
+    else:
+        dtype = np.dtype(np.float64)
+
+    emitter_list = params_dict['emitter_list']
+    solver_dict = {id(emitter): emitter_solver_phi_2d(emitter, solver_phi_2d) for emitter in emitter_list}
+    solver_list = [solver_dict[id(emitter)] for emitter in emitter_list]
+
+    # resume from the sidecar of solved tiles when the inputs are unchanged
+    n_tile_y, n_tile_x = -(-n_y // tile_size), -(-n_x // tile_size)
+    file_path_done = f'{file_path}.{_tiled_hash(params_dict, zz, solver_dict, tile_size, dtype)[:12]}.done.npy'
+    try:
+        is_done = np.lib.format.open_memmap(file_path_done, mode='r+')
+        heat_flux = np.lib.format.open_memmap(file_path, mode='r+')
+        assert is_done.shape == (n_tile_y, n_tile_x)
+        assert heat_flux.shape == (n_y, n_x) and heat_flux.dtype == dtype
+    except (FileNotFoundError, ValueError, AssertionError):
+        heat_flux = np.lib.format.open_memmap(file_path, mode='w+', dtype=dtype, shape=(n_y, n_x))
+        is_done = np.lib.format.open_memmap(file_path_done, mode='w+', dtype=bool, shape=(n_tile_y, n_tile_x))
+
+    for j in range(n_tile_y):
+        for i in range(n_tile_x):
+            if QtCore_ProgressSignal:
+                QtCore_ProgressSignal.emit((j * n_tile_x + i) / (n_tile_y * n_tile_x) * 100)
+            if is_done[j, i]:
+                continue
+
+            tile = (
+                slice(j * tile_size, min((j + 1) * tile_size, n_y)),
+                slice(i * tile_size, min((i + 1) * tile_size, n_x)),
+            )
+            xx, yy = np.meshgrid(
+                x1 + delta * np.arange(tile[1].start, tile[1].stop), y1 + delta * np.arange(tile[0].start, tile[0].stop)
+            )
+
+            if 'solver_cull_tolerance' in params_dict and params_dict['solver_cull_tolerance']:
+                tiles = [
+                    (tile_, indices) for tile_, indices, _ in cull_emitters(
+                        emitter_list, xx, yy, params_dict['solver_cull_tolerance'],
+                        params_dict.get('solver_cull_tile', 16)
+                    )
+                ]
+            else:
+                tiles = None
+
+            heat_flux_, _ = solve_heat_flux_max(
+                emitter_list=emitter_list, xx=xx, yy=yy, zz=zz, solver_phi_2d=solver_list, tiles=tiles, dtype=dtype,
+            )
+            heat_flux_[heat_flux_ == 0] = -1
+            heat_flux[tile] = heat_flux_
+
+            # only mark the tile once its results are on disk
+            heat_flux.flush()
+            is_done[j, i] = True
+            is_done.flush()
+
+    if QtCore_ProgressSignal:
+        QtCore_ProgressSignal.emit(100)
+
+    params_dict['heat_flux'] = heat_flux
+    return params_dict
+
+
+def phi_matrix(params_dict: dict) -> np.ndarray:
+    """Assembles the receivers x emitters configuration factor matrix from `phi_dict` solved by `main`.
+
+    :param params_dict: see `main`, after being solved.
+    :return phi_matrix: (n_z * n_y * n_x, n_emitters) array, receivers are all z-levels of the receiver mesh grid.
+    """
+    emitter_list = params_dict['emitter_list']
+    return np.concatenate(
+        [_phi_matrix([emitter['phi_dict'][z] for emitter in emitter_list]) for z in emitter_list[0]['phi_dict']],
+        axis=0
+    )
+
+
+def resultant_heat_flux_time_series(params_dict: dict, heat_flux, chunk_size: int = None):
+    """Calculates heat flux time series over the receiver mesh grid from configuration factors solved by `main`, for
+    emitters following heat flux time series rather than a fixed `heat_flux`. The geometry is not re-solved, the
+    receiver heat flux is a single matrix product of `phi_matrix` and `heat_flux`, taking the maximum of all z-levels.
+
+    :param params_dict: see `main`, after being solved.
+    :param heat_flux: (n_emitters, n_time) emitter heat flux array in the order of `emitter_list`, or an iterable of
+        (n_emitters, n_time_chunk) arrays, see `heat_flux_time_series` in `fse_thermal_radiation`.
+    :param chunk_size: optional, number of time steps per chunk.
+    :return heat_flux: (n_y, n_x, n_time) receiver heat flux when `heat_flux` is an array and `chunk_size` is not
+        provided, otherwise a generator yielding (time slice, (n_y, n_x, n_time_chunk) receiver heat flux). Zero heat
+        flux is not replaced by -1 as in `main`.
+    """
+    phi_dict = params_dict['emitter_list'][0]['phi_dict']
+    shape = (len(phi_dict), *np.shape(next(iter(phi_dict.values()))))
+
+    def max_z(v: np.ndarray) -> np.ndarray:
+        return np.amax(v.reshape((*shape, v.shape[-1])), axis=0)
+
+    heat_flux = _heat_flux_time_series(phi_matrix(params_dict), heat_flux, chunk_size)
+    if isinstance(heat_flux, np.ndarray):
+        return max_z(heat_flux)
+    return ((i, max_z(v)) for i, v in heat_flux)
@@ -0,0 +1,131 @@
+import typing
+
+import numpy as np
+
+from .fse_thermal_radiation_2d import main as _main, main_adaptive as _main_adaptive, main_rays as _main_rays, \
+    main_tiled as _main_tiled, main_points as _main_points
+from .fse_thermal_radiation_2d_parallel import main_plot
+from .fse_thermal_radiation_v2 import phi_angled_any_en_1_converted
+from ..etc.transforms2d import rotation_meshgrid, angle_between_two_vectors_2d
+
+__all__ = 'main', 'main_adaptive', 'main_rays', 'main_tiled', 'main_points', 'main_plot', 'solver_phi_2d'
+
+
+def solver_phi_2d(
+        emitter_xy1: typing.Union[list, tuple, np.ndarray],
+        emitter_xy2: typing.Union[list, tuple, np.ndarray],
+        emitter_z: typing.Union[list, tuple, np.ndarray],
+        xx: typing.Union[list, tuple, np.ndarray],
+        yy: typing.Union[list, tuple, np.ndarray],
+        z: float,
+        theta: float,
+) -> np.ndarray:
+    """Configuration factor of an angled emitter over the receiver mesh grid, solved in one call by
+    `phi_angled_any_en_1_converted`.
+
+    :param emitter_xy1: the first point of the emitter line segment on z-plane.
+    :param emitter_xy2: the second point of the emitter line segment on z-plane.
+    :param emitter_z: the bottom and top of the emitter.
+    :param xx: receiver mesh grid x-values.
+    :param yy: receiver mesh grid y-values.
+    :param z: receiver z-level.
+    :param theta: angle between the receiver plane and emitter plane in radians, 0 is parallel.
+    :return phi: configuration factors at the receiver points, zero behind the emitter.
+    """
+
+    # calculate the angle between a flat line (1, 0) and the emitter plane on z-plane
+    theta_in_radians = angle_between_two_vectors_2d(v1=np.subtract(emitter_xy2, emitter_xy1), v2=(1, 0))
+
+    # solver domain
+    xx, yy = rotation_meshgrid(xx, yy, theta_in_radians)
+
+    # calculate the emitter surface level, i.e. everything below this level is behind the emitter.
+    x1, y1 = emitter_xy1
+    x2, y2 = emitter_xy2
+    emitter_x, emitter_y = rotation_meshgrid(np.array((x1, x2)), np.array((y1, y2)), theta_in_radians)
+    if abs(emitter_y[0, 0] - emitter_y[0, 1]) > 1e-10:
+        raise AssertionError(f'{emitter_y[0, 0]} and {emitter_y[0, 1]} do not match.')
+    surface_level_y = emitter_y[0, 0]
+
+    # the angled emitter is not symmetrical, receiver location is measured from the first point of the emitter
+    ss = yy - surface_level_y
+    is_front = ss > 0
+    phi = phi_angled_any_en_1_converted(
+        W=sum(np.square(np.subtract(emitter_xy1, emitter_xy2))) ** 0.5,
+        H=abs(emitter_z[0] - emitter_z[1]),
+        w=xx - emitter_x[0, 0],
+        h=z,
+        theta=theta,
+        S=np.where(is_front, ss, 1.),
+    )
+
+    return np.where(is_front, phi, 0.)
+
+
+def main(params_dict: dict, QtCore_ProgressSignal=None, phi_cache: dict = None):
+    """Solves resultant heat flux of angled emitters, the same `params_dict` as `main` in
+    `fse_thermal_radiation_2d_parallel` with an additional `theta` for each emitter.
+
+    :param params_dict:
+        see `main` in `fse_thermal_radiation_2d_parallel`, where:
+            emitter_list
+                theta       angle between the receiver plane and emitter plane in radians, 0 is parallel.
+                type        optional, 'parallel', 'perpendicular' or 'angled' (default), to solve mixed emitters.
+    :param QtCore_ProgressSignal:
+        optional, a signal object with `emit` method, progress in percentage is emitted.
+    :param phi_cache:
+        optional, a dict object shared between runs to cache configuration factors by emitter geometry.
+
+    :return params_dict:
+        the same as the input `params_dict` with calculated heat flux and configuration factors.
+    """
+    return _main(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+        phi_cache=phi_cache,
+    )
+
+
+def main_adaptive(params_dict: dict, critical_heat_flux: float = 12.6, QtCore_ProgressSignal=None):
+    """Solves the `critical_heat_flux` contour of angled emitters with an adaptive quadtree, see `main_adaptive` in
+    `fse_thermal_radiation_2d_parallel`."""
+    return _main_adaptive(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        critical_heat_flux=critical_heat_flux,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+    )
+
+
+def main_rays(params_dict: dict, critical_heat_flux: float = 12.6, QtCore_ProgressSignal=None):
+    """Solves the distance at which heat flux of angled emitters falls to `critical_heat_flux` along rays, see
+    `main_rays` in `fse_thermal_radiation_2d_parallel`."""
+    return _main_rays(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        critical_heat_flux=critical_heat_flux,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+    )
+
+
+def main_tiled(params_dict: dict, file_path: str, tile_size: int = 512, QtCore_ProgressSignal=None):
+    """Solves the maximum resultant heat flux of angled emitters tile by tile into a memory-mapped `.npy` file, see
+    `main_tiled` in `fse_thermal_radiation_2d_parallel`."""
+    return _main_tiled(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        file_path=file_path,
+        tile_size=tile_size,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+    )
+
+
+def main_points(params_dict: dict, QtCore_ProgressSignal=None):
+    """Solves configuration factors and resultant heat flux of angled emitters at scattered (x, y, z) receiver points,
+    see `main_points` in `fse_thermal_radiation_2d_parallel`."""
+    return _main_points(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+    )
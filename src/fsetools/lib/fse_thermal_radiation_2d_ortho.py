@@ -2,7 +2,8 @@ from typing import Union
 
 import numpy as np
 
-from .fse_thermal_radiation import phi_parallel_any_br187, phi_perpendicular_any_br187
+from .fse_thermal_radiation import phi_parallel_any_br187_array, phi_perpendicular_any_br187_array
+from .fse_thermal_radiation import phi_matrix, heat_flux_time_series
 from ..etc.transforms2d import rotation_meshgrid, angle_between_two_vectors_2d
 
 
@@ -217,9 +218,9 @@ class Emitter(Plane):
     def calculate_phi(self, receiver: Receiver):
 
         if self.__is_parallel:
-            phi_func = phi_parallel_any_br187
+            phi_func = phi_parallel_any_br187_array
         else:
-            phi_func = phi_perpendicular_any_br187
+            phi_func = phi_perpendicular_any_br187_array
 
         # prepare useful variables
         x1, y1, x2, y2 = self.x1, self.y1, self.x2, self.y2  # emitter locations
@@ -247,35 +248,37 @@ class Emitter(Plane):
             emitter_centroid_y = np.average(yy2)
             emitter_centroid_z = 0.5 * (self.z1 + self.z2)
 
-        phiphi = np.zeros_like(zz)
+            # rotated grid is planar, broadcast it along the receiver k-dimension
+            xx, yy = xx[:, :, np.newaxis], yy[:, :, np.newaxis]
+
         emitter_width = self.width
         emitter_depth = self.depth
         emitter_height = self.height
 
+        # planar receiver, i.e. k-dimension has length 1, is solved on 2-d arrays
+        is_planar = zz.shape[2] == 1
+        if is_planar:
+            xx, yy, zz = xx[:, :, 0], yy[:, :, 0], zz[:, :, 0]
+
         if self.z2 == self.z1:
-            for i in range(zz.shape[0]):
-                for j in range(zz.shape[1]):
-                    for k in range(zz.shape[2]):
-                        if zz[i, j, k] > emitter_centroid_z:
-                            phiphi[i, j, k] = phi_func(
-                                W_m=emitter_width,
-                                H_m=emitter_depth,
-                                w_m=emitter_centroid_x + abs(emitter_centroid_x - xx[i, j]),
-                                h_m=emitter_centroid_y + abs(emitter_centroid_y - yy[i, j]),
-                                S_m=zz[i, j, k] - emitter_centroid_z
-                            )
+            phiphi = phi_func(
+                W_m=emitter_width,
+                H_m=emitter_depth,
+                w_m=emitter_centroid_x + np.abs(emitter_centroid_x - xx),
+                h_m=emitter_centroid_y + np.abs(emitter_centroid_y - yy),
+                S_m=zz - emitter_centroid_z
+            )
         else:
-            for i in range(zz.shape[0]):
-                for j in range(zz.shape[1]):
-                    for k in range(zz.shape[2]):
-                        if yy[i, j] > emitter_centroid_y:
-                            phiphi[i, j, k] = phi_func(
-                                W_m=emitter_width,
-                                H_m=emitter_height,
-                                w_m=0.5 * emitter_width + abs(emitter_centroid_x - xx[i, j]),
-                                h_m=zz[i, j, k],
-                                S_m=yy[i, j] - emitter_centroid_y
-                            )
+            phiphi = phi_func(
+                W_m=emitter_width,
+                H_m=emitter_height,
+                w_m=0.5 * emitter_width + np.abs(emitter_centroid_x - xx),
+                h_m=zz,
+                S_m=yy - emitter_centroid_y
+            )
+
+        if is_planar:
+            phiphi = phiphi[:, :, np.newaxis]
 
         self.__phi = phiphi
 
@@ -361,3 +364,23 @@ class CuboidRoomModel:
         q5r = self.floor.phi * q5 if q5 else 0
 
         return q1r + q2r + q3r + q4r + q5r
+
+    @property
+    def phi_matrix(self) -> np.ndarray:
+        """Receivers x emitters configuration factor matrix, emitters in the order of wall 1 to 4 and floor."""
+        return phi_matrix([self.wall_1.phi, self.wall_2.phi, self.wall_3.phi, self.wall_4.phi, self.floor.phi])
+
+    def resultant_heat_flux_time_series(self, heat_flux, chunk_size: int = None):
+        """Ceiling heat flux time series for surfaces following heat flux time series, solved as a single matrix
+        product of `phi_matrix` and `heat_flux` without re-solving the geometry.
+
+        :param heat_flux: (5, n_time) heat flux of wall 1 to 4 and floor, or an iterable of (5, n_time_chunk) arrays.
+        :param chunk_size: optional, number of time steps per chunk.
+        :return heat_flux: (*ceiling mesh grid shape, n_time) when `heat_flux` is an array and `chunk_size` is not
+            provided, otherwise a generator yielding (time slice, (*ceiling mesh grid shape, n_time_chunk)).
+        """
+        shape = self.wall_1.phi.shape
+        heat_flux = heat_flux_time_series(self.phi_matrix, heat_flux, chunk_size)
+        if isinstance(heat_flux, np.ndarray):
+            return heat_flux.reshape((*shape, heat_flux.shape[-1]))
+        return ((i, v.reshape((*shape, v.shape[-1]))) for i, v in heat_flux)
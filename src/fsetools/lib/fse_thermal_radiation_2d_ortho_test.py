@@ -90,6 +90,22 @@ def test_CuboidRoomModel():
     plt.show()
 
 
+def test_CuboidRoomModel_time_series():
+    model = CuboidRoomModel(width=5, depth=3, height=2, delta=0.1)
+    assert model.phi_matrix.shape == (30 * 50, 5)
+
+    heat_flux = np.array([np.linspace(0, 100, 7)] * 5)
+    heat_flux[4] *= 2
+    time_series = model.resultant_heat_flux_time_series(heat_flux)
+    for i in range(7):
+        assert np.allclose(time_series[..., i], model.resultant_heat_flux(heat_flux[:, i]))
+
+    time_series_ = np.zeros_like(time_series)
+    for i, v in model.resultant_heat_flux_time_series(heat_flux, chunk_size=3):
+        time_series_[..., i] = v
+    assert np.allclose(time_series_, time_series)
+
+
 def test_visual_CuboidRoomModel():
     import matplotlib.pyplot as plt
     plt.style.use("seaborn-v0_8")
@@ -143,5 +159,6 @@ def test_visual_CuboidRoomModel():
 if __name__ == '__main__':
     test_Plane()
     test_CuboidRoomModel()
+    test_CuboidRoomModel_time_series()
     test_Emitter_Receiver()
     test_visual_CuboidRoomModel()
@@ -3,7 +3,9 @@ import typing
 import numpy as np
 from matplotlib import cm
 
-from .fse_thermal_radiation import phi_parallel_any_br187
+from .fse_thermal_radiation import phi_parallel_any_br187_array
+from .fse_thermal_radiation_2d import main as _main, main_adaptive as _main_adaptive, main_rays as _main_rays, \
+    main_tiled as _main_tiled, main_points as _main_points
 from ..etc.transforms2d import rotation_meshgrid, angle_between_two_vectors_2d
 
 
@@ -145,20 +147,16 @@ def solver_phi_2d(
     # plt.contourf(xx, yy, np.ones_like(xx))
     # plt.show()
 
-    vv = np.zeros_like(xx)
+    # all receivers in one call, zero on or behind the emitter surface, `z` may be an array broadcast against `xx`
     emitter_height = abs(emitter_z[0] - emitter_z[1])
     emitter_width = sum(np.square(np.subtract(emitter_xy1, emitter_xy2))) ** 0.5
-    for i in range(xx.shape[0]):
-        for j in range(xx.shape[1]):
-            y = yy[i, j]
-            if y > surface_level_y:
-                vv[i, j] = phi_parallel_any_br187(
-                    W_m=emitter_width,
-                    H_m=emitter_height,
-                    w_m=0.5 * emitter_width + abs(emitter_x_centre - xx[i, j]),
-                    h_m=z,
-                    S_m=y - surface_level_y
-                )
+    vv = phi_parallel_any_br187_array(
+        W_m=emitter_width,
+        H_m=emitter_height,
+        w_m=0.5 * emitter_width + np.abs(emitter_x_centre - xx),
+        h_m=z,
+        S_m=yy - surface_level_y,
+    )
 
     # check phi
     # plt.contourf(xx, yy, vv)
@@ -168,7 +166,7 @@ def solver_phi_2d(
     return vv
 
 
-def main(params_dict: dict, QtCore_ProgressSignal=None):
+def main(params_dict: dict, QtCore_ProgressSignal=None, phi_cache: dict = None):
     """
 
     :param params_dict:
@@ -189,7 +187,14 @@ def main(params_dict: dict, QtCore_ProgressSignal=None):
                     y=(y1, y2),
                     z=(z1, z2)
                 ),
-                delta=0.5,  # optional
+                solver_delta=0.5,
+                solver_processes=1,  # optional
+                solver_phi_table=0.05,  # optional
+                solver_cull_tolerance=0.01,  # optional
+                solver_cull_tile=16,  # optional
+                solver_store_phi=True,  # optional
+                solver_dtype='float64',  # optional
+                solver_mask=[[(x1, y1), (x2, y2), ...], ...],  # optional
             )
         Where:
             emitter_list
@@ -197,6 +202,9 @@ def main(params_dict: dict, QtCore_ProgressSignal=None):
                 x2, y2      the second point of the line segment on z-plane.
                 z1, z2      the bottom and top of the emitter, i.e. abs(z1-z2) is the emitter height.
                 heat_flux   the heat flux (thermal) radiating from the emitter.
+                type        optional, 'parallel', 'perpendicular' or 'angled' to solve mixed emitters, default
+                            'parallel'.
+                theta       required by 'angled' emitters, angle between the receiver plane and emitter plane.
             receiver_list
                 x1, y1      the first point of the line segment on z-plane.
                 x2, y2      the second point of the line segment on z-plane.
@@ -204,102 +212,117 @@ def main(params_dict: dict, QtCore_ProgressSignal=None):
                 the area/ space that the imposed heat flux going to be solved.
             solver_delta
                 resolution of the `solver_domain`
+            solver_processes
+                optional, number of worker processes to solve (emitter, z) pairs in parallel, default 1 (serial)
+                and `None` to use all available CPUs.
+            solver_phi_table
+                optional, resolution of configuration factor tables shared by emitters of the same width and
+                height. When provided, configuration factors are interpolated from the tables instead of being
+                evaluated for every emitter and the interpolation error bound of `heat_flux` is stored in
+                `heat_flux_error`.
+            solver_cull_tolerance
+                optional, heat flux below which an emitter is skipped for a tile of receivers. When provided, the
+                upper bound of the skipped heat flux is stored in `heat_flux_cull_error`.
+            solver_cull_tile
+                optional, number of receiver cells along each side of a culling tile, default 16.
+            solver_store_phi
+                optional, default True. When False, configuration factors and `heat_flux_dict` are not stored and
+                only the running maximum heat flux and its z-level, `heat_flux_z`, are kept in memory.
+            solver_dtype
+                optional, data type of stored arrays, default 'float64', 'float32' halves memory use.
+            solver_mask
+                optional, a list of polygons, e.g. building footprints. Receivers inside any polygon are not solved,
+                their heat flux is NaN and the mask is stored in `heat_flux_mask`.
+    :param QtCore_ProgressSignal:
+        optional, a signal object with `emit` method, progress in percentage is emitted.
+    :param phi_cache:
+        optional, a dict object shared between runs to cache configuration factors by emitter geometry. Emitters
+        with unchanged geometry (x, y, z, `solver_domain` and `solver_delta`) are not re-solved, their cached
+        configuration factors are rescaled by their current `heat_flux`. Re-running `main` on its returned
+        `params_dict` benefits from the same caching without `phi_cache`, see `emitter['phi_hash']`.
 
     :return params_dict:
         the same as the input `params_dict` with calculated heat flux and configuration factors.
     """
-    # ========================
-    # prepare input parameters
-    # ========================
-    z2, z1 = -np.inf, np.inf
-
-    for emitter in params_dict['emitter_list']:
-        emitter.update(
-            dict(
-                # width of the rectangle
-                width=np.sum(
-                    (emitter['x'][0] - emitter['x'][1]) ** 2 +
-                    (emitter['y'][0] - emitter['y'][1]) ** 2
-                ) ** 0.5,
-                height=abs(emitter['z'][0] - emitter['z'][1]),
-            )
-        )
-
-        if emitter['x'][0] == emitter['x'][1]:
-            emitter['x'] = (emitter['x'][0], emitter['x'][1] + 1e-9)
-        if emitter['y'][0] == emitter['y'][1]:
-            emitter['y'] = (emitter['y'][0], emitter['y'][1] + 1e-9)
-
-        if min(emitter['z']) < z1:
-            z1 = min(emitter['z'])
-        if max(emitter['z']) > z2:
-            z2 = max(emitter['z'])
-
-    # ==============================
-    # calculate configuration factor
-    # ==============================
-
-    x1, x2 = params_dict['solver_domain']['x']
-    y1, y2 = params_dict['solver_domain']['y']
-    delta = params_dict['solver_delta']
-    xx, yy = np.arange(x1, x2 + 0.5 * delta, delta), np.arange(y1, y2 + 0.5 * delta, delta)
-    xx, yy = np.meshgrid(xx, yy)
-    if params_dict['solver_domain']['z']:
-        if len(params_dict['solver_domain']['z']) == 2:
-            delta_z = 0.5
-            zz = np.arange(params_dict['solver_domain']['z'][0], params_dict['solver_domain']['z'][1] + 0.5 * delta_z,
-                           delta_z)
-        elif len(params_dict['solver_domain']['z']) == 1:
-            zz = params_dict['solver_domain']['z']
-        else:
-            raise ValueError('solver_domain:z length can only be 1 or 2.')
-    else:
-        zz = np.arange(z1, z2 + 0.5 * delta, delta)
-
-    n_calc = len(zz) * len(params_dict['emitter_list'])
-    n_count = 0
-
-    for z in zz:
-        phi = np.zeros_like(xx)
-        for i, emitter in enumerate(params_dict['emitter_list']):
-            if QtCore_ProgressSignal:
-                QtCore_ProgressSignal.emit(n_count / n_calc * 100)
-            phi_ = solver_phi_2d(
-                emitter_xy1=(emitter['x'][0], emitter['y'][0]),
-                emitter_xy2=(emitter['x'][1], emitter['y'][1]),
-                emitter_z=emitter['z'],
-                xx=xx,
-                yy=yy,
-                z=z,
-            )
-            phi += phi_
-            if 'phi_dict' in emitter:
-                emitter['phi_dict'][f'{z:.3f}'] = phi_
-            else:
-                emitter['phi_dict'] = {f'{z:.3f}': phi_}
-            n_count += 1
-
-    if QtCore_ProgressSignal:
-        QtCore_ProgressSignal.emit(100)
-
-    # =============================
-    # calculate resultant heat flux
-    # =============================
-
-    for z in zz:
-        heat_flux = np.zeros_like(xx, dtype=np.float64)
-        for emitter in params_dict['emitter_list']:
-            heat_flux += emitter['heat_flux'] * emitter['phi_dict'][f'{z:.3f}']
-        if 'heat_flux_dict' in params_dict:
-            params_dict['heat_flux_dict'][f'{z:.3f}'] = heat_flux
-        else:
-            params_dict['heat_flux_dict'] = {f'{z:.3f}': heat_flux}
-
-    heat_flux = np.max(np.array([i for i in params_dict['heat_flux_dict'].values()]), axis=0)
-    heat_flux[heat_flux == 0] = -1
-    params_dict['heat_flux'] = heat_flux
-
-    # make plots
-    # main_plot(params_dict)
-
-    return params_dict
+    return _main(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+        delta_z=0.5,
+        phi_cache=phi_cache,
+    )
+
+
+def main_adaptive(params_dict: dict, critical_heat_flux: float = 12.6, QtCore_ProgressSignal=None):
+    """Solves the `critical_heat_flux` contour with an adaptive quadtree, cells of `solver_delta` are refined down to
+    `solver_delta_min` only where they straddle the critical heat flux, see `main_adaptive` in
+    `fse_thermal_radiation_2d`.
+
+    :param params_dict: see `main`, with additional optional `solver_delta_min`, default 0.05.
+    :param critical_heat_flux: the heat flux level to be resolved.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :return params_dict: the same as the input `params_dict` with `heat_flux_points`, `heat_flux_cells` and
+        `heat_flux_contour`.
+    """
+    return _main_adaptive(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        critical_heat_flux=critical_heat_flux,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+        delta_z=0.5,
+    )
+
+
+def main_rays(params_dict: dict, critical_heat_flux: float = 12.6, QtCore_ProgressSignal=None):
+    """Solves the distance at which heat flux falls to `critical_heat_flux` along rays or boundary segments, without
+    solving the full `solver_domain`, see `main_rays` in `fse_thermal_radiation_2d`.
+
+    :param params_dict: see `main`, with additional optional `ray_origin`, `ray_angles`, `ray_segments`, `ray_length`,
+        `ray_delta` and `ray_tolerance`.
+    :param critical_heat_flux: the heat flux level to be resolved.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :return params_dict: the same as the input `params_dict` with `ray_distance` and `ray_boundary`.
+    """
+    return _main_rays(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        critical_heat_flux=critical_heat_flux,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+        delta_z=0.5,
+    )
+
+
+def main_tiled(params_dict: dict, file_path: str, tile_size: int = 512, QtCore_ProgressSignal=None):
+    """Solves the maximum resultant heat flux tile by tile into a memory-mapped `.npy` file, interrupted runs resume
+    from the unsolved tiles, see `main_tiled` in `fse_thermal_radiation_2d`.
+
+    :param params_dict: see `main`.
+    :param file_path: path of the `.npy` file to write the heat flux to.
+    :param tile_size: number of receiver cells along each side of a tile.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :return params_dict: the same as the input `params_dict` with `heat_flux` as a memory-mapped array.
+    """
+    return _main_tiled(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        file_path=file_path,
+        tile_size=tile_size,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+        delta_z=0.5,
+    )
+
+
+def main_points(params_dict: dict, QtCore_ProgressSignal=None):
+    """Solves configuration factors and resultant heat flux at scattered (x, y, z) receiver points, see `main_points`
+    in `fse_thermal_radiation_2d`.
+
+    :param params_dict: see `main`, with `receiver_points` (n_points, 3) array of (x, y, z) in place of `solver_domain`.
+    :param QtCore_ProgressSignal: optional, a signal object with `emit` method, progress in percentage is emitted.
+    :return params_dict: the same as the input `params_dict` with `receiver_phi` (n_points, n_emitters) and
+        `receiver_heat_flux` (n_points,).
+    """
+    return _main_points(
+        params_dict=params_dict,
+        solver_phi_2d=solver_phi_2d,
+        QtCore_ProgressSignal=QtCore_ProgressSignal,
+    )
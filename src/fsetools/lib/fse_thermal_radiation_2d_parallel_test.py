@@ -1,6 +1,7 @@
 def test_solve_phi():
     import numpy as np
-    from .fse_thermal_radiation_2d_parallel import solver_phi_2d, phi_parallel_any_br187
+    from .fse_thermal_radiation import phi_parallel_any_br187
+    from .fse_thermal_radiation_2d_parallel import solver_phi_2d
     def helper_get_phi_at_specific_point(xx, yy, vv, x, y):
         v = vv[(np.isclose(xx, x)) & np.isclose(yy, y)]
         print('measured location and value', x, y, v, '.')
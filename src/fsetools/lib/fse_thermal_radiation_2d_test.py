@@ -0,0 +1,413 @@
+import copy
+
+import numpy as np
+
+
+class _ProgressSignal:
+    def __init__(self):
+        self.values = list()
+
+    def emit(self, v):
+        self.values.append(v)
+
+
+def _params_dict():
+    return dict(
+        emitter_list=[
+            dict(x=[-5, 0], y=[0, 0], z=[0, 2], heat_flux=100),
+            dict(x=[0, 5], y=[0, 0], z=[0, 4], heat_flux=80),
+            dict(x=[5, 5], y=[0, 3], z=[0, 3], heat_flux=60),
+        ],
+        solver_domain=dict(x=(-8, 8), y=(-1, 8), z=None),
+        solver_delta=.5,
+    )
+
+
+def test_main_processes():
+    from .fse_thermal_radiation_2d_parallel import main
+
+    progress_serial, progress_parallel = _ProgressSignal(), _ProgressSignal()
+
+    params_serial = main(_params_dict(), QtCore_ProgressSignal=progress_serial)
+    params_parallel = _params_dict()
+    params_parallel['solver_processes'] = 2
+    params_parallel = main(params_parallel, QtCore_ProgressSignal=progress_parallel)
+
+    # results are identical to the serial path
+    assert np.array_equal(params_serial['heat_flux'], params_parallel['heat_flux'])
+    for emitter_serial, emitter_parallel in zip(params_serial['emitter_list'], params_parallel['emitter_list']):
+        assert emitter_serial['phi_dict'].keys() == emitter_parallel['phi_dict'].keys()
+        for k in emitter_serial['phi_dict']:
+            assert np.array_equal(emitter_serial['phi_dict'][k], emitter_parallel['phi_dict'][k])
+
+    # progress is monotonic and completes at 100 %
+    for progress in (progress_serial, progress_parallel):
+        assert progress.values == sorted(progress.values)
+        assert progress.values[0] == 0
+        assert progress.values[-1] == 100
+
+
+def test_main_processes_perpendicular():
+    from .fse_thermal_radiation_2d_perpendicular import main
+
+    params_dict = _params_dict()
+    params_serial = main(copy.deepcopy(params_dict))
+    params_dict['solver_processes'] = 2
+    params_parallel = main(params_dict)
+
+    assert np.array_equal(params_serial['heat_flux'], params_parallel['heat_flux'])
+
+
+_SOLVED = list()
+_SOLVED_LIMIT = list()
+
+
+def _counted_solver_phi_2d(emitter_xy1, emitter_xy2, emitter_z, xx, yy, z):
+    from .fse_thermal_radiation_2d_parallel import solver_phi_2d
+    if _SOLVED_LIMIT and len(_SOLVED) >= _SOLVED_LIMIT[0]:
+        raise KeyboardInterrupt
+    _SOLVED.append((tuple(emitter_xy1), tuple(emitter_xy2), z, np.shape(xx)))
+    return solver_phi_2d(emitter_xy1=emitter_xy1, emitter_xy2=emitter_xy2, emitter_z=emitter_z, xx=xx, yy=yy, z=z)
+
+
+def test_main_phi_cache():
+    from .fse_thermal_radiation_2d import main
+
+    # first run solves all emitters
+    _SOLVED.clear()
+    params_dict = main(_params_dict(), solver_phi_2d=_counted_solver_phi_2d)
+    n_z = len(params_dict['emitter_list'][0]['phi_dict'])
+    assert len(_SOLVED) == 3 * n_z
+
+    # nudge one emitter and change heat flux of another, only the nudged emitter is solved
+    _SOLVED.clear()
+    params_dict['emitter_list'][1]['x'] = [0.5, 5]
+    params_dict['emitter_list'][2]['heat_flux'] = 30
+    params_dict = main(params_dict, solver_phi_2d=_counted_solver_phi_2d)
+    assert len(_SOLVED) == n_z
+    assert all(i[0] == (0.5, 0) for i in _SOLVED)
+
+    # results are the same as a fresh run
+    params_dict_ = _params_dict()
+    params_dict_['emitter_list'][1]['x'] = [0.5, 5]
+    params_dict_['emitter_list'][2]['heat_flux'] = 30
+    params_dict_ = main(params_dict_, solver_phi_2d=_counted_solver_phi_2d)
+    assert np.array_equal(params_dict['heat_flux'], params_dict_['heat_flux'])
+
+    # a shared `phi_cache` serves fresh `params_dict` objects
+    phi_cache = dict()
+    main(_params_dict(), solver_phi_2d=_counted_solver_phi_2d, phi_cache=phi_cache)
+    _SOLVED.clear()
+    params_dict = _params_dict()
+    params_dict['emitter_list'][0]['z'] = [0, 3]
+    main(params_dict, solver_phi_2d=_counted_solver_phi_2d, phi_cache=phi_cache)
+    assert len(_SOLVED) == n_z
+    assert len(phi_cache) == 4
+
+    # float32 configuration factors in the cache are not served to a float64 run of the same geometry
+    phi_cache = dict()
+    params_dict = _params_dict()
+    params_dict['solver_dtype'] = 'float32'
+    main(params_dict, solver_phi_2d=_counted_solver_phi_2d, phi_cache=phi_cache)
+    params_dict = main(_params_dict(), solver_phi_2d=_counted_solver_phi_2d, phi_cache=phi_cache)
+    assert len(phi_cache) == 6
+    assert all(v.dtype == np.float64 for emitter in params_dict['emitter_list'] for v in emitter['phi_dict'].values())
+    params_dict_ = main(_params_dict(), solver_phi_2d=_counted_solver_phi_2d)
+    assert np.array_equal(params_dict['heat_flux'], params_dict_['heat_flux'])
+
+
+def test_main_phi_table():
+    from .fse_thermal_radiation_2d import main, clear_phi_tables
+
+    params_dict = _params_dict()
+    params_dict['emitter_list'] = [
+        dict(x=[-6, -4], y=[0, 0], z=[0, 2], heat_flux=100),
+        dict(x=[-1, 1], y=[0, 0], z=[0, 2], heat_flux=100),
+        dict(x=[4, 6], y=[0, 0], z=[0, 2], heat_flux=100),
+        dict(x=[7, 7], y=[1, 3], z=[0, 2], heat_flux=100),
+    ]
+    params_direct = main(copy.deepcopy(params_dict), solver_phi_2d=_counted_solver_phi_2d)
+
+    # emitters share the same size, one table per z-level is solved, the others are receivers in table cells solved
+    # exactly, i.e. touching the emitter edges or the emitter surface
+    clear_phi_tables()
+    _SOLVED.clear()
+    params_dict['solver_phi_table'] = 0.1
+    params_table = main(params_dict, solver_phi_2d=_counted_solver_phi_2d)
+    n_z = len(params_table['emitter_list'][0]['phi_dict'])
+    assert sum(len(i[3]) == 2 for i in _SOLVED) == n_z
+
+    # interpolated heat flux is within the estimated error bound, zero heat flux is flagged as -1
+    error = np.abs(np.maximum(params_table['heat_flux'], 0) - np.maximum(params_direct['heat_flux'], 0))
+    assert np.amax(error) < 1
+    assert np.all(error <= params_table['heat_flux_error'] + 1e-3)
+
+
+def test_main_phi_table_error_bound():
+    from .fse_thermal_radiation_2d import main, clear_phi_tables
+    from .fse_thermal_radiation_2d_parallel import solver_phi_2d
+
+    # receivers on the emitter ends and surfaces, e.g. (6, 0) is on the end of the third emitter and on the line of the
+    # first two, the table is coarser than the receiver grid
+    for solver_delta, solver_phi_table in ((0.25, 0.5), (0.1, 0.5), (0.1, 0.3)):
+        params_dict = _params_dict()
+        params_dict['solver_delta'] = solver_delta
+        params_direct = main(copy.deepcopy(params_dict), solver_phi_2d=solver_phi_2d)
+        clear_phi_tables()
+        params_dict['solver_phi_table'] = solver_phi_table
+        params_table = main(params_dict, solver_phi_2d=solver_phi_2d)
+
+        error = np.abs(np.maximum(params_table['heat_flux'], 0) - np.maximum(params_direct['heat_flux'], 0))
+        assert np.all(error <= params_table['heat_flux_error'] + 1e-6)
+
+
+def test_main_adaptive():
+    from .fse_thermal_radiation_2d import heat_flux_at_points
+    from .fse_thermal_radiation_2d_parallel import main_adaptive, solver_phi_2d
+
+    params_dict = _params_dict()
+    params_dict['solver_domain'] = dict(x=(-8, 8), y=(0.4, 8), z=None)
+    params_dict['solver_delta'] = 0.8
+    params_dict['solver_delta_min'] = 0.05
+    params_dict = main_adaptive(params_dict, critical_heat_flux=12.6)
+
+    # a fraction of the evaluations of a uniform 0.05 m grid
+    assert len(params_dict['heat_flux_points']) < 0.1 * 321 * 153
+
+    # contour is on the critical heat flux, apart from the emitter plane at x = 5 where heat flux is discontinuous
+    assert len(params_dict['heat_flux_contour']) == 1
+    xy = params_dict['heat_flux_contour'][0]
+    xy = xy[np.abs(xy[:, 0] - 5) > 0.2]
+    heat_flux = heat_flux_at_points(
+        params_dict['emitter_list'], xy[:, 0], xy[:, 1], np.arange(0, 4.1, 0.8), solver_phi_2d
+    )
+    assert np.amax(np.abs(heat_flux - 12.6)) < 0.1
+
+
+def test_main_rays():
+    from .fse_thermal_radiation_2d import heat_flux_at_points
+    from .fse_thermal_radiation_2d_parallel import main_rays, solver_phi_2d
+
+    params_dict = _params_dict()
+    params_dict.update(ray_origin=(0, 0.5), ray_angles=np.arange(10, 171, 10), ray_length=20)
+    params_dict = main_rays(params_dict, critical_heat_flux=12.6)
+
+    # boundary points are on the critical heat flux
+    assert not np.any(np.isnan(params_dict['ray_distance']))
+    xy = params_dict['ray_boundary']
+    heat_flux = heat_flux_at_points(params_dict['emitter_list'], xy[:, 0], xy[:, 1], np.arange(0, 4.1, .5), solver_phi_2d)
+    assert np.allclose(heat_flux, 12.6, atol=0.05)
+
+    # boundary segments are searched from their first to second point
+    params_dict_ = _params_dict()
+    params_dict_['ray_segments'] = [((0, 0.5), (0, 20.5)), ((-20, 7.5), (-15, 7.5)), ((0, 0.5), (0, 3.5))]
+    params_dict_ = main_rays(params_dict_, critical_heat_flux=12.6)
+    assert abs(params_dict_['ray_distance'][0] - params_dict['ray_distance'][8]) < 1e-2
+    assert np.isnan(params_dict_['ray_distance'][1])
+    assert params_dict_['ray_distance'][2] == 3
+
+
+def test_resultant_heat_flux_time_series():
+    from .fse_thermal_radiation_2d import resultant_heat_flux_time_series
+    from .fse_thermal_radiation_2d_parallel import main
+
+    params_dict = main(_params_dict())
+    heat_flux = np.array([[0, 50, 100], [0, 40, 80], [0, 30, 60]])
+
+    # the last time step is the same as `main` with the same emitter heat flux
+    heat_flux_time_series = resultant_heat_flux_time_series(params_dict, heat_flux)
+    assert heat_flux_time_series.shape == (*params_dict['heat_flux'].shape, 3)
+    assert np.allclose(heat_flux_time_series[:, :, 2], np.maximum(params_dict['heat_flux'], 0))
+    assert np.allclose(heat_flux_time_series[:, :, 1], 0.5 * heat_flux_time_series[:, :, 2])
+
+    # chunked results are the same, both from an array and from streamed chunks
+    for chunks in (
+            resultant_heat_flux_time_series(params_dict, heat_flux, chunk_size=2),
+            resultant_heat_flux_time_series(params_dict, (heat_flux[:, i:i + 1] for i in range(3))),
+    ):
+        heat_flux_time_series_ = np.zeros_like(heat_flux_time_series)
+        for i, v in chunks:
+            heat_flux_time_series_[:, :, i] = v
+        assert np.allclose(heat_flux_time_series_, heat_flux_time_series)
+
+
+def test_main_angled():
+    from .fse_thermal_radiation_2d_angled import main
+    from .fse_thermal_radiation_2d_parallel import main as main_parallel
+    from .fse_thermal_radiation_2d_perpendicular import main as main_perpendicular
+
+    # zero angle is the same as parallel
+    params_dict = _params_dict()
+    for emitter in params_dict['emitter_list']:
+        emitter['theta'] = 0
+    params_angled = main(copy.deepcopy(params_dict))
+    params_parallel = main_parallel(_params_dict())
+    assert np.allclose(params_angled['heat_flux'], params_parallel['heat_flux'], atol=1e-3)
+
+    # mixed emitter types are solved in one call, the same as solved separately
+    params_dict['emitter_list'][0].update(theta=np.pi / 4)
+    params_dict['emitter_list'][1].update(type='parallel')
+    params_dict['emitter_list'][2].update(type='perpendicular')
+
+    params_separate = list()
+    for main_, emitter in zip((main, main_parallel, main_perpendicular), params_dict['emitter_list']):
+        params_dict_ = copy.deepcopy(params_dict)
+        params_dict_['emitter_list'] = [dict(emitter, type=None)]
+        params_dict_['solver_domain']['z'] = (0, 4)
+        params_separate.append(main_(params_dict_))
+    params_dict['solver_domain']['z'] = (0, 4)
+    params_mixed = main(params_dict)
+    for z in params_mixed['heat_flux_dict']:
+        assert np.allclose(params_mixed['heat_flux_dict'][z], sum(i['heat_flux_dict'][z] for i in params_separate))
+
+
+def test_main_cull():
+    from .fse_thermal_radiation_2d import main
+
+    # a row of small emitters spread along a site
+    params_dict = dict(
+        emitter_list=[dict(x=[i, i + 1], y=[0, 0], z=[0, 1], heat_flux=100) for i in range(-40, 40, 4)],
+        solver_domain=dict(x=(-40, 40), y=(0.5, 10), z=None),
+        solver_delta=.5,
+    )
+    params_exact = main(copy.deepcopy(params_dict), solver_phi_2d=_counted_solver_phi_2d)
+
+    _SOLVED.clear()
+    params_dict['solver_cull_tolerance'] = 0.5
+    params_dict['solver_cull_tile'] = 8
+    params_cull = main(params_dict, solver_phi_2d=_counted_solver_phi_2d)
+    n_tile = int(np.ceil(161 / 8) * np.ceil(20 / 8))
+    n_z = len(params_cull['heat_flux_dict'])
+    assert len(_SOLVED) < 0.5 * n_tile * n_z * len(params_dict['emitter_list'])
+
+    # skipped heat flux is within the reported bound
+    error = np.maximum(params_exact['heat_flux'], 0) - np.maximum(params_cull['heat_flux'], 0)
+    assert np.all(error >= -1e-9)
+    assert np.all(error <= params_cull['heat_flux_cull_error'] + 1e-9)
+    assert 0 < np.amax(params_cull['heat_flux_cull_error']) < 12.6
+
+
+def test_main_store_phi():
+    from .fse_thermal_radiation_2d_parallel import main
+
+    params_full = main(_params_dict())
+
+    # running maximum only, the same heat flux and z-level of the maximum
+    params_dict = _params_dict()
+    params_dict['solver_store_phi'] = False
+    params_lean = main(params_dict)
+    assert 'heat_flux_dict' not in params_lean
+    assert all('phi_dict' not in emitter for emitter in params_lean['emitter_list'])
+    assert np.allclose(params_lean['heat_flux'], params_full['heat_flux'])
+    assert np.array_equal(params_lean['heat_flux_z'], params_full['heat_flux_z'])
+    z_max = np.array([float(z) for z in params_full['heat_flux_dict']])[
+        np.argmax(np.array(list(params_full['heat_flux_dict'].values())), axis=0)
+    ]
+    assert np.array_equal(params_full['heat_flux_z'], z_max)
+
+    # single precision
+    params_dict['solver_dtype'] = 'float32'
+    params_lean = main(params_dict)
+    assert params_lean['heat_flux'].dtype == np.float32
+    assert np.allclose(params_lean['heat_flux'], params_full['heat_flux'], rtol=1e-5)
+
+
+def test_main_tiled():
+    import os
+    import tempfile
+    from .fse_thermal_radiation_2d import main, main_tiled
+
+    params_full = main(_params_dict(), solver_phi_2d=_counted_solver_phi_2d)
+
+    with tempfile.TemporaryDirectory() as dir_temp:
+        file_path = os.path.join(dir_temp, 'heat_flux.npy')
+
+        # interrupt the run part way through the 3rd of 5 x 3 tiles
+        n_z = len(params_full['heat_flux_dict'])
+        _SOLVED.clear()
+        _SOLVED_LIMIT.append(3 * n_z * 2 + 1)
+        try:
+            main_tiled(_params_dict(), solver_phi_2d=_counted_solver_phi_2d, file_path=file_path, tile_size=8)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            _SOLVED_LIMIT.clear()
+
+        # resumed from the unsolved tiles
+        _SOLVED.clear()
+        params_tiled = main_tiled(_params_dict(), solver_phi_2d=_counted_solver_phi_2d, file_path=file_path, tile_size=8)
+        assert len(_SOLVED) == 3 * n_z * 13
+        assert np.allclose(params_tiled['heat_flux'], params_full['heat_flux'])
+        assert np.allclose(np.load(file_path), params_full['heat_flux'])
+
+        # nothing is solved again for the same inputs, all tiles are solved again for changed inputs
+        _SOLVED.clear()
+        main_tiled(_params_dict(), solver_phi_2d=_counted_solver_phi_2d, file_path=file_path, tile_size=8)
+        assert len(_SOLVED) == 0
+        params_dict = _params_dict()
+        params_dict['emitter_list'][0]['heat_flux'] = 90
+        main_tiled(params_dict, solver_phi_2d=_counted_solver_phi_2d, file_path=file_path, tile_size=8)
+        assert len(_SOLVED) == 3 * n_z * 15
+        del params_tiled
+
+
+def test_main_points():
+    from .fse_thermal_radiation_2d import solver_domain_meshgrid
+    from .fse_thermal_radiation_2d_parallel import main, main_points
+
+    params_dict = _params_dict()
+    params_dict['emitter_list'][2]['type'] = 'perpendicular'
+    params_grid = main(copy.deepcopy(params_dict))
+    xx, yy = solver_domain_meshgrid(params_grid)
+
+    # scattered receivers at grid points, each at its own z-level
+    rng = np.random.default_rng(0)
+    i, j = rng.integers(0, xx.shape[1], 50), rng.integers(0, xx.shape[0], 50)
+    zz = np.array(list(params_grid['heat_flux_dict']))
+    z = zz[rng.integers(0, len(zz), 50)]
+    params_dict['receiver_points'] = np.column_stack([xx[j, i], yy[j, i], z.astype(float)])
+    params_points = main_points(params_dict)
+
+    assert params_points['receiver_phi'].shape == (50, 3)
+    assert np.allclose(
+        params_points['receiver_heat_flux'],
+        [params_grid['heat_flux_dict'][z_][j_, i_] for z_, j_, i_ in zip(z, j, i)]
+    )
+
+
+def test_main_mask():
+    from .fse_thermal_radiation_2d_parallel import main
+
+    params_full = main(_params_dict())
+
+    # receivers within building footprints are excluded, others are unchanged
+    params_dict = _params_dict()
+    params_dict['solver_mask'] = [[(-4, 2), (-1, 2), (-1, 5), (-4, 5)], [(1, 1), (4, 1), (2.5, 6)]]
+    params_mask = main(params_dict)
+    is_masked = params_mask['heat_flux_mask']
+    assert 0 < np.sum(is_masked) < is_masked.size
+    assert np.all(np.isnan(params_mask['heat_flux'][is_masked]))
+    assert np.array_equal(params_mask['heat_flux'][~is_masked], params_full['heat_flux'][~is_masked])
+
+    # the same with culled emitters
+    params_dict = _params_dict()
+    params_dict.update(solver_mask=params_mask['solver_mask'], solver_cull_tolerance=1e-9, solver_cull_tile=4)
+    params_cull = main(params_dict)
+    assert np.allclose(params_cull['heat_flux'], params_mask['heat_flux'], equal_nan=True)
+
+
+if __name__ == '__main__':
+    test_main_processes()
+    test_main_processes_perpendicular()
+    test_main_phi_cache()
+    test_main_phi_table()
+    test_main_phi_table_error_bound()
+    test_main_adaptive()
+    test_main_rays()
+    test_resultant_heat_flux_time_series()
+    test_main_angled()
+    test_main_cull()
+    test_main_store_phi()
+    test_main_tiled()
+    test_main_points()
+    test_main_mask()
@@ -48,3 +48,20 @@ def _test_phi_perpendicular_any_br187():
     # check receiver fall outside, side ways
     assert abs(phi_perpendicular_any_br187(10, 10, 5, -10, 10) - 0.04517433814) < 1e-8
     assert abs(phi_perpendicular_any_br187(10, 10, 5, 20, 10) - 0.04517433814) < 1e-8
+
+
+def test_phi_any_br187_array():
+    import numpy as np
+
+    # receiver at corner, on edge, within and outside the emitter, the same cases as the scalar tests
+    w = np.array([0, 0, 10, 10, 2, 2, 0, 10, 5, 2, 5, 5, 15, -5, 20, 20, -10, -10])
+    h = np.array([0, 10, 10, 0, 0, 10, 2, 2, 5, 2, 15, -5, 5, 5, 15, -5, -5, 15])
+
+    phi = phi_parallel_any_br187_array(10, 10, w, h, 10)
+    assert np.allclose(phi, [phi_parallel_any_br187(10, 10, w_, h_, 10) for w_, h_ in zip(w, h)], atol=1e-12)
+
+    phi = phi_perpendicular_any_br187_array(10, 10, w, h, 10)
+    assert np.allclose(phi, [phi_perpendicular_any_br187(10, 10, w_, h_, 10) for w_, h_ in zip(w, h)], atol=1e-12)
+
+    # receiver on or behind the emitter plane
+    assert np.all(phi_parallel_any_br187_array(10, 10, 5, 5, np.array([0, -1])) == 0)
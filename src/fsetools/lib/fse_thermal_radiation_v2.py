@@ -1,8 +1,8 @@
 import numpy as np
 
-__all__ = 'phi_solver', 'phi_angled_any_en_1_converted',
+__all__ = 'phi_solver', 'phi_solver_batch', 'phi_angled_any_en_1_converted',
 
-from ..etc.solver import linear_solver
+from ..etc.solver import linear_solver, linear_solver_batch
 
 
 def phi_angled_corner_en_1(w: float, h: float, theta: float, s: float):
@@ -28,77 +28,50 @@ def phi_angled_any_en_1(W, H, w, h, theta, S):
     :param h: receiver vertical location to the conner
     :param theta: angle between the receiver plane and emitter plane
     :param S: separation between the corner to the receiver
-    :return Phi: view factor
+    :return Phi: view factor, all parameters are broadcast against each other
     """
-    # print(f'W={W:<10.2f}, H={H:<10.2f}, w={w:<10.2f}, h={h:<10.2f}, theta={theta:<10.2f}, S={S:<10.2f}')
-
-    if w < 0:
-        # no part of the emitter visible to receiver
-        return 0
-
-    if h < 0:
-        # take it symmetrical
-        h = H - h
-    if h == H:
-        # at the corner, effectively h = 0, e.g., symmetrical
-        h = 0
-
-    if h == 0:
-        # at corner
-        # just one emitter
-        return phi_angled_variable_W(W=W, H=H, w=w, h=h, S=S, theta=theta)
-
-    elif 0 < h < H:
-        # within the edge/rect
-        # the emitter split into two emitters, both are positive
-        Phi_1 = phi_angled_variable_W(W=W, H=H - h, w=w, h=0, S=S, theta=theta)
-        Phi_2 = phi_angled_variable_W(W=W, H=h, w=w, h=0, S=S, theta=theta)
-        return Phi_1 + Phi_2
-
-    elif H < h:
-        # outside the edge/rect
-        # the emitter will be split into two, one large positive emitter and one smaller negative emitter
-        Phi_1 = phi_angled_variable_W(W=W, H=h, w=w, h=0, S=S, theta=theta)
-        Phi_2 = -phi_angled_variable_W(W=W, H=h - H, w=w, h=0, S=S, theta=theta)
-        return Phi_1 + Phi_2
-
-    else:
-        raise ValueError()
+    W, H, w, h, theta, S = np.broadcast_arrays(*[np.asarray(i, dtype=np.float64) for i in (W, H, w, h, theta, S)])
+
+    # take it symmetrical
+    h = np.where(h < 0, H - h, h)
+
+    # the emitter is split at the receiver level into two emitters, both are positive when the receiver is within the
+    # edge/rect, otherwise one large positive emitter and one smaller negative emitter. at the corner, i.e. h = 0 or
+    # h = H, the emitter of zero height has no contribution.
+    Phi = (
+            np.sign(H - h) * phi_angled_variable_W(W=W, H=np.abs(H - h), w=w, h=0, S=S, theta=theta) +
+            phi_angled_variable_W(W=W, H=h, w=w, h=0, S=S, theta=theta)
+    )
+
+    # no part of the emitter visible to receiver
+    Phi = np.where(w < 0, 0., Phi)
+
+    return Phi[()]
 
 
 def phi_angled_any_en_1_converted(W, H, w, h, theta, S):
-    if isinstance(theta, np.ndarray):
-        theta[(theta < 1e-5) | (theta > 0)] = 1e-5
-        theta[(theta > -1e-5) | (theta < 0)] = 1e-5
-    else:
-        if 1e-5 > theta >= 0:
-            theta = 1e-5
-        elif -1e-5 < theta <= 0:
-            theta = -1e-5
+    # nudge theta away from 0 to avoid division by zero in `map_var_to_en_1`, without changing the input array
+    theta = np.asarray(theta, dtype=np.float64)
+    theta = np.where((0 <= theta) & (theta < 1e-5), 1e-5, theta)
+    theta = np.where((-1e-5 < theta) & (theta < 0), -1e-5, theta)
 
-    return phi_angled_any_en_1(**map_var_to_en_1(W=W, H=H, w=w, h=h, theta=theta, S=S))
+    return phi_angled_any_en_1(**map_var_to_en_1(W=W, H=H, w=w, h=h, theta=theta[()], S=S))
 
 
-def phi_angled_variable_W(W, H, w, h, theta, S) -> float:
+def phi_angled_variable_W(W, H, w, h, theta, S):
     # this function only deals with H=h or h=0
-    assert H == h or h == 0
+    if np.any((H != h) & (h != 0)):
+        raise ValueError('`h` can only be 0 or equal to `H`.')
 
-    if W > w:
-        # part of the emitter will be invisible to the receiver, ignore this part
-        W = w
+    # part of the emitter will be invisible to the receiver, ignore this part
+    W = np.minimum(W, w)
 
-    if W == w:
-        # receiver at the emitter corner
-        return phi_angled_corner_en_1(w=W, h=H, s=S, theta=theta)
+    # the receiver split into two, a larger positive emitter and a smaller negative emitter, the negative emitter has
+    # zero width and no contribution when the receiver is at the emitter corner
+    Phi_1 = phi_angled_corner_en_1(w=w, h=H, s=S, theta=theta)
+    Phi_2 = -phi_angled_corner_en_1(w=w - W, h=H, s=S, theta=theta)
 
-    elif W < w:
-        # receiver away from the emitter edge
-        # the receiver split into two, a larger positive emitter and a smaller negative emitter
-        Phi_1 = phi_angled_corner_en_1(w=w, h=H, s=S, theta=theta)
-        Phi_2 = -phi_angled_corner_en_1(w=w - W, h=H, s=S, theta=theta)
-        return Phi_1 + Phi_2
-    else:
-        raise ValueError()
+    return Phi_1 + Phi_2
 
 
 def phi_solver(W: float, H: float, w: float, h: float, theta: float, Q: float, Q_a: float, S=None, UA=None):
@@ -157,6 +130,69 @@ def phi_solver(W: float, H: float, w: float, h: float, theta: float, Q: float, Q
     return phi_solved, q_solved, S_solved, UA_solved
 
 
+def phi_solver_batch(W, H, w, h, theta, Q, Q_a, S=None, UA=None) -> tuple:
+    """Vectorised `phi_solver`, solves many openings simultaneously, all parameters are broadcast against each other.
+
+    Unprotected area is solved when `S` is provided, otherwise separation distance is solved for `UA` by bracketed
+    bisection of all openings at once, see `linear_solver_batch`. Failures are reported by status codes rather than
+    raised.
+
+    :param W: width of emitter.
+    :param H: height of emitter.
+    :param w: receiver horizontal location.
+    :param h: receiver vertical location.
+    :param theta: angle between the receiver plane and emitter plane.
+    :param Q: emitter heat flux.
+    :param Q_a: acceptable receiver heat flux.
+    :param S: separation distance, provide to solve unprotected area.
+    :param UA: unprotected area in ratio, provide to solve separation distance.
+    :return (phi, q, S, UA, status): arrays of solved configuration factor, receiver heat flux, separation distance and
+        unprotected area, the input `S` or `UA` is returned as provided. Status codes are
+            0   solved.
+            1   separation distance at its lower limit 0.001.
+            2   separation distance at its upper limit 10000.
+            3   separation distance not converged, nan is returned.
+    """
+    W, H, w, h, theta, Q, Q_a = np.broadcast_arrays(
+        *[np.asarray(i, dtype=np.float64) for i in (W, H, w, h, theta, Q, Q_a, S if S is not None else UA)]
+    )[:-1]
+    shape = W.shape
+
+    if S is not None:  # to calculate maximum unprotected area
+        S = np.broadcast_to(np.asarray(S, dtype=np.float64), shape)
+        phi_solved = phi_angled_any_en_1_converted(W=W, H=H, w=w, h=h, theta=theta, S=S)
+        q_solved = Q * phi_solved
+        with np.errstate(divide='ignore', invalid='ignore'):
+            UA_solved = np.where(q_solved == 0, 1., np.clip(Q_a / q_solved, 0, 1))
+        return phi_solved, q_solved * UA_solved, S, UA_solved, np.zeros(shape, dtype=int)
+
+    # to calculate minimum separation distance to boundary
+    UA = np.broadcast_to(np.asarray(UA, dtype=np.float64), shape)
+    phi_target = Q_a / (Q * UA)
+    W_, H_, w_, h_, theta_ = [np.ravel(i) for i in (W, H, w, h, theta)]
+
+    S_solved, status = linear_solver_batch(
+        func=lambda S_, i: phi_angled_any_en_1_converted(
+            W=W_[i], H=H_[i], w=w_[i], h=h_[i], theta=theta_[i], S=S_
+        ),
+        y_target=phi_target - 0.0001,
+        x_upper=10000,
+        x_lower=0.001,
+        y_tol=0.0001,
+        iter_max=1000,
+        func_multiplier=-1,
+    )
+    phi_solved = phi_angled_any_en_1_converted(W=W, H=H, w=w, h=h, theta=theta, S=S_solved)
+
+    # configuration factor greater than 1 is not achievable, receiver is at the boundary
+    is_touching = phi_target > 1
+    S_solved = np.where(is_touching, 0., S_solved)
+    phi_solved = np.where(is_touching, np.nan, phi_solved)
+    status = np.where(is_touching, 0, status)
+
+    return phi_solved, np.where(is_touching, Q * UA, Q * phi_solved * UA), S_solved, UA, status
+
+
 def map_var_to_en_1(W, H, w, h, theta, S):
     """Map tool variable to bs en 1991-1-2 correlation
 
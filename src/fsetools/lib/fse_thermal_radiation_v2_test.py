@@ -1,6 +1,6 @@
 import numpy as np
 
-from .fse_thermal_radiation_v2 import phi_angled_any_en_1_converted
+from .fse_thermal_radiation_v2 import phi_angled_any_en_1_converted, phi_solver, phi_solver_batch
 
 
 def _test_phi_parallel_any_br187():
@@ -51,6 +51,52 @@ def _test_phi_perpendicular_any_br187():
     assert abs(phi_angled_any_en_1_converted(10, 10, 5, 20, 0, 10) - 0.04517433814) < 1e-5
 
 
+def test_phi_angled_any_en_1_converted_array():
+    # receiver at corner, on edge, within and outside the emitter, parallel emitter, evaluated in one call
+    w = np.array([0, 0, 10, 10, 2, 2, 0, 10, 5, 2, 5, 5, 15, -5, 20, 20, -10, -10])
+    h = np.array([0, 10, 10, 0, 0, 10, 2, 2, 5, 2, 15, -5, 5, 5, 15, -5, -5, 15])
+    theta = np.zeros_like(w, dtype=float)
+    phi = phi_angled_any_en_1_converted(10, 10, w, h, theta, 10)
+    assert np.allclose(phi, [
+        0.1385316060, 0.1385316060, 0.1385316060, 0.1385316060,
+        0.1638694545, 0.1638694545, 0.1638694545, 0.1638694545,
+        0.2394564705, 0.1954523349,
+        0.0843536644, 0.0843536644, 0.0843536644, 0.0843536644,
+        0.0195607021, 0.0195607021, 0.0195607021, 0.0195607021,
+    ], atol=1e-5)
+
+    # input theta is not changed
+    assert np.all(theta == 0)
+
+    # receiver grid in one call is the same as element-wise
+    ww, SS = np.meshgrid(np.linspace(-2, 12, 8), np.linspace(0.5, 10, 5))
+    phi = phi_angled_any_en_1_converted(10, 3, ww, 1, np.pi / 3, SS)
+    assert phi.shape == ww.shape
+    for phi_, w_, S_ in zip(phi.ravel(), ww.ravel(), SS.ravel()):
+        assert phi_ == phi_angled_any_en_1_converted(10, 3, w_, 1, np.pi / 3, S_)
+
+
+def test_phi_solver_batch():
+    W, H = np.array([10, 5, 3, 8]), np.array([3, 2, 3, 4])
+    w, h = np.array([5, 2.5, 0, 4]), np.array([1.5, 1, 0, 8])
+    theta = np.array([np.pi / 2, np.pi / 3, np.pi / 4, 1e-6])
+
+    # solve separation distance
+    phi, q, S, UA, status = phi_solver_batch(W=W, H=H, w=w, h=h, theta=theta, Q=84, Q_a=12.6, UA=np.array([.5, .2, 1, 3]))
+    for i in range(4):
+        phi_, q_, S_, UA_ = phi_solver(W=W[i], H=H[i], w=w[i], h=h[i], theta=theta[i], Q=84, Q_a=12.6, UA=[.5, .2, 1, 3][i])
+        assert S[i] == S_
+        assert np.isnan(phi[i]) if np.isnan(phi_) else phi[i] == phi_
+    # the second and fourth are solved at the lower limit of separation distance
+    assert np.all(status == [0, 1, 0, 1])
+
+    # solve unprotected area
+    phi, q, S, UA, status = phi_solver_batch(W=W, H=H, w=w, h=h, theta=theta, Q=84, Q_a=12.6, S=np.array([3, 1, 2, 5]))
+    for i in range(4):
+        phi_, q_, S_, UA_ = phi_solver(W=W[i], H=H[i], w=w[i], h=h[i], theta=theta[i], Q=84, Q_a=12.6, S=[3, 1, 2, 5][i])
+        assert UA[i] == UA_ and q[i] == q_
+
+
 if __name__ == '__main__':
     # _test_phi_parallel_any_br187()
     phi_angled_any_en_1_converted(np.linspace(1, 10, 10), 10, -10, 15, 0, 10)
@@ -25,6 +25,29 @@ def test_2():
     fig.show()
 
 
+def test_time_height_grid():
+    # heat release rate time history x heights, including zero heat release rate at t=0
+    Q_dot_conv_kW = np.linspace(0, 2000, 41)
+    z = np.linspace(0.1, 10, 50)
+
+    region = fire_plume_region(Q_dot_conv_kW[:, np.newaxis], z[np.newaxis, :])
+    delta_T = fire_plume_temperature_rise_centreline(Q_dot_conv_kW[:, np.newaxis], z[np.newaxis, :])
+    d = plume_diameter_visible(Q_dot_conv_kW[1:, np.newaxis], 500, z[np.newaxis, :], delta_T[1:] + 293.15)
+    assert region.shape == delta_T.shape == (41, 50)
+    assert d.shape == (40, 50)
+    assert np.all(delta_T[0] == 0)
+
+    # the same as scalar calls
+    for i in range(1, 41, 7):
+        for j in range(0, 50, 7):
+            region_ = fire_plume_region(Q_dot_conv_kW[i], z[j])
+            delta_T_ = fire_plume_temperature_rise_centreline(Q_dot_conv_kW[i], z[j], region_)
+            assert region[i, j] == region_
+            assert abs(delta_T[i, j] - delta_T_) < 1e-9
+            assert abs(d[i - 1, j] - plume_diameter_visible(Q_dot_conv_kW[i], 500, z[j], delta_T_ + 293.15)) < 1e-9
+
+
 if __name__ == '__main__':
     test_1()
     test_2()
+    test_time_height_grid()
@@ -12,6 +12,10 @@ Clause 1.6 in EC 1991-1-2:2002 unless otherwise specified in comments. :code:`SI
 
 `SYMBOLS` is dict object containing dict(variable_name=list(unit, description), ...).
 
+Clause functions return a dict containing results and `_latex`, a list of step-by-step LaTeX equations. Pass
+`compute_only=True` to skip building `_latex` where no report is wanted, e.g. in batch assessments, results are the same
+but without `_latex`.
+
 Fire load densities :code:`q_f_k` [MJ/m**2] for different occupancies as per Table E.4 in BS EN 1991-1-2:2002, page 50.
 
 | Occupancy Average        | Average | 80 % fractile* |
@@ -81,6 +85,7 @@ def clause_1_6_Omega(
         A_v: float,
         q_fd: float,
         *_,
+        compute_only: bool = False,
         **__
 ):
     """
@@ -96,6 +101,9 @@ def clause_1_6_Omega(
     :return:
     """
     Omega = A_f * q_fd / (A_v * A_t) ** 0.5
+    if compute_only:
+        return dict(Omega=Omega)
+
     _latex = [
         '\\Omega = \\frac{A_f \\cdot q_{fd}} {\\sqrt{A_v \\cdot A_t}}',
         f'\\Omega = \\frac{{{A_f:.2f}\\cdot {q_fd:.2f}}} {{\\sqrt{{{A_v:.2f}\\cdot {A_t:.2f}}}}}',
@@ -108,6 +116,7 @@ def clause_b_2_2_DW_ratio(
         W_1,
         W_2,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """
@@ -121,6 +130,9 @@ def clause_b_2_2_DW_ratio(
     """
     DW_ratio = W_2 / W_1
 
+    if compute_only:
+        return dict(DW_ratio=DW_ratio)
+
     _latex = [
         f'{{DW}}_{{ratio}} = \n'
         f'\\begin{{dcases}}\n'
@@ -142,6 +154,7 @@ def clause_b_2_3_DW_ratio(
         A_v1,
         A_v,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """
@@ -157,6 +170,9 @@ def clause_b_2_3_DW_ratio(
     """
     # equation B.2
     DW_ratio = (W_2 / W_1) * (A_v1 / A_v)
+    if compute_only:
+        return dict(DW_ratio=DW_ratio)
+
     _latex = [
         f'{{DW}}_{{ratio}} = \n'
         f'\\begin{{dcases}}\n'
@@ -180,6 +196,7 @@ def clause_b_2_4_DW_ratio(
         A_v1,
         A_v,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """
@@ -197,6 +214,9 @@ def clause_b_2_4_DW_ratio(
     """
     DW_ratio = ((W_2 - L_c) * A_v1) / ((W_1 - W_c) * A_v)
 
+    if compute_only:
+        return dict(DW_ratio=DW_ratio)
+
     _latex = [
         f'{{DW}}_{{ratio}} = \n'
         f'\\begin{{dcases}}\n'
@@ -221,6 +241,7 @@ def clause_b_4_1_1_Q(
         h_eq,
         DW_ratio,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """
@@ -240,6 +261,9 @@ def clause_b_4_1_1_Q(
     a = (A_f * q_fd) / tau_F
     b = 3.15 * (1 - e ** (-0.036 / O)) * A_v * (h_eq / (DW_ratio)) ** 0.5
     Q = min(a, b)
+    if compute_only:
+        return dict(Q=Q)
+
     _latex = [
         'Q=\\operatorname{min}\\left(\\frac{A_f\\cdot q_{fd}}{\\tau_F}, 3.15\\left(1-e^{\\frac{-0.036}{O}}\\right) A_v {\\left(\\frac{h_{eq}}{\\frac{D}{W}}\\right)}^{0.5}\\right)',
         f'Q=\\operatorname{{min}}\\left(\\frac{{{A_f:.2f}\\cdot {q_fd:.2f}}}{{{tau_F:.2f}}}, 3.15\\left(1-e^{{\\frac{{-0.036}}{{{O:.2f}}}}}\\right) {A_v:.2f} {{\\left(\\frac{{{h_eq:.2f}}}{{{DW_ratio:.2f}}}\\right)}}^{{0.5}}\\right)',
@@ -254,6 +278,7 @@ def clause_b_4_1_2_T_f(
         Omega,
         T_0: float = 293.15,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """
@@ -272,6 +297,9 @@ def clause_b_4_1_2_T_f(
     d = T_0
     T_f = a * b * c + d
 
+    if compute_only:
+        return dict(T_f=T_f)
+
     _latex = [
         'T_f=6000\\left(1-e^{\\frac{-0.1}{O}}\\right) O^{0.5} \\left(1-e^{-0.00286\\Omega}\\right) + T_0',
         f'T_f=6000\\left(1-e^{{\\frac{{-0.1}}{{{O:.2f}}}}}\\right) {O:.2f}^{{0.5}} \\left(1-e^{{-0.00286\\cdot {Omega:.2f}}}\\right) + {T_0:.2f}',
@@ -284,10 +312,14 @@ def clause_b_4_1_2_T_f(
 def clause_b_4_1_3_d_f(
         h_eq,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # Figure B.2, page 35
     d_f = 2 / 3 * h_eq
+    if compute_only:
+        return dict(d_f=d_f)
+
     _latex = [
         'd_f=\\frac{2}{3} h_{eq}',
         f'd_f=\\frac{{2}}{{3}} {h_eq:.2f}',
@@ -303,6 +335,7 @@ def clause_b_4_1_3_L_L(
         rho_g=0.45,
         g=9.81,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # Equation B.6, page 35
@@ -310,6 +343,9 @@ def clause_b_4_1_3_L_L(
     b = h_eq * (2.37 * b_ ** (2 / 3) - 1)
     L_L = max(0, b)
 
+    if compute_only:
+        return dict(L_L=L_L)
+
     _latex = [
         'L_L=\\operatorname{max}\\left(0, h_{eq} \\left(2.37{\\left(\\frac{Q}{A_v \\rho_g {\\left(h_{eq} g\\right)}^{0.5}}\\right)}^{\\frac{2}{3}}-1\\right)\\right)',
         f'L_L=\\operatorname{{max}}\\left(0, {h_eq:.2f} \\left(2.37{{\\left(\\frac{{{Q:.2f}}}{{{A_v:.2f}\\cdot {rho_g:.2f} {{\\left({h_eq:.2f}\\cdot {g:.2f}\\right)}}^{{0.5}}}}\\right)}}^{{\\frac{{2}}{{3}}}}-1\\right)\\right)',
@@ -326,51 +362,59 @@ def clause_b_4_1_6_L_H(
         d_ow: float = None,
         is_wall_above_opening: bool = True,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     if d_ow is None:
         d_ow = 9999999
 
-    _latex = [
-        f'L_H = '
-        f'\\begin{{dcases}}'
-        f'\\frac{{1}}{{3}}\\cdot h_{{eq}},                                                  & \\text{{if }} h_{{eq}}\\leq 1.25\\cdot w_t\\ \\left[{is_wall_above_opening and h_eq <= 1.25 * w_t}\\right]\\\\'
-        f'0.3\\cdot h_{{eq}}\\cdot {{\\left(\\frac{{h_{{eq}}}}{{w_t}}\\right)}}^{{0.54}},       & \\text{{if }} h_{{eq}}>1.25\\cdot w_t \\text{{ and }} d_{{ow}}>4\\cdot w_t\\ \\left[{is_wall_above_opening and h_eq > 1.25 * w_t and d_ow is not None and d_ow > 4 * w_t}\\right]\\\\'
-        f'0.454\\cdot h_{{eq}}\\cdot {{\\left(\\frac{{h_{{eq}}}}{{2w_t}}\\right)}}^{{0.54}},    & \\text{{otherwise if wall exist above window}}\\ \\left[{is_wall_above_opening and h_eq > 1.25 * w_t and d_ow is not None and not d_ow > 4 * w_t}\\right]\\\\'
-        f'0.6\\cdot h_{{eq}}\\cdot \\left(\\frac{{L_L}}{{h_{{eq}}}}\\right)^\\frac{{1}}{{3}},    & \\text{{if no wall exist above window}}\\ \\left[{not is_wall_above_opening}\\right]\\\\'
-        f'\\end{{dcases}}'
-    ]
+    if not compute_only:
+        _latex = [
+            f'L_H = '
+            f'\\begin{{dcases}}'
+            f'\\frac{{1}}{{3}}\\cdot h_{{eq}},                                                  & \\text{{if }} h_{{eq}}\\leq 1.25\\cdot w_t\\ \\left[{is_wall_above_opening and h_eq <= 1.25 * w_t}\\right]\\\\'
+            f'0.3\\cdot h_{{eq}}\\cdot {{\\left(\\frac{{h_{{eq}}}}{{w_t}}\\right)}}^{{0.54}},       & \\text{{if }} h_{{eq}}>1.25\\cdot w_t \\text{{ and }} d_{{ow}}>4\\cdot w_t\\ \\left[{is_wall_above_opening and h_eq > 1.25 * w_t and d_ow is not None and d_ow > 4 * w_t}\\right]\\\\'
+            f'0.454\\cdot h_{{eq}}\\cdot {{\\left(\\frac{{h_{{eq}}}}{{2w_t}}\\right)}}^{{0.54}},    & \\text{{otherwise if wall exist above window}}\\ \\left[{is_wall_above_opening and h_eq > 1.25 * w_t and d_ow is not None and not d_ow > 4 * w_t}\\right]\\\\'
+            f'0.6\\cdot h_{{eq}}\\cdot \\left(\\frac{{L_L}}{{h_{{eq}}}}\\right)^\\frac{{1}}{{3}},    & \\text{{if no wall exist above window}}\\ \\left[{not is_wall_above_opening}\\right]\\\\'
+            f'\\end{{dcases}}'
+        ]
 
     if is_wall_above_opening is True:
         if h_eq <= 1.25 * w_t:
             # Equation B.8, page 36
             L_H = h_eq / 3
-            _latex.extend([
-                'L_H=\\frac{{1}}{3}\\cdot h_{eq}',
-                f'L_H=\\frac{{1}}{{3}}\\cdot {h_eq:.2f}',
-                f'L_H={L_H:.2f}\\ \\left[m\\right]',
-            ])
+            if not compute_only:
+                _latex.extend([
+                    'L_H=\\frac{{1}}{3}\\cdot h_{eq}',
+                    f'L_H=\\frac{{1}}{{3}}\\cdot {h_eq:.2f}',
+                    f'L_H={L_H:.2f}\\ \\left[m\\right]',
+                ])
         elif h_eq > 1.25 * w_t and d_ow > 4 * w_t:
             # Equation B.9, page 36
             L_H = 0.3 * h_eq * (h_eq / w_t) ** 0.54
-            _latex.extend([
-                f'L_H=0.3\\cdot {h_eq:.2f} {{\\left(\\frac{{{h_eq:.2f}}}{{{w_t:.2f}}}\\right)}}^{{0.54}}',
-                f'L_H={L_H:.2f}\\ \\left[m\\right]',
-            ])
+            if not compute_only:
+                _latex.extend([
+                    f'L_H=0.3\\cdot {h_eq:.2f} {{\\left(\\frac{{{h_eq:.2f}}}{{{w_t:.2f}}}\\right)}}^{{0.54}}',
+                    f'L_H={L_H:.2f}\\ \\left[m\\right]',
+                ])
         else:
             # Equation B.10, page 36
             L_H = 0.454 * h_eq * (h_eq / (2 * w_t)) ** 0.54
+            if not compute_only:
+                _latex.extend([
+                    f'L_H=0.454\\cdot {h_eq:.2f} \\cdot \\left(\\frac{{{h_eq:.2f}}}{{2\\cdot {w_t:.2f}}}\\right)^{{0.54}}',
+                    f'L_H={L_H:.2f}\\ \\left[m\\right]',
+                ])
+    else:
+        L_H = 0.6 * h_eq * (L_L / h_eq) ** (1 / 3)
+        if not compute_only:
             _latex.extend([
-                f'L_H=0.454\\cdot {h_eq:.2f} \\cdot \\left(\\frac{{{h_eq:.2f}}}{{2\\cdot {w_t:.2f}}}\\right)^{{0.54}}',
+                f'L_H=0.6\\cdot {h_eq:.2f}\\cdot \\left(\\frac{{{L_L:.2f}}}{{{h_eq:.2f}}}\\right)^\\frac{{1}}{{3}}',
                 f'L_H={L_H:.2f}\\ \\left[m\\right]',
             ])
-    else:
-        L_H = 0.6 * h_eq * (L_L / h_eq) ** (1 / 3)
-        _latex.extend([
-            f'L_H=0.6\\cdot {h_eq:.2f}\\cdot \\left(\\frac{{{L_L:.2f}}}{{{h_eq:.2f}}}\\right)^\\frac{{1}}{{3}}',
-            f'L_H={L_H:.2f}\\ \\left[m\\right]',
-        ])
 
+    if compute_only:
+        return dict(L_H=L_H)
     return dict(L_H=L_H, _latex=_latex)
 
 
@@ -381,35 +425,41 @@ def clause_b_4_1_7_L_f(
         h_eq,
         is_wall_above_opening: bool,
         *_,
+        compute_only: bool = False,
         **__,
 ):
-    _latex = [
-        f'L_f = '
-        f'\\begin{{dcases}}'
-        f'L_L+\\frac{{h_{{eq}}}}{{2}},                                                                                  & \\text{{if wall exist above window and }} h_{{eq}}\\le 1.25\\cdot w_t \\ \\left[{is_wall_above_opening and h_eq <= 1.25 * w_t}\\right]\\\\'
-        f'\\left({{L_L}}^2 + \\left(L_H-\\frac{{h_{{eq}}}}{{3}}\\right)^2\\right)^{{0.5}} +\\frac{{h_{{eq}}}}{{2}},     & \\text{{if no wall exist above window or }} h_{{eq}}>1.25\\cdot w_t \\ \\left[{not is_wall_above_opening or h_eq > 1.25 * w_t}\\right]'
-        f'\\end{{dcases}}'
-    ]
+    if not compute_only:
+        _latex = [
+            f'L_f = '
+            f'\\begin{{dcases}}'
+            f'L_L+\\frac{{h_{{eq}}}}{{2}},                                                                                  & \\text{{if wall exist above window and }} h_{{eq}}\\le 1.25\\cdot w_t \\ \\left[{is_wall_above_opening and h_eq <= 1.25 * w_t}\\right]\\\\'
+            f'\\left({{L_L}}^2 + \\left(L_H-\\frac{{h_{{eq}}}}{{3}}\\right)^2\\right)^{{0.5}} +\\frac{{h_{{eq}}}}{{2}},     & \\text{{if no wall exist above window or }} h_{{eq}}>1.25\\cdot w_t \\ \\left[{not is_wall_above_opening or h_eq > 1.25 * w_t}\\right]'
+            f'\\end{{dcases}}'
+        ]
 
     if is_wall_above_opening is True and h_eq <= 1.25 * w_t:
         # equation B.12
         L_f = L_L + h_eq / 2
-        _latex.extend([
-            f'L_f={L_L:.2f}+\\frac{{{h_eq:.2f}}}{{2}}',
-            f'L_f={L_f:.2f}\\ \\left[m\\right]',
-        ])
+        if not compute_only:
+            _latex.extend([
+                f'L_f={L_L:.2f}+\\frac{{{h_eq:.2f}}}{{2}}',
+                f'L_f={L_f:.2f}\\ \\left[m\\right]',
+            ])
     elif is_wall_above_opening is False or h_eq > 1.25 * w_t:
         # equation B.13
         a = (L_L ** 2 + (L_H - h_eq / 3) ** 2) ** 0.5
         b = h_eq / 2
         L_f = a + b
-        _latex.extend([
-            f'L_f=\\left({{{L_L:.2f}}}^2 + \\left({L_H:.2f}-\\frac{{{h_eq:.2f}}}{{3}}\\right)^2\\right)^{{0.5}} +\\frac{{{h_eq:.2f}}}{{2}}',
-            f'L_f={L_f:.2f}\\ \\left[m\\right]',
-        ])
+        if not compute_only:
+            _latex.extend([
+                f'L_f=\\left({{{L_L:.2f}}}^2 + \\left({L_H:.2f}-\\frac{{{h_eq:.2f}}}{{3}}\\right)^2\\right)^{{0.5}} +\\frac{{{h_eq:.2f}}}{{2}}',
+                f'L_f={L_f:.2f}\\ \\left[m\\right]',
+            ])
     else:
         raise ValueError('No conditions are met when calculating `L_f`')
 
+    if compute_only:
+        return dict(L_f=L_f)
     return dict(L_f=L_f, _latex=_latex)
 
 
@@ -419,6 +469,7 @@ def clause_b_4_1_8_T_w(
         Q: float,
         T_0: float = 293.15,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """
@@ -440,6 +491,9 @@ def clause_b_4_1_8_T_w(
 
     T_w = 520 / (1 - 0.4725 * (L_f * w_t / Q)) + T_0
 
+    if compute_only:
+        return dict(T_w=T_w)
+
     _latex = [
         'T_w=\\frac{520}{1-0.4725\\frac{L_f w_t}{Q}}+T_0',
         f'T_w=\\frac{{520}}{{1-0.4725\\frac{{{L_f:.2f}\\cdot {w_t:.2f}}}{{{Q:.2f}}}}}+{T_0:.2f}',
@@ -456,6 +510,7 @@ def clause_b_4_1_10_T_z(
         Q: float,
         T_0: float = 293.15,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """Equation B.15 in BS EN 1991-1-2:2002, page 38.
@@ -466,6 +521,9 @@ def clause_b_4_1_10_T_z(
 
     T_z = (T_w - T_0) * (1 - 0.4725 * (L_x * w_t / Q)) + T_0
 
+    if compute_only:
+        return dict(T_z=T_z)
+
     _latex = [
         'T_z=\\left(T_w-T_0\\right) \\left(1-0.4725\\frac{L_x w_t}{Q}\\right)+T_0',
         f'T_z=\\left({T_w:.2f}-{T_0:.2f}\\right) \\left(1-0.4725\\frac{{{L_x:.2f}\\cdot {w_t:.2f}}}{{{Q:.2f}}}\\right)+{T_0:.2f}',
@@ -478,10 +536,14 @@ def clause_b_4_1_10_T_z(
 def clause_b_4_1_11_epsilon_f(
         d_f,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     epsilon_f = 1 - e ** (-0.3 * d_f)
 
+    if compute_only:
+        return dict(epsilon_f=epsilon_f)
+
     _latex = [
         '\\varepsilon_f=1-e^{-0.3d_f}',
         f'\\varepsilon_f=1-e^{{-0.3\\cdot {d_f:.2f}}}',
@@ -494,10 +556,13 @@ def clause_b_4_1_12_alpha_c(
         d_eq,
         Q,
         A_v,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     alpha_c = 4.67 * (1 / d_eq) ** 0.4 * (Q / A_v) ** 0.6
 
+    if compute_only:
+        return dict(alpha_c=alpha_c)
+
     _latex = [
         '\\alpha_c=4.67{\\left(\\frac{1}{d_{eq}}\\right)}^{0.4} {\\left(\\frac{Q}{A_v}\\right)}^{0.6}',
         f'\\alpha_c=4.67{{\\left(\\frac{{1}}{{{d_eq:.2f}}}\\right)}}^{{0.4}} {{\\left(\\frac{{{Q:.2f}}}{{{A_v:.2f}}}\\right)}}^{{0.6}}',
@@ -541,10 +606,14 @@ def clause_b_4_2_1_Q(
         q_fd,
         tau_F,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """equation B.18, page 37"""
     Q = (A_f * q_fd) / tau_F
+    if compute_only:
+        return dict(Q=Q)
+
     _latex = [
         'Q=\\frac{A_f\\cdot q_{fd}}{\\tau_F}',
         f'Q=\\frac{{{A_f:.2f}\\cdot {q_fd:.2f}}}{{{tau_F:.2f}}}',
@@ -557,10 +626,14 @@ def clause_b_4_2_2_T_f(
         Omega,
         T_0,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     """equation B.19, page 37"""
     T_f = 1200 * (1 - e ** (-0.00228 * Omega)) + T_0
+    if compute_only:
+        return dict(T_f=T_f)
+
     _latex = [
         'T_f=1200\\left(1-e^{-0.00228\\Omega}\\right)+T_0',
         f'T_f=1200\\left(1-e^{{-0.00228\\cdot{Omega:.2f}}}\\right)+{T_0}',
@@ -573,10 +646,14 @@ def clause_b_4_2_2_T_f(
 def clause_b_4_2_3_d_f(
         h_eq,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # Figure B.4, page 36
     d_f = h_eq
+    if compute_only:
+        return dict(d_f=d_f)
+
     _latex = [
         'd_f = h_{eq}',
         f'd_f = {h_eq}\\ \\left[m\\right]',
@@ -590,12 +667,16 @@ def clause_b_4_2_3_L_L(
         A_v,
         u,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # equation B.20, page 37
     a = 1.366 * (1 / u) ** 0.43
     b = Q / (A_v ** 0.5)
     L_L = (a * b) - h_eq
+    if compute_only:
+        return dict(L_L=L_L)
+
     _latex = [
         'L_L=\\left(1.366\\left(\\frac{1}{u}\\right)^{0.43}\\frac{Q}{\\sqrt{A_v}}\\right)-h_{eq}',
         f'L_L=\\left(1.366\\left(\\frac{{1}}{{{u:.2f}}}\\right)^{{0.43}}\\frac{{{Q:.2f}}}{{\\sqrt{{{A_v:.2f}}}}}\\right)-{h_eq:.2f}',
@@ -609,6 +690,7 @@ def clause_b_4_2_4_L_H(
         L_L,
         u,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # equation B.21, page 38
@@ -616,6 +698,9 @@ def clause_b_4_2_4_L_H(
     b = (u ** 2 / h_eq) ** 0.22
     c = (L_L + h_eq)
     L_H = a * b * c
+    if compute_only:
+        return dict(L_H=L_H)
+
     _latex = [
         'L_H=0.605\\left(\\frac{u^2}{h_{eq}}\\right)^{0.22}\\left(L_L+h_{eq}\\right)',
         f'L_H=0.605\\left(\\frac{{{u:.2f}^2}}{{{h_eq:.2f}}}\\right)^{{0.22}}\\left({L_L:.2f}+{h_eq:.2f}\\right)',
@@ -628,10 +713,14 @@ def clause_b_4_2_5_w_f(
         w_t,
         L_H,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # equation B.22, page 38
     w_f = w_t + 0.4 * L_H
+    if compute_only:
+        return dict(w_f=w_f)
+
     _latex = [
         'w_f=w_t+0.4\\cdot L_H',
         f'w_f={w_t:.2f}+0.4\\cdot {L_H:.2f}',
@@ -644,10 +733,14 @@ def clause_b_4_2_6_L_f(
         L_L,
         L_H,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # equation B.23, page 38
     L_f = (L_L ** 2 + L_H ** 2) ** 0.5
+    if compute_only:
+        return dict(L_f=L_f)
+
     _latex = [
         'L_f=\\left(L_L^2+L_H^2\\right)^{0.5}',
         f'L_f=\\left({L_L:.2f}^2+{L_H:.2f}^2\\right)^{{0.5}}',
@@ -662,6 +755,7 @@ def clause_b_4_2_7_T_w(
         L_f,
         T_0,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # equation B.24, page 38
@@ -672,6 +766,9 @@ def clause_b_4_2_7_T_w(
 
     T_w = 520 / (1 - 0.3325 * L_f * (A_v ** 0.5) / Q) + T_0
 
+    if compute_only:
+        return dict(T_w=T_w)
+
     _latex = [
         'T_w=520\\cdot\\left(1-\\frac{0.3325\\cdot L_f\\cdot A_v^{0.5}}{Q}\\right)^{-1}+T_0',
         f'T_w=520\\cdot\\left(1-\\frac{{0.3325\\cdot {L_f:.2f}\\cdot {A_v:.2f}^{{0.5}}}}{{{Q:.2f}}}\\right)^{{-1}}+{T_0:.2f}',
@@ -688,6 +785,7 @@ def clause_b_4_2_9_T_z(
         T_w,
         T_0,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # equation B.25, page 38
@@ -695,6 +793,9 @@ def clause_b_4_2_9_T_z(
     b = T_w - T_0
     T_z = a * b + T_0
 
+    if compute_only:
+        return dict(T_z=T_z)
+
     _latex = [
         'T_z=\\left(1-\\frac{0.3325\\cdot L_x\\cdot A_v^{0.5}}{Q}\\right)\\left(T_w-T_0\\right)+T_0',
         f'T_z=\\left(1-\\frac{{0.3325\\cdot {L_x:.2f}\\cdot {A_v:.2f}^{{0.5}}}}{{{Q:.2f}}}\\right)\\left({T_w:.2f}-{T_0:.2f}\\right)+{T_0:.2f}',
@@ -707,11 +808,15 @@ def clause_b_4_2_9_T_z(
 def clause_b_4_2_10_epsilon(
         d_f,
         *_,
+        compute_only: bool = False,
         **__,
 ):
     # equation B.26, page 39
     e_f = 1 - e ** (-0.3 * d_f)
 
+    if compute_only:
+        return dict(e_f=e_f)
+
     _latex = [
         '\\varepsilon_f=1-e^{-0.3\\cdot d_f}',
         f'\\varepsilon_f=1-e^{{-0.3\\cdot {d_f:.2f}}}',
@@ -725,7 +830,7 @@ def clause_b_4_2_11_alpha_c(
         A_v,
         Q,
         u,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     # equation B.27, page 39
 
@@ -733,6 +838,9 @@ def clause_b_4_2_11_alpha_c(
     b = (Q / (17.5 * A_v) + u / 1.6) ** 0.6
     alpha_c = a * b
 
+    if compute_only:
+        return dict(alpha_c=alpha_c)
+
     _latex = [
         '\\alpha_c=9.8\\cdot\\left(\\frac{1}{d_{eq}} \\right )^{0.4}\\cdot\\left(\\frac{Q}{17.5\\cdot A_v}+\\frac{u}{1.6} \\right ) ^ {0.6}',
         f'\\alpha_c=9.8\\cdot\\left(\\frac{{1}}{{{d_eq:.2f}}} \\right )^{{0.4}}\\cdot\\left(\\frac{{{Q:.2f}}}{{17.5\\cdot {A_v:.2f}}}+\\frac{{{u:.2f}}}{{1.6}} \\right ) ^ {{0.6}}',
@@ -746,7 +854,7 @@ def clause_b_5_1_phi_f(
         C_1, C_2, C_3, C_4,
         phi_f_1, phi_f_2, phi_f_3, phi_f_4,
         d_1, d_2,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     a = (C_1 * phi_f_1 + C_2 * phi_f_2) * d_1
     b = (C_3 * phi_f_3 + C_4 * phi_f_4) * d_2
@@ -754,6 +862,9 @@ def clause_b_5_1_phi_f(
     d = (C_3 + C_4) * d_2
     phi_f = (a + b) / (c + d)
 
+    if compute_only:
+        return dict(phi_f=phi_f)
+
     _latex = [
         f'\\phi_f=\\frac{{\\left(C_1 \\phi_{{f,1}}+C_2 \\phi_{{f,2}}\\right) d_1+\\left(C_3 \\phi_{{f,3}}+C_4 \\phi_{{f,4}}\\right) d_2}}{{\\left(C_1+C_2\\right) d_1+\\left(C_3+C_4\\right) d_2}}',
         f'\\phi_f=\\frac{{\\left({C_1:.2f}\\cdot {phi_f_1:.2f}+{C_2:.2f}\\cdot {phi_f_2}\\right) {d_1:.2f}+\\left({C_3:.2f} \\cdot {phi_f_3:.2f}+{C_4:.2f}\\cdot {phi_f_4:.2f}\\right) {d_2:.2f}}}{{\\left({C_1:.2f}+{C_2:.2f}\\right) {d_1:.2f}+\\left({C_3:.2f}+{C_4:.2f}\\right) {d_2:.2f}}}',
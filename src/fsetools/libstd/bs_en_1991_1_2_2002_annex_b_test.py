@@ -58,3 +58,60 @@ def test_1(raise_error=True):
 
     print(f'{kwargs["L_f"]:.1f} == 1.9')
     assert abs(round(kwargs["L_f"], 1) - 1.9) < 1e-7
+
+
+def _compute_only_chain(compute_only: bool) -> dict:
+    from .bs_en_1993_1_2_2005_annex_b import clause_b_4_1_lambda_4, clause_b_4_5_l
+
+    kwargs = dict(
+        w_t=1.82, h_eq=1.1, W_1=1.82, W_2=5.46, A_f=14.88, A_t=50., A_v=1.82 * 1.1, q_fd=870, tau_F=1200, O=0.03,
+        Omega=100., DW_ratio=3., u=6., d_1=0.8, d_eq=0.4, lambda_3=1., T_w=1000., L_x=1.,
+        is_wall_above_opening=True,
+        compute_only=compute_only,
+    )
+    for func in (
+            clause_1_6_Omega, clause_b_4_1_1_Q, clause_b_4_1_2_T_f, clause_b_4_1_3_L_L, clause_b_4_1_6_L_H,
+            clause_b_4_1_7_L_f, clause_b_4_1_3_d_f, clause_b_4_1_10_T_z, clause_b_4_1_11_epsilon_f,
+            clause_b_4_1_12_alpha_c, clause_b_4_2_4_L_H,
+    ):
+        kwargs.update(func(**kwargs))
+    for is_forced_draught in (True, False):
+        kwargs.update(clause_b_4_1_lambda_4(**kwargs, is_forced_draught=is_forced_draught))
+        kwargs.update(clause_b_4_5_l(**kwargs, is_forced_draught=is_forced_draught))
+    return kwargs
+
+
+def test_compute_only():
+    from .bs_en_1991_1_2_2002_annex_f import EquivalenceOfTimeExposure
+
+    # the same results, without `_latex`
+    res_latex, res = _compute_only_chain(False), _compute_only_chain(True)
+    assert '_latex' in res_latex and '_latex' not in res
+    res_latex.pop('_latex')
+    res_latex.pop('compute_only'), res.pop('compute_only')
+    assert res_latex == res
+
+    res = EquivalenceOfTimeExposure().calculate(
+        q_f_d=600, k_b=0.07, k_c=1.0, H=3, A_f=1500, A_t=3480, A_v=45, A_h=0, O=0.02, compute_only=True
+    )
+    assert '_latex' not in res and res['t_e_d'] > 0
+
+
+def _benchmark_compute_only(n: int = 2000):
+    import time
+
+    t_0 = time.perf_counter()
+    for _ in range(n):
+        _compute_only_chain(False)
+    t_1 = time.perf_counter()
+    for _ in range(n):
+        _compute_only_chain(True)
+    t_2 = time.perf_counter()
+    print(f'with _latex {(t_1 - t_0) / n * 1e6:.1f} us, compute only {(t_2 - t_1) / n * 1e6:.1f} us, '
+          f'{(t_1 - t_0) / (t_2 - t_1):.1f} times faster')
+
+
+if __name__ == '__main__':
+    test_1()
+    test_compute_only()
+    _benchmark_compute_only()
@@ -81,27 +81,27 @@ class Phi:
         return R
 
     @staticmethod
-    def clause_5_c(theta: float, w: float, h: float, s: float) -> float:
+    def clause_5_c(theta, w, h, s):
         """
 
         :param theta:   [rad]   is the internal angle between emitter and receiver
         :param w:       [m]     is the emitter width
         :param h:       [m]     is the emitter height
         :param s:       [m]     is the separation between emitter and receiver
-        :return Phi:    [-]     is the configuration factor
+        :return Phi:    [-]     is the configuration factor, all parameters are broadcast against each other
         """
 
-        a = h / s
-        b = w / s
+        a = np.divide(h, s)
+        b = np.divide(w, s)
 
-        aa = atan(a)
-        bb = (1 - b * cos(theta)) / ((1 + b ** 2 - 2 * b * cos(theta)) ** 0.5)
-        cc = atan(a / ((1 + b ** 2 - 2 * b * cos(theta)) ** 0.5))
-        dd = (a * cos(theta)) / ((a ** 2 + sin(theta) ** 2) ** 0.5)
-        ee = atan((b - cos(theta)) / ((a ** 2 + sin(theta) ** 2) ** 0.5))
-        ff = atan((cos(theta) / ((a ** 2 + sin(theta) ** 2) ** 0.5)))
+        aa = np.arctan(a)
+        bb = (1 - b * np.cos(theta)) / ((1 + b ** 2 - 2 * b * np.cos(theta)) ** 0.5)
+        cc = np.arctan(a / ((1 + b ** 2 - 2 * b * np.cos(theta)) ** 0.5))
+        dd = (a * np.cos(theta)) / ((a ** 2 + np.sin(theta) ** 2) ** 0.5)
+        ee = np.arctan((b - np.cos(theta)) / ((a ** 2 + np.sin(theta) ** 2) ** 0.5))
+        ff = np.arctan((np.cos(theta) / ((a ** 2 + np.sin(theta) ** 2) ** 0.5)))
 
-        Phi_ = 1 / (2 * pi) * (aa - bb * cc + dd * (ee + ff))
+        Phi_ = 1 / (2 * np.pi) * (aa - bb * cc + dd * (ee + ff))
 
         return Phi_
 
@@ -1,3 +1,11 @@
+"""
+This module contains equations in Annex B, BS EN 1993-1-2:2005.
+
+Clause functions return a dict containing results and `_latex`, a list of step-by-step LaTeX equations. Pass
+`compute_only=True` to skip building `_latex` where no report is wanted, e.g. in batch assessments, results are the same
+but without `_latex`.
+"""
+
 from math import e
 from typing import Union
 
@@ -75,6 +83,7 @@ def clause_b_1_3_3_T_m(
         T_z,
         sigma: float = 5.67e-11,
         *_,
+        compute_only: bool = False,
         **__
 ):
     """
@@ -110,6 +119,9 @@ def clause_b_1_3_3_T_m(
         func_multiplier=-1
     )
 
+    if compute_only:
+        return dict(T_m=T_m)
+
     _latex = (
         f'\\sigma\\cdot T_{{m}}^4 + \\alpha\\cdot T_{{m}} = I_{{z}} + I_{{f}} + \\alpha\\cdot T_{{z}}',
         f'\\left({sigma:.2E}\\right)\\cdot T_m^4 + {alpha:.2f}\\cdot T_m = {I_z:.2f} + {I_f:.2f} + {alpha:.2f}\\cdot {T_z:.2f}',
@@ -127,6 +139,7 @@ def clause_b_1_3_3_T_m_i_beam(
         T_z_1, T_z_2,
         sigma: float = 5.67e-11,
         *_,
+        compute_only: bool = False,
         **__
 ):
     """
@@ -153,6 +166,9 @@ def clause_b_1_3_3_T_m_i_beam(
     T_m_3 = bisect(func, 0.001, 5000, (I_z_3, I_f_3, alpha, (T_z_1 + T_z_2) / 2, sigma))
     T_m_4 = bisect(func, 0.001, 5000, (I_z_4, I_f_4, alpha, (T_z_1 + T_z_2) / 2, sigma))
 
+    if compute_only:
+        return dict(T_m_1=T_m_1, T_m_2=T_m_2, T_m_3=T_m_3, T_m_4=T_m_4)
+
     _latex = (
         f'\\sigma\\cdot T_{{m,i}}^4 + \\alpha\\cdot T_{{m,i}} = I_{{z,i}} + I_{{f,i}} + \\alpha\\cdot T_{{z,i}}',
         f'\\left( {sigma:.2E}\\right) T_{{m,1}}^4+{alpha:.2f}T_{{m,1}}={I_z_1:.2f}+{I_f_1:.2f}+{alpha:.2f}\\cdot {T_z_1:.2f}\\Rightarrow T_{{m,1}}={T_m_1:.2f}\\ \\left[K\\right]={T_m_1 - 273.15:.2f} \\left[^\\circ C\\right]',
@@ -170,7 +186,7 @@ def clause_b_1_3_3_T_m_i_column(
         alpha,
         T_z,
         sigma: float = 5.67e-11,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
 
@@ -196,6 +212,9 @@ def clause_b_1_3_3_T_m_i_column(
     T_m_3 = bisect(func, 0.001, 5000, (I_z_3, I_f_3, alpha, T_z, sigma))
     T_m_4 = bisect(func, 0.001, 5000, (I_z_4, I_f_4, alpha, T_z, sigma))
 
+    if compute_only:
+        return dict(T_m_1=T_m_1, T_m_2=T_m_2, T_m_3=T_m_3, T_m_4=T_m_4)
+
     _latex = (
         f'\\sigma\\cdot T_{{m,i}}^4 + \\alpha\\cdot T_{{m,i}} = I_{{z,i}} + I_{{f,i}} + \\alpha\\cdot T_{{z}}',
         f'\\left( {sigma:.2E}\\right) T_{{m,1}}^4+{alpha:.2f}T_{{m,1}}={I_z_1:.2f}+{I_f_1:.2f}+{alpha:.2f}\\cdot {T_z:.2f}\\Rightarrow T_{{m,1}}={T_m_1:.2f}\\ \\left[K\\right]={T_m_1 - 273.15:.2f} \\left[^\\circ C\\right]',
@@ -219,7 +238,7 @@ def clause_b_1_3_5_I_f(
         sigma,
         T_f,
         epsilon_f: float = 1,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.4 (5), page 49
@@ -237,6 +256,9 @@ def clause_b_1_3_5_I_f(
     # Equation B.3, page 19
     I_f = phi_f * epsilon_f * (1 - a_z) * sigma * T_f ** 4
 
+    if compute_only:
+        return dict(I_f=I_f)
+
     _latex = [
         f'I_f=\\phi_f \\cdot \\varepsilon_f \\cdot \\left(1-a_z\\right) \\cdot \\sigma {{T_f}}^4',
         f'I_f={phi_f:.2f} \\cdot {epsilon_f:.2f} \\cdot \\left(1-{a_z:.2f}\\right) \\cdot \\left({sigma:.2E}\\right) \\cdot {{{T_f:.2f}}}^4',
@@ -251,13 +273,16 @@ def clause_b_1_3_5_I_f_i(
         epsilon_z_1, epsilon_z_2, epsilon_z_3, epsilon_z_4,
         sigma, T_f,
         epsilon_f=1,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     I_f_1 = phi_f_1 * epsilon_f * (1 - epsilon_z_1) * sigma * T_f ** 4
     I_f_2 = phi_f_2 * epsilon_f * (1 - epsilon_z_2) * sigma * T_f ** 4
     I_f_3 = phi_f_3 * epsilon_f * (1 - epsilon_z_3) * sigma * T_f ** 4
     I_f_4 = phi_f_4 * epsilon_f * (1 - epsilon_z_4) * sigma * T_f ** 4
 
+    if compute_only:
+        return dict(I_f_1=I_f_1, I_f_2=I_f_2, I_f_3=I_f_3, I_f_4=I_f_4)
+
     _latex = [
         f'I_{{f,1}}=\\phi_{{f,1}} \\varepsilon_f \\left(1-\\varepsilon_{{z,1}}\\right) \\sigma T_f^4={phi_f_1:.3f}\\cdot {epsilon_f:.3f}\\cdot \\left(1-{epsilon_z_1:.3f}\\right)\\cdot \\left({sigma:.2E}\\right)\\cdot {T_f:.2f}^4={I_f_1:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
         f'I_{{f,2}}=\\phi_{{f,2}} \\varepsilon_f \\left(1-\\varepsilon_{{z,2}}\\right) \\sigma T_f^4={phi_f_2:.3f}\\cdot {epsilon_f:.3f}\\cdot \\left(1-{epsilon_z_2:.3f}\\right)\\cdot \\left({sigma:.2E}\\right)\\cdot {T_f:.2f}^4={I_f_2:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
@@ -268,10 +293,13 @@ def clause_b_1_3_5_I_f_i(
     return dict(I_f_1=I_f_1, I_f_2=I_f_2, I_f_3=I_f_3, I_f_4=I_f_4, _latex=_latex)
 
 
-def clause_b_1_3_2_d(d_1, d_2, *_, **__):
+def clause_b_1_3_2_d(d_1, d_2, *_, compute_only: bool = False, **__):
     # page 47
 
     d = (d_1 + d_2) / 2
+    if compute_only:
+        return dict(d=d)
+
     _latex = [
         f'd=d_{{eq}}=\\frac{{\\left( d_1+d_2\\right)}}{{2}}',
         f'd=d_{{eq}}=\\frac{{\\left( {d_1:.2f}+{d_2:.2f}\\right)}}{{2}}',
@@ -288,6 +316,7 @@ def clause_b_1_4_1_phi_f_i_beam(
         lambda_3,
         lambda_4,
         *_,
+        compute_only: bool = False,
         **__
 ):
     phi_f_1 = phi_perpendicular_any_br187(
@@ -307,6 +336,9 @@ def clause_b_1_4_1_phi_f_i_beam(
         S_m=lambda_4,
     )
 
+    if compute_only:
+        return dict(phi_f_1=phi_f_1, phi_f_2=phi_f_2, phi_f_3=phi_f_3, phi_f_4=phi_f_4)
+
     _latex = [
         f'\\phi_{{f,1}}={phi_f_1:.5f}\\ \\left[-\\right]',
         f'\\phi_{{f,2}}={phi_f_2:.5f}\\ \\left[-\\right]',
@@ -323,7 +355,7 @@ def clause_b_1_4_1_phi_f_i_column(
         lambda_1,
         lambda_2,
         lambda_3,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
 
@@ -359,6 +391,9 @@ def clause_b_1_4_1_phi_f_i_column(
     )
     phi_f_4 = 0
 
+    if compute_only:
+        return dict(phi_f_1=phi_f_1, phi_f_2=phi_f_2, phi_f_3=phi_f_3, phi_f_4=phi_f_4)
+
     _latex = [
         f'\\phi_{{f,1}}={phi_f_1:.5f}\\ \\left[-\\right]',
         f'\\phi_{{f,2}}={phi_f_2:.5f}\\ \\left[-\\right]',
@@ -373,7 +408,7 @@ def clause_b_1_4_1_phi_f(
         C_1, C_2, C_3, C_4,
         phi_f_1, phi_f_2, phi_f_3, phi_f_4,
         d_1, d_2,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.1.4 (1), page 50
@@ -401,6 +436,9 @@ def clause_b_1_4_1_phi_f(
     d = (C_3 + C_4) * d_2
     phi_f = (a + b) / (c + d)
 
+    if compute_only:
+        return dict(phi_f=phi_f)
+
     _latex = [
         f'\\phi_f=\\frac{{\\left(C_1 \\phi_{{f,1}}+C_2 \\phi_{{f,2}}\\right) d_1+\\left(C_3 \\phi_{{f,3}}+C_4 \\phi_{{f,4}}\\right) d_2}}{{\\left(C_1+C_2\\right) d_1+\\left(C_3+C_4\\right) d_2}}',
         f'\\phi_f=\\frac{{\\left({C_1:.1f}\\cdot {phi_f_1:.5f}+{C_2:.1f}\\cdot {phi_f_2:.5f}\\right) {d_1:.2f}+\\left({C_3:.1f} \\cdot {phi_f_3:.5f}+{C_4:.1f}\\cdot {phi_f_4:.5f}\\right) {d_2:.2f}}}{{\\left({C_1:.1f}+{C_2:.1f}\\right) {d_1:.2f}+\\left({C_3:.1f}+{C_4:.1f}\\right) {d_2:.2f}}}',
@@ -415,7 +453,7 @@ def clause_b_2_1_2_I_z(
         epsilon_z: float,
         sigma: float,
         T_z: float,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     """
     B.2.1 (2), page 51. Radiative heat flux if the column is between openings.
@@ -431,6 +469,9 @@ def clause_b_2_1_2_I_z(
 
     I_z = phi_z * epsilon_z * sigma * (T_z ** 4)
 
+    if compute_only:
+        return dict(I_z=I_z)
+
     _latex = [
         f'I_z=\\phi_z\\varepsilon_z\\sigma T_z^4',
         f'I_z={phi_z:.3f}\\cdot{epsilon_z:.3f}\\cdot{sigma:.3e}\\cdot{T_z ** 4:.3e}',
@@ -453,7 +494,7 @@ def clause_b_2_1_3_I_z(
         epsilon_z_n: float,
         sigma: float,
         T_z: float,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     """
     B.2.1 (3), page 51. Radiative heat flux if the column is opposite an opening.
@@ -471,6 +512,9 @@ def clause_b_2_1_3_I_z(
 
     I_z = (phi_z_m * epsilon_z_m + phi_z_n * epsilon_z_n) * sigma * (T_z ** 4)
 
+    if compute_only:
+        return dict(I_z=I_z)
+
     _latex = [
         f'I_z=\\left(\\phi_{{z,m}} \\varepsilon_{{z,m}} + \\phi_{{z,n}} \\varepsilon_{{z,n}} \\right)\\sigma T_z^4',
         f'I_z=\\left({phi_z_m:.3f} \\cdot {epsilon_z_m:.3f} + {phi_z_n:.3f} \\cdot {epsilon_z_n:.3f} \\right){sigma:.3e}\\cdot {T_z ** 4:.3e}',
@@ -491,6 +535,7 @@ def clause_b_2_2_1_lambda(
         x: float = None,
         z: float = None,
         is_forced_draught: bool = False,
+        compute_only: bool = False,
 ):
     """
     Clause B.2.2 (1), page 51, flame thickness if the column is opposite an opening and no awning or balcony above the
@@ -504,23 +549,29 @@ def clause_b_2_2_1_lambda(
     :return:                    a dict containing `lambda_` and `_latex`
     """
 
-    _latex = [
-        f'\\lambda='
-        f'\\begin{{dcases}}\n'
-        f'\\frac{{2}}{{3}}h,                                           &\\text{{no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
-        f'\\operatorname{{min}}\left({{x, \\frac{{hx}}{{z}}}}\\right)  &\\text{{forced draught }}    \\left[ {is_forced_draught}\\right]\\\\\n'
-        f'\\end{{dcases}}',
-    ]
+    if not compute_only:
+        _latex = [
+            f'\\lambda='
+            f'\\begin{{dcases}}\n'
+            f'\\frac{{2}}{{3}}h,                                           &\\text{{no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
+            f'\\operatorname{{min}}\left({{x, \\frac{{hx}}{{z}}}}\\right)  &\\text{{forced draught }}    \\left[ {is_forced_draught}\\right]\\\\\n'
+            f'\\end{{dcases}}',
+        ]
 
     if not is_forced_draught:
         lambda_ = 2. * h / 3.
-        _latex.append(f'\\lambda=\\frac{{2}}{{3}}{h:.3f}')
+        if not compute_only:
+            _latex.append(f'\\lambda=\\frac{{2}}{{3}}{h:.3f}')
     else:
         lambda_ = min(x, h * x / z)
-        _latex.append(f'\\lambda=\\operatorname{{min}}\left({{{x:.3f}, \\frac{{{h * x:.3f}}}{{{z:.3f}}}}}\\right)')
+        if not compute_only:
+            _latex.append(f'\\lambda=\\operatorname{{min}}\left({{{x:.3f}, \\frac{{{h * x:.3f}}}{{{z:.3f}}}}}\\right)')
 
-    _latex.append(f'\\lambda={lambda_:.3f}\\ \\left[m\\right]')
+    if not compute_only:
+        _latex.append(f'\\lambda={lambda_:.3f}\\ \\left[m\\right]')
 
+    if compute_only:
+        return dict(lambda_=lambda_)
     return dict(lambda_=lambda_, _latex=_latex)
 
 
@@ -543,7 +594,7 @@ def clause_b_2_2_2_lambda(
         w_i_n: Union[float, list],
         s_n: Union[float, list],
         is_forced_draught_n: Union[float, list],
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     """
     Clause B.2.2 (1), page 55, flame thickness if the column is between openings and no awning or balcony above the
@@ -574,6 +625,9 @@ def clause_b_2_2_2_lambda(
     lambda_m = sum([i['lambda_i'] for i in lambda_m])
     lambda_n = sum([i['lambda_i'] for i in lambda_n])
 
+    if compute_only:
+        return dict(lambda_m=lambda_m, lambda_n=lambda_n)
+
     _latex = [
         f'lambda_m={lambda_m:.3f}\\ \\left[ m\\right]',
         f'lambda_n={lambda_n:.3f}\\ \\left[ m\\right]',
@@ -586,7 +640,7 @@ def clause_b_2_2_3_lambda_i(
         w_i: float,
         s: float = None,
         is_forced_draught: bool = False,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     """
     Clause B.2.2 (3), page 55, flame thickness used in B.2.2 (2).
@@ -599,24 +653,29 @@ def clause_b_2_2_3_lambda_i(
     :param __:
     :return:                    A dict containing `lambda_i` and `_latex`
     """
-    _latex = [
-        f'\\lambda_i='
-        f'\\begin{{dcases}}\n'
-        f'w_i,      &\\text{{no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
-        f'w_i+0.4s  &\\text{{forced draught }}    \\left[ {is_forced_draught}\\right]\\\\\n'
-        f'\\end{{dcases}}',
-    ]
+    if not compute_only:
+        _latex = [
+            f'\\lambda_i='
+            f'\\begin{{dcases}}\n'
+            f'w_i,      &\\text{{no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
+            f'w_i+0.4s  &\\text{{forced draught }}    \\left[ {is_forced_draught}\\right]\\\\\n'
+            f'\\end{{dcases}}',
+        ]
     if not is_forced_draught:
         lambda_i = w_i
     else:
         lambda_i = w_i + 0.4 * s
+        if not compute_only:
+            _latex.append(
+                f'\\lambda_i=w_i+0.4\\cdot {s:.3f}'
+            )
+    if not compute_only:
         _latex.append(
-            f'\\lambda_i=w_i+0.4\\cdot {s:.3f}'
+            f'\\lambda_i={lambda_i:.3f}\\left[ m\\right]'
         )
-    _latex.append(
-        f'\\lambda_i={lambda_i:.3f}\\left[ m\\right]'
-    )
 
+    if compute_only:
+        return dict(lambda_i=lambda_i)
     return dict(lambda_i=lambda_i, _latex=_latex)
 
 
@@ -668,7 +727,7 @@ def clause_b_3_1_3_I_z(
         epsilon_z: float,
         sigma: float,
         T_z: float,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     """
     B.3.1 (3), page 56. Radiative heat flux for beams parallel to the external wall of the fire compartment.
@@ -684,6 +743,9 @@ def clause_b_3_1_3_I_z(
 
     I_z = phi_z * epsilon_z * sigma * (T_z ** 4)
 
+    if compute_only:
+        return dict(I_z=I_z)
+
     _latex = [
         f'I_z=\\phi_z\\varepsilon_z\\sigma T_z^4',
         f'I_z={phi_z:.3f}\\cdot{epsilon_z:.3f}\\cdot{sigma:.3e}\\cdot{T_z ** 4:.3e}',
@@ -700,7 +762,7 @@ def clause_b_3_1_4_I_z(
         epsilon_z_n: float,
         sigma: float,
         T_z: float,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     """
     B.3.1 (4), page 56. Radiative heat flux at a beam perpendicular to the external wall of the fire compartment.
@@ -716,6 +778,9 @@ def clause_b_3_1_4_I_z(
 
     I_z = (phi_z_m * epsilon_z_m + phi_z_n * epsilon_z_n) * sigma * (T_z ** 4)
 
+    if compute_only:
+        return dict(I_z=I_z)
+
     _latex = [
         f'I_z=\\left( \\phi_{{z,m}}\\varepsilon_{{z,m}}+\\phi_{{z,n}}\\varepsilon_{{z,n}}\\right)\\sigma T_z^4',
         f'I_z=\\left({phi_z_m:.3f}\\cdot {epsilon_z_m:.3f}+{phi_z_n:.3f}\\cdot {epsilon_z_n:.3f} \\right)\\cdot {sigma:.3e}\\cdot {T_z:.3e}',
@@ -730,6 +795,7 @@ def clause_b_3_2_1_lambda(
         x: float = None,
         z: float = None,
         is_forced_draught: bool = False,
+        compute_only: bool = False,
 ):
     """
     Clause B.2.3 (1), page 58, flame thickness if the beam is parallel to the external wall of the fire compartment.
@@ -742,23 +808,29 @@ def clause_b_3_2_1_lambda(
     :return:                    a dict containing `lambda_` and `_latex`
     """
 
-    _latex = [
-        f'\\lambda='
-        f'\\begin{{dcases}}\n'
-        f'\\frac{{2}}{{3}}h,                                           &\\text{{no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
-        f'\\operatorname{{min}}\left({{x, \\frac{{hx}}{{z}}}}\\right)  &\\text{{forced draught }}    \\left[ {is_forced_draught}\\right]\\\\\n'
-        f'\\end{{dcases}}',
-    ]
+    if not compute_only:
+        _latex = [
+            f'\\lambda='
+            f'\\begin{{dcases}}\n'
+            f'\\frac{{2}}{{3}}h,                                           &\\text{{no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
+            f'\\operatorname{{min}}\left({{x, \\frac{{hx}}{{z}}}}\\right)  &\\text{{forced draught }}    \\left[ {is_forced_draught}\\right]\\\\\n'
+            f'\\end{{dcases}}',
+        ]
 
     if not is_forced_draught:
         lambda_ = 2. * h / 3.
-        _latex.append(f'\\lambda=\\frac{{2}}{{3}}{h:.3f}')
+        if not compute_only:
+            _latex.append(f'\\lambda=\\frac{{2}}{{3}}{h:.3f}')
     else:
         lambda_ = min(x, h * x / z)
-        _latex.append(f'\\lambda=\\operatorname{{min}}\left({{{x:.3f}, \\frac{{{h * x:.3f}}}{{{z:.3f}}}}}\\right)')
+        if not compute_only:
+            _latex.append(f'\\lambda=\\operatorname{{min}}\left({{{x:.3f}, \\frac{{{h * x:.3f}}}{{{z:.3f}}}}}\\right)')
 
-    _latex.append(f'\\lambda={lambda_:.3f}\\ \\left[m\\right]')
+    if not compute_only:
+        _latex.append(f'\\lambda={lambda_:.3f}\\ \\left[m\\right]')
 
+    if compute_only:
+        return dict(lambda_=lambda_)
     return dict(lambda_=lambda_, _latex=_latex)
 
 
@@ -769,7 +841,7 @@ def clause_b_3_2_2_lambda(
         w_i_n: Union[float, list],
         s_n: Union[float, list],
         is_forced_draught_n: Union[float, list],
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     """
     Clause B.3.2 (1), page 58, flame thickness if the beam is perpendicular to the external wall of the fire
@@ -800,6 +872,9 @@ def clause_b_3_2_2_lambda(
     lambda_m = sum([i['lambda_i'] for i in lambda_m])
     lambda_n = sum([i['lambda_i'] for i in lambda_n])
 
+    if compute_only:
+        return dict(lambda_m=lambda_m, lambda_n=lambda_n)
+
     _latex = [
         f'lambda_m={lambda_m:.3f}\\ \\left[ m\\right]',
         f'lambda_n={lambda_n:.3f}\\ \\left[ m\\right]',
@@ -812,7 +887,7 @@ def clause_b_3_2_3_lambda_i(
         w_i: float,
         s: float = None,
         is_forced_draught: bool = False,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
     """
     Clause B.3.2 (3), page 58, flame thickness used in B.3.2 (2).
@@ -825,24 +900,29 @@ def clause_b_3_2_3_lambda_i(
     :param __:
     :return:                    A dict containing `lambda_i` and `_latex`
     """
-    _latex = [
-        f'\\lambda_i='
-        f'\\begin{{dcases}}\n'
-        f'w_i,      &\\text{{no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
-        f'w_i+0.4s  &\\text{{forced draught }}    \\left[ {is_forced_draught}\\right]\\\\\n'
-        f'\\end{{dcases}}',
-    ]
+    if not compute_only:
+        _latex = [
+            f'\\lambda_i='
+            f'\\begin{{dcases}}\n'
+            f'w_i,      &\\text{{no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
+            f'w_i+0.4s  &\\text{{forced draught }}    \\left[ {is_forced_draught}\\right]\\\\\n'
+            f'\\end{{dcases}}',
+        ]
     if not is_forced_draught:
         lambda_i = w_i
     else:
         lambda_i = w_i + 0.4 * s
+        if not compute_only:
+            _latex.append(
+                f'\\lambda_i=w_i+0.4\\cdot {s:.3f}'
+            )
+    if not compute_only:
         _latex.append(
-            f'\\lambda_i=w_i+0.4\\cdot {s:.3f}'
+            f'\\lambda_i={lambda_i:.3f}\\left[ m\\right]'
         )
-    _latex.append(
-        f'\\lambda_i={lambda_i:.3f}\\left[ m\\right]'
-    )
 
+    if compute_only:
+        return dict(lambda_i=lambda_i)
     return dict(lambda_i=lambda_i, _latex=_latex)
 
 
@@ -895,7 +975,7 @@ def clause_b_4_1_I_z_i(
         sigma,
         T_z,
         T_o,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.4 (1), page 59
@@ -922,6 +1002,9 @@ def clause_b_4_1_I_z_i(
     I_z_3 = C_3 * epsilon_z_3 * sigma * T_o ** 4
     I_z_4 = C_4 * epsilon_z_4 * sigma * T_z ** 4
 
+    if compute_only:
+        return dict(I_z_1=I_z_1, I_z_2=I_z_2, I_z_3=I_z_3, I_z_4=I_z_4)
+
     _latex = [
         f'I_{{z,1}}=C_1\\cdot \\varepsilon_{{z,1}}\\cdot \\sigma\\cdot T_z^4={C_1:.2f}\\cdot {epsilon_z_1:.5f}\\cdot \\left( {sigma:.2E}\\right) \\cdot {T_z:.2f}^4={I_z_1:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
         f'I_{{z,2}}=C_2\\cdot \\varepsilon_{{z,2}}\\cdot \\sigma\\cdot T_z^4={C_2:.2f}\\cdot {epsilon_z_2:.5f}\\cdot \\left( {sigma:.2E}\\right) \\cdot {T_z:.2f}^4={I_z_2:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
@@ -936,7 +1019,7 @@ def clause_b_4_1_I_z(
         C_1, C_2, C_3, C_4,
         I_z_1, I_z_2, I_z_3, I_z_4,
         d_1, d_2,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.4 (1), page 59
@@ -965,6 +1048,9 @@ def clause_b_4_1_I_z(
     d = (C_3 + C_4) * d_2
     I_z = (a + b) / (d + c)
 
+    if compute_only:
+        return dict(I_z=I_z)
+
     _latex = [
         f'I_z=\\frac{{\\left(I_{{z,1}}+I_{{z,2}}\\right) d_1+\\left(I_{{z,3}}+I_{{z,4}}\\right) d_2}}{{\\left(C_1+C_2\\right) d_1+\\left(C_3+C_4\\right) d_2}}',
         f'I_z=\\frac{{\\left({I_z_1:.2f}+{I_z_2:.2f}\\right) {d_1:.2f}+\\left({I_z_3:.2f}+{I_z_4:.2f}\\right) {d_2:.2f}}}{{\\left({C_1:.2f}+{C_2:.2f}\\right) {d_1:.2f}+\\left({C_3:.2f}+{C_4:.2f}\\right) {d_2:.2f}}}',
@@ -978,10 +1064,13 @@ def clause_b_4_1_lambda_2(
         w_t,
         lambda_1,
         d_2,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     lambda_2 = w_t - lambda_1 - d_2
 
+    if compute_only:
+        return dict(lambda_2=lambda_2)
+
     _latex = [
         f'\\lambda_2=w_t-\\lambda_1-d_2',
         f'\\lambda_2={w_t:.2f}-{lambda_1:.2f}-{d_2:.2f}',
@@ -998,16 +1087,17 @@ def clause_b_4_1_lambda_4(
         h_eq,
         d_1,
         is_forced_draught: bool,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
-    _latex = [
-        f'\\lambda_4=\n'
-        f'\\begin{{dcases}}\n'
-        f'\\operatorname{{max}}\\left(0, 2 L_H-\\lambda_3-d_1\\right),  &\\text{{if no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
-        f'\\frac{{0.5h_{{eq}} L_H}}{{L_L}},                             & \\text{{if forced draught }} \\lambda_3 \\frac{{L_L}}{{L_H}} \\le 0.5 h_{{eq}} \\ \\left[ {is_forced_draught and lambda_3 * L_L / L_H <= 0.5 * h_eq}\\right]\\\\\n'
-        f'\\frac{{h_{{eq}} L_H}}{{L_L}}-d_1-\\lambda_3,                 & \\text{{if forced draught }} \\lambda_3 \\frac{{L_L}}{{L_H}} > 0.5 h_{{eq}} \\ \\left[ {is_forced_draught and lambda_3 * L_L / L_H > 0.5 * h_eq}\\right]\\\\\n'
-        f'\\end{{dcases}}'
-    ]
+    if not compute_only:
+        _latex = [
+            f'\\lambda_4=\n'
+            f'\\begin{{dcases}}\n'
+            f'\\operatorname{{max}}\\left(0, 2 L_H-\\lambda_3-d_1\\right),  &\\text{{if no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
+            f'\\frac{{0.5h_{{eq}} L_H}}{{L_L}},                             & \\text{{if forced draught }} \\lambda_3 \\frac{{L_L}}{{L_H}} \\le 0.5 h_{{eq}} \\ \\left[ {is_forced_draught and lambda_3 * L_L / L_H <= 0.5 * h_eq}\\right]\\\\\n'
+            f'\\frac{{h_{{eq}} L_H}}{{L_L}}-d_1-\\lambda_3,                 & \\text{{if forced draught }} \\lambda_3 \\frac{{L_L}}{{L_H}} > 0.5 h_{{eq}} \\ \\left[ {is_forced_draught and lambda_3 * L_L / L_H > 0.5 * h_eq}\\right]\\\\\n'
+            f'\\end{{dcases}}'
+        ]
 
     # Figure B.6, page 60
     if is_forced_draught:
@@ -1015,29 +1105,35 @@ def clause_b_4_1_lambda_4(
         if lambda_3 * L_L / L_H <= 0.5 * h_eq:
             # if the engulfed steel column center point is below the opening soffit
             lambda_4 = 0.5 * h_eq * L_H / L_L
-            _latex.extend([
-                f'\\lambda_4=\\frac{{0.5h_{{eq}} L_H}}{{L_L}}',
-                f'\\lambda_4=\\frac{{0.5\\cdot {h_eq:.2f}\\cdot {L_H:.2f}}}{{{L_L:.2f}}}',
-            ])
+            if not compute_only:
+                _latex.extend([
+                    f'\\lambda_4=\\frac{{0.5h_{{eq}} L_H}}{{L_L}}',
+                    f'\\lambda_4=\\frac{{0.5\\cdot {h_eq:.2f}\\cdot {L_H:.2f}}}{{{L_L:.2f}}}',
+                ])
         elif lambda_3 * L_L / L_H > 0.5 * h_eq:
             # if the engulfed steel column center point is above the opening soffit
             lambda_4 = h_eq * L_H / L_L - d_1 - lambda_3
-            _latex.extend([
-                f'\\lambda_4=\\frac{{h_{{eq}} L_H}}{{L_L}}-d_1-\\lambda_3',
-                f'\\lambda_4=\\frac{{{h_eq:.2f}\\cdot {L_H:.2f}}}{{{L_L:.2f}}}-{d_1:.2f}-{lambda_3:.2f}',
-            ])
+            if not compute_only:
+                _latex.extend([
+                    f'\\lambda_4=\\frac{{h_{{eq}} L_H}}{{L_L}}-d_1-\\lambda_3',
+                    f'\\lambda_4=\\frac{{{h_eq:.2f}\\cdot {L_H:.2f}}}{{{L_L:.2f}}}-{d_1:.2f}-{lambda_3:.2f}',
+                ])
         else:
             raise ValueError('This error shouldn\'t be possible')
     else:
         # if not forced draught
         lambda_4 = max(0, 2 * L_H - lambda_3 - d_1)
-        _latex.extend([
-            f'\\lambda_4=\\operatorname{{max}}\\left(0, 2 L_H-\\lambda_3-d_1\\right)',
-            f'\\lambda_4=\\operatorname{{max}}\\left(0, 2\\cdot {L_H:.2f}-{lambda_3:.2f}-{d_1:.2f}\\right)',
-        ])
+        if not compute_only:
+            _latex.extend([
+                f'\\lambda_4=\\operatorname{{max}}\\left(0, 2 L_H-\\lambda_3-d_1\\right)',
+                f'\\lambda_4=\\operatorname{{max}}\\left(0, 2\\cdot {L_H:.2f}-{lambda_3:.2f}-{d_1:.2f}\\right)',
+            ])
 
-    _latex.extend([f'\\lambda_4={lambda_4:.2f}\\ \\left[m\\right]'])
+    if not compute_only:
+        _latex.extend([f'\\lambda_4={lambda_4:.2f}\\ \\left[m\\right]'])
 
+    if compute_only:
+        return dict(lambda_4=lambda_4)
     return dict(lambda_4=lambda_4, _latex=_latex)
 
 
@@ -1058,7 +1154,7 @@ def clause_b_4_2_epsilon_z_i(
         lambda_2,
         lambda_3,
         lambda_4,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.4 (2), page 61
@@ -1077,6 +1173,9 @@ def clause_b_4_2_epsilon_z_i(
     epsilon_z_3 = 1 - e ** (-0.3 * lambda_3)
     epsilon_z_4 = 1 - e ** (-0.3 * lambda_4)
 
+    if compute_only:
+        return dict(epsilon_z_1=epsilon_z_1, epsilon_z_2=epsilon_z_2, epsilon_z_3=epsilon_z_3, epsilon_z_4=epsilon_z_4)
+
     _latex = [
         f'\\varepsilon_{{z,1}}=1-e^{{-0.3\\cdot \\lambda_1}}=1-e^{{-0.3\\cdot {lambda_1:.2f}}}={epsilon_z_1:.5f}\\ \\left[ -\\right]',
         f'\\varepsilon_{{z,2}}=1-e^{{-0.3\\cdot \\lambda_2}}=1-e^{{-0.3\\cdot {lambda_2:.2f}}}={epsilon_z_2:.5f}\\ \\left[ -\\right]',
@@ -1095,7 +1194,7 @@ def clause_b_4_5_l(
         d_1: float,
         lambda_3: float,
         is_forced_draught: bool,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.4 (5), page 61
@@ -1111,22 +1210,24 @@ def clause_b_4_5_l(
     :return:
     """
 
-    _latex = [
-        f'l=\n'
-        f'\\begin{{dcases}}\n'
-        f'\\frac{{h_{{eq}}}}{{2}},                                                                                                      & \\text{{if no forced draught}}\\ \\left[{not is_forced_draught}\\right]\\\\\n'
-        f'\\operatorname{{min}}\\left(\\frac{{\\left(\\lambda_3+0.5d_1\\right) L_L}}{{L_H}},\\frac{{0.5h_{{eq}} L_L}}{{L_H}}\\right),   & \\text{{if forced draught}}\\ \\left[{is_forced_draught}\\right]\\\\\n'
-        f'\\end{{dcases}}'
-    ]
+    if not compute_only:
+        _latex = [
+            f'l=\n'
+            f'\\begin{{dcases}}\n'
+            f'\\frac{{h_{{eq}}}}{{2}},                                                                                                      & \\text{{if no forced draught}}\\ \\left[{not is_forced_draught}\\right]\\\\\n'
+            f'\\operatorname{{min}}\\left(\\frac{{\\left(\\lambda_3+0.5d_1\\right) L_L}}{{L_H}},\\frac{{0.5h_{{eq}} L_L}}{{L_H}}\\right),   & \\text{{if forced draught}}\\ \\left[{is_forced_draught}\\right]\\\\\n'
+            f'\\end{{dcases}}'
+        ]
 
     if not is_forced_draught:
         # Equation B.19a
         # note, original equation `l = h / 2`
         l = h_eq / 2
 
-        _latex.extend([
-            f'l=\\frac{{{h_eq:.2f}}}{{2}}',
-        ])
+        if not compute_only:
+            _latex.extend([
+                f'l=\\frac{{{h_eq:.2f}}}{{2}}',
+            ])
     else:
         # Equation B.19b
         # todo, the equation below is not exactly the same as Equation B.19b in BS EN 1993-1-2.
@@ -1134,15 +1235,19 @@ def clause_b_4_5_l(
         # note, original equation `l = (lambda_3 + 0.5 * d_1) * L_L / L_H` and `l <= 0.5 * h_eq * L_L / L_H`
         l = min((lambda_3 + 0.5 * d_1) * L_L / L_H, 0.5 * h_eq * L_L / L_H)
 
+        if not compute_only:
+            _latex.extend([
+                f'l=\\operatorname{{min}}\\left(\\frac{{\\left({lambda_3:.2f}+0.5\\cdot {d_1:.2f}\\right) {L_L:.2f}}}{{{L_H:.2f}}}, \\frac{{0.5\\cdot {h_eq:.2f}\\cdot {L_L:.2f}}}{{{L_H:.2f}}}\\right)',
+                f'l=\\operatorname{{min}}\\left({(lambda_3 + 0.5 * d_1) * L_L / L_H:.2f}, {0.5 * h_eq * L_L / L_H:.2f}\\right)',
+            ])
+
+    if not compute_only:
         _latex.extend([
-            f'l=\\operatorname{{min}}\\left(\\frac{{\\left({lambda_3:.2f}+0.5\\cdot {d_1:.2f}\\right) {L_L:.2f}}}{{{L_H:.2f}}}, \\frac{{0.5\\cdot {h_eq:.2f}\\cdot {L_L:.2f}}}{{{L_H:.2f}}}\\right)',
-            f'l=\\operatorname{{min}}\\left({(lambda_3 + 0.5 * d_1) * L_L / L_H:.2f}, {0.5 * h_eq * L_L / L_H:.2f}\\right)',
+            f'l={l:.2f}\\ \\left[ m\\right]'
         ])
 
-    _latex.extend([
-        f'l={l:.2f}\\ \\left[ m\\right]'
-    ])
-
+    if compute_only:
+        return dict(l=l)
     return dict(l=l, _latex=_latex)
 
 
@@ -1150,7 +1255,7 @@ def clause_b_4_6_a_z(
         epsilon_z_1,
         epsilon_z_2,
         epsilon_z_3,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.4 (6), page 61
@@ -1166,6 +1271,9 @@ def clause_b_4_6_a_z(
     # Equation B.20
     a_z = (epsilon_z_1 + epsilon_z_2 + epsilon_z_3) / 3
 
+    if compute_only:
+        return dict(a_z=a_z)
+
     _latex = [
         f'a_z=\\frac{{\\varepsilon_{{z,1}}+\\varepsilon_{{z,2}}+\\varepsilon_{{z,3}}}}{{3}}',
         f'a_z=\\frac{{{epsilon_z_1:.2f}+{epsilon_z_2:.2f}+{epsilon_z_3:.2f}}}{{3}}',
@@ -1183,35 +1291,41 @@ def clause_b_5_1_1_2_lambda_1(
         lambda_4,
         d_1,
         is_forced_draught,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
-    _latex = [
-        f'\\lambda_1=\n'
-        f'\\begin{{dcases}}\n'
-        f'\\frac{{2}}{{3}} h_{{eq}} + d_{{aw}},                                     &\\text{{if no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
-        f'd_{{aw}}+h_{{eq}}-\\left(\\lambda_4+0.5 d_1\\right)\\frac{{L_L}}{{L_H}},  &\\text{{if forced draught }}\\left[{is_forced_draught}\\right]\\\\\n'
-        f'\\end{{dcases}}'
-    ]
+    if not compute_only:
+        _latex = [
+            f'\\lambda_1=\n'
+            f'\\begin{{dcases}}\n'
+            f'\\frac{{2}}{{3}} h_{{eq}} + d_{{aw}},                                     &\\text{{if no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
+            f'd_{{aw}}+h_{{eq}}-\\left(\\lambda_4+0.5 d_1\\right)\\frac{{L_L}}{{L_H}},  &\\text{{if forced draught }}\\left[{is_forced_draught}\\right]\\\\\n'
+            f'\\end{{dcases}}'
+        ]
 
     if is_forced_draught is False:
         # for non forced draught condition
         lambda_1 = 2 / 3 * h_eq + d_aw
-        _latex.extend([
-            f'\\lambda_1=\\frac{{2}}{{3}} h_{{eq}} + d_{{aw}}',
-            f'\\lambda_1=\\frac{{2}}{{3}}\\cdot {h_eq:.2f}+{d_aw:.2f}',
-        ])
+        if not compute_only:
+            _latex.extend([
+                f'\\lambda_1=\\frac{{2}}{{3}} h_{{eq}} + d_{{aw}}',
+                f'\\lambda_1=\\frac{{2}}{{3}}\\cdot {h_eq:.2f}+{d_aw:.2f}',
+            ])
     else:
         # for forced draught condition
         lambda_1 = d_aw + h_eq - (lambda_4 + 0.5 * d_1) * (L_L / L_H)
+        if not compute_only:
+            _latex.extend([
+                f'\\lambda_1=d_{{aw}}+h_{{eq}}-\\left(\\lambda_4+0.5 d_1\\right)\\frac{{L_L}}{{L_H}}',
+                f'\\lambda_1={d_aw:.2f}+{h_eq:.2f}-\\left({lambda_4:.2f}+0.5\\cdot {d_1:.2f}\\right)\\frac{{{L_L:.2f}}}{{{L_H:.2f}}}',
+            ])
+
+    if not compute_only:
         _latex.extend([
-            f'\\lambda_1=d_{{aw}}+h_{{eq}}-\\left(\\lambda_4+0.5 d_1\\right)\\frac{{L_L}}{{L_H}}',
-            f'\\lambda_1={d_aw:.2f}+{h_eq:.2f}-\\left({lambda_4:.2f}+0.5\\cdot {d_1:.2f}\\right)\\frac{{{L_L:.2f}}}{{{L_H:.2f}}}',
+            f'\\lambda_1={lambda_1:.2f}\\ \\left[m\\right]',
         ])
 
-    _latex.extend([
-        f'\\lambda_1={lambda_1:.2f}\\ \\left[m\\right]',
-    ])
-
+    if compute_only:
+        return dict(lambda_1=lambda_1)
     return dict(lambda_1=lambda_1, _latex=_latex)
 
 
@@ -1220,33 +1334,39 @@ def clause_b_5_1_1_2_lambda_2(
         d_aw, d_2, h_eq,
         lambda_1,
         is_forced_draught,
-        *_, **__,
+        *_, compute_only: bool = False, **__,
 ):
-    _latex = [
-        f'\\lambda_2=\n'
-        f'\\begin{{dcases}}\n'
-        f'\\operatorname{{max}}\\left(0, L_L-d_{{aw}}-d_2\\right),        &\\text{{if no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
-        f'\\operatorname{{max}}\\left(0, h_{{eq}}-\\lambda_1-d_2\\right),   &\\text{{if forced draught }}\\left[{is_forced_draught}\\right]\\\\\n'
-        f'\\end{{dcases}}'
-    ]
+    if not compute_only:
+        _latex = [
+            f'\\lambda_2=\n'
+            f'\\begin{{dcases}}\n'
+            f'\\operatorname{{max}}\\left(0, L_L-d_{{aw}}-d_2\\right),        &\\text{{if no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
+            f'\\operatorname{{max}}\\left(0, h_{{eq}}-\\lambda_1-d_2\\right),   &\\text{{if forced draught }}\\left[{is_forced_draught}\\right]\\\\\n'
+            f'\\end{{dcases}}'
+        ]
 
     if not is_forced_draught:
         lambda_2 = max(0, L_L - d_aw - d_2)
-        _latex.extend([
-            f'\\lambda_2=\\operatorname{{max}}\\left(0, L_L-d_{{aw}} - d_2\\right)',
-            f'\\lambda_2=\\operatorname{{max}}\\left(0, {L_L:.2f}-{d_aw:.2f}-{d_2:.2f}\\right)',
-        ])
+        if not compute_only:
+            _latex.extend([
+                f'\\lambda_2=\\operatorname{{max}}\\left(0, L_L-d_{{aw}} - d_2\\right)',
+                f'\\lambda_2=\\operatorname{{max}}\\left(0, {L_L:.2f}-{d_aw:.2f}-{d_2:.2f}\\right)',
+            ])
     else:
         lambda_2 = max(0, h_eq - lambda_1 - d_2)
+        if not compute_only:
+            _latex.extend([
+                f'\\lambda_2=\\operatorname{{max}}\\left(0,h_{{eq}}-\\lambda_1-d_2\\right)',
+                f'\\lambda_2=\\operatorname{{max}}\\left(0,{h_eq:.2f}-{lambda_1:.2f}-{d_2:.2f}\\right)',
+            ])
+
+    if not compute_only:
         _latex.extend([
-            f'\\lambda_2=\\operatorname{{max}}\\left(0,h_{{eq}}-\\lambda_1-d_2\\right)',
-            f'\\lambda_2=\\operatorname{{max}}\\left(0,{h_eq:.2f}-{lambda_1:.2f}-{d_2:.2f}\\right)',
+            f'\\lambda_2={lambda_2:.2f}\\ \\left[m\\right]',
         ])
 
-    _latex.extend([
-        f'\\lambda_2={lambda_2:.2f}\\ \\left[m\\right]',
-    ])
-
+    if compute_only:
+        return dict(lambda_2=lambda_2)
     return dict(lambda_2=lambda_2, _latex=_latex)
 
 
@@ -1254,31 +1374,37 @@ def clause_b_5_1_1_2_lambda_3(
         L_H, L_L,
         lambda_4, d_aw, h_eq, d_1, d_2,
         is_forced_draught,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
-    _latex = [
-        f'\\lambda_3=\n'
-        f'\\begin{{dcases}}\n'
-        f'2 L_H-\\lambda_4-d_1,                                                                             &\\text{{if no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
-        f'\\frac{{L_H}}{{L_L}}\\left(d_{{aw}}+h_{{eq}} + 0.5 d_2\\right)-\\left(d_1+\\lambda_4\\right),     &\\text{{if forced draught }}\\left[{is_forced_draught}\\right]\\\\\n'
-        f'\\end{{dcases}}'
-    ]
+    if not compute_only:
+        _latex = [
+            f'\\lambda_3=\n'
+            f'\\begin{{dcases}}\n'
+            f'2 L_H-\\lambda_4-d_1,                                                                             &\\text{{if no forced draught }} \\left[ {not is_forced_draught}\\right]\\\\\n'
+            f'\\frac{{L_H}}{{L_L}}\\left(d_{{aw}}+h_{{eq}} + 0.5 d_2\\right)-\\left(d_1+\\lambda_4\\right),     &\\text{{if forced draught }}\\left[{is_forced_draught}\\right]\\\\\n'
+            f'\\end{{dcases}}'
+        ]
     if not is_forced_draught:
         lambda_3 = 2 * L_H - lambda_4 - d_1
-        _latex.extend([
-            f'\\lambda_3=2L_H-\\lambda_4-d_1',
-            f'\\lambda_3=2\\cdot {L_H:.2f}-{lambda_4:.2f}-{d_1:.2f}',
-        ])
+        if not compute_only:
+            _latex.extend([
+                f'\\lambda_3=2L_H-\\lambda_4-d_1',
+                f'\\lambda_3=2\\cdot {L_H:.2f}-{lambda_4:.2f}-{d_1:.2f}',
+            ])
     else:
         lambda_3 = (L_H / L_L) * (d_aw + h_eq + 0.5 * d_2) - (d_1 + lambda_4)
+        if not compute_only:
+            _latex.extend([
+                f'\\lambda_3=\\frac{{L_H}}{{L_L}}\\left(d_{{aw}}+h_{{eq}}+0.5 d_2\\right)-\\left(d_1+\\lambda_4\\right)',
+                f'\\lambda_3=\\frac{{{L_H:.2f}}}{{{L_L:.2f}}}\\left({d_aw:.2f}+{h_eq:.2f}+0.5\\cdot {d_2:.2f}\\right)-\\left({d_1:.2f}+{lambda_4:.2f}\\right)',
+            ])
+
+    if not compute_only:
         _latex.extend([
-            f'\\lambda_3=\\frac{{L_H}}{{L_L}}\\left(d_{{aw}}+h_{{eq}}+0.5 d_2\\right)-\\left(d_1+\\lambda_4\\right)',
-            f'\\lambda_3=\\frac{{{L_H:.2f}}}{{{L_L:.2f}}}\\left({d_aw:.2f}+{h_eq:.2f}+0.5\\cdot {d_2:.2f}\\right)-\\left({d_1:.2f}+{lambda_4:.2f}\\right)',
+            f'\\lambda_3={lambda_3:.2f}\\ \\left[m\\right]',
         ])
-
-    _latex.extend([
-        f'\\lambda_3={lambda_3:.2f}\\ \\left[m\\right]',
-    ])
+    if compute_only:
+        return dict(lambda_3=lambda_3)
     return dict(lambda_3=lambda_3, _latex=_latex)
 
 
@@ -1286,7 +1412,7 @@ def clause_b_5_1_1_5_I_z(
         C_1, C_2, C_3, C_4,
         I_z_1, I_z_2, I_z_3, I_z_4,
         d_1, d_2,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.5.1.1 (5), page 62
@@ -1315,6 +1441,9 @@ def clause_b_5_1_1_5_I_z(
     d = (C_3 + C_4) * d_2
     I_z = (a + b) / (d + c)
 
+    if compute_only:
+        return dict(I_z=I_z)
+
     _latex = [
         f'I_z=\\frac{{\\left(I_{{z,1}}+I_{{z,2}}\\right) d_1+\\left(I_{{z,3}}+I_{{z,4}}\\right) d_2}}{{\\left(C_1+C_2\\right) d_1+\\left(C_3+C_4\\right) d_2}}',
         f'I_z=\\frac{{\\left({I_z_1:.2f}+{I_z_2:.2f}\\right) {d_1:.2f}+\\left({I_z_3:.2f}+{I_z_4:.2f}\\right) {d_2:.2f}}}{{\\left({C_1:.2f}+{C_2:.2f}\\right) {d_1:.2f}+\\left({C_3:.2f}+{C_4:.2f}\\right) {d_2:.2f}}}',
@@ -1330,7 +1459,7 @@ def clause_b_5_1_2_2_I_z_i(
         sigma,
         T_z_1, T_z_2,
         T_o,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.4 (1), page 59
@@ -1360,6 +1489,9 @@ def clause_b_5_1_2_2_I_z_i(
     I_z_3 = C_3 * epsilon_z_3 * sigma * (T_z_1 ** 4 + T_z_2 ** 4) / 2
     I_z_4 = C_4 * epsilon_z_4 * sigma * (T_z_1 ** 4 + T_z_2 ** 4) / 2
 
+    if compute_only:
+        return dict(I_z_1=I_z_1, I_z_2=I_z_2, I_z_3=I_z_3, I_z_4=I_z_4)
+
     _latex = [
         f'I_{{z,1}}=C_1\\varepsilon_{{z,1}}\\sigma {{T_o}}^4={C_1:.2f}\\cdot {epsilon_z_1:.3f}\\cdot \\left({sigma:.2E}\\right) {T_o:.2f}^4={I_z_1:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
         f'I_{{z,2}}=C_2\\varepsilon_{{z,2}}\\sigma {{T_{{z,2}}}}^4={C_2:.2f}\\cdot {epsilon_z_2:.3f} \\left({sigma:.2E}\\right) {T_z_2:.2f}^4={I_z_2:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
@@ -1392,7 +1524,7 @@ def clause_b_5_1_2_4_I_z_i(
         h_z,
         d_2,
         T_x: float = 813,  # according to B.5.1.2(4)
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.4 (1), page 59
@@ -1423,6 +1555,9 @@ def clause_b_5_1_2_4_I_z_i(
     I_z_3 = (h_z / d_2) * C_3 * epsilon_z_3 * sigma * (T_z_1 ** 4 + T_x ** 4) / 2
     I_z_4 = (h_z / d_2) * C_4 * epsilon_z_4 * sigma * (T_z_1 ** 4 + T_x ** 4) / 2
 
+    if compute_only:
+        return dict(I_z_1=I_z_1, I_z_2=I_z_2, I_z_3=I_z_3, I_z_4=I_z_4)
+
     _latex = [
         f'I_{{z,1}}=C_1\\varepsilon_{{z,1}}\\sigma {{T_o}}^4={C_1:.2f}\\cdot {epsilon_z_1:.3f}\\cdot \\left({sigma:.2E}\\right) {T_o:.2f}^4={I_z_1:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
         f'I_{{z,2}}={I_z_2:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
@@ -1439,7 +1574,7 @@ def clause_b_5_1_3_2_I_z_i(
         sigma,
         T_z_1, T_z_2,
         T_o,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.5.1.3 (2), page 64
@@ -1469,6 +1604,9 @@ def clause_b_5_1_3_2_I_z_i(
     I_z_3 = C_3 * epsilon_z_3 * sigma * (T_z_1 ** 4 + T_z_2 ** 4) / 2
     I_z_4 = C_4 * epsilon_z_4 * sigma * (T_z_1 ** 4 + T_z_2 ** 4) / 2
 
+    if compute_only:
+        return dict(I_z_1=I_z_1, I_z_2=I_z_2, I_z_3=I_z_3, I_z_4=I_z_4)
+
     _latex = [
         f'I_{{z,1}}=C_1\\varepsilon_{{z,1}}\\sigma {{T_o}}^4={C_1:.2f}\\cdot {epsilon_z_1:.3f}\\cdot \\left({sigma:.2E}\\right) {T_o:.2f}^4={I_z_1:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
         f'I_{{z,2}}=C_2\\varepsilon_{{z,2}}\\sigma {{T_{{z,2}}}}^4={C_2:.2f}\\cdot {epsilon_z_2:.3f} \\left({sigma:.2E}\\right) {T_z_2:.2f}^4={I_z_2:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
@@ -1486,7 +1624,7 @@ def clause_b_5_1_3_3_I_z_i(
         T_z_1, T_z_2,
         phi_z_2, phi_z_3,
         T_o,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.5.1.3 (3), page 64
@@ -1516,6 +1654,9 @@ def clause_b_5_1_3_3_I_z_i(
     I_z_3 = phi_z_3 * C_3 * epsilon_z_3 * sigma * (T_z_1 ** 4 + T_z_2 ** 4) / 2
     I_z_4 = 0
 
+    if compute_only:
+        return dict(I_z_1=I_z_1, I_z_2=I_z_2, I_z_3=I_z_3, I_z_4=I_z_4)
+
     _latex = [
         f'I_{{z,1}}=C_1\\varepsilon_{{z,1}}\\sigma {{T_o}}^4={C_1:.2f}\\cdot {epsilon_z_1:.3f}\\cdot \\left({sigma:.2E}\\right) {T_o:.2f}^4={I_z_1:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
         f'I_{{z,2}}=\\phi_{{z,2}}C_2\\varepsilon_{{z,2}}\\sigma {{T_{{z,2}}}}^4={C_2:.2f}\\cdot {epsilon_z_2:.3f} \\left({sigma:.2E}\\right) {T_z_2:.2f}^4={I_z_2:.2f}\\ \\left[\\frac{{kW}}{{m^2}}\\right]',
@@ -1532,6 +1673,7 @@ def clause_b_5_2_1_epsilon_z_i(
         lambda_3,
         lambda_4,
         *_,
+        compute_only: bool = False,
         **__
 ):
     """
@@ -1551,6 +1693,9 @@ def clause_b_5_2_1_epsilon_z_i(
     epsilon_z_3 = 1 - e ** (-0.3 * lambda_3)
     epsilon_z_4 = 1 - e ** (-0.3 * lambda_4)
 
+    if compute_only:
+        return dict(epsilon_z_1=epsilon_z_1, epsilon_z_2=epsilon_z_2, epsilon_z_3=epsilon_z_3, epsilon_z_4=epsilon_z_4)
+
     _latex = [
         f'\\varepsilon_{{z,1}}=1-e^{{-0.3\\cdot \\lambda_1}}=1-e^{{-0.3\\cdot {lambda_1:.2f}}}={epsilon_z_1:.5f}\\ \\left[ -\\right]',
         f'\\varepsilon_{{z,2}}=1-e^{{-0.3\\cdot \\lambda_2}}=1-e^{{-0.3\\cdot {lambda_2:.2f}}}={epsilon_z_2:.5f}\\ \\left[ -\\right]',
@@ -1564,7 +1709,7 @@ def clause_b_5_2_1_epsilon_z_i(
 
 def clause_b_5_3_a_z(
         lambda_1,
-        *_, **__
+        *_, compute_only: bool = False, **__
 ):
     """
     Clause B.5.3 (1), page 64
@@ -1578,6 +1723,9 @@ def clause_b_5_3_a_z(
 
     # Equation B.26, page 64
     a_z = 1 - e ** (-0.3 * lambda_1)
+    if compute_only:
+        return dict(a_z=a_z)
+
     _latex = [
         f'a_z=1-e^{{-0.3h}}',
         f'a_z=1-e^{{-0.3\\cdot {lambda_1:.2f}}}',
@@ -1,41 +1,43 @@
-import copy
+import numpy as np
 
 
 # [Eq. 11.1 & 11.2]
 def _theta_c(Q, r, h):
     """
-    :param Q: [W] Rate of heat release from the fire.
-    :param r: [m] Radial distance from the centre of the fire plume impingement.
-    :param h: [m]
+    :param Q: [W] Rate of heat release from the fire, scalar or array.
+    :param r: [m] Radial distance from the centre of the fire plume impingement, scalar or array.
+    :param h: [m] scalar or array, `Q`, `r` and `h` are broadcast together.
     :return theta_c: [K]
     """
-    Q = copy.copy(Q) / 1000.0  # Unit: [W] to [kW]
+    Q, r, h = np.broadcast_arrays(np.asarray(Q, dtype=float) / 1000.0, r, h)  # Unit: [W] to [kW]
+    r, h = r.astype(float), h.astype(float)
 
-    # Condition for r/h
-    if r / h > 0.18:
-        theta_c = 5.38 * (Q / r) ** (2 / 3) / h
-    else:
-        theta_c = 16.9 * Q ** (2 / 3) / h ** (5 / 3)
+    # Condition for r/h, ceiling jet and plume regimes are evaluated on their own elements only
+    is_jet = r / h > 0.18
+    theta_c = np.empty(Q.shape)
+    theta_c[is_jet] = 5.38 * (Q[is_jet] / r[is_jet]) ** (2 / 3) / h[is_jet]
+    theta_c[~is_jet] = 16.9 * Q[~is_jet] ** (2 / 3) / h[~is_jet] ** (5 / 3)
 
     theta_c += 273.15  # Unit: [C] to [K]
-    return theta_c
+    return theta_c[()]
 
 
 def _U(Q, r, h):
     """[Eq. 11.3 & 11.4]
-    :param Q: [W] Rate of heat release from the fire.
-    :param r: [m] Radial distance from the centre of the fire plume impingement.
-    :param h: [m]
+    :param Q: [W] Rate of heat release from the fire, scalar or array.
+    :param r: [m] Radial distance from the centre of the fire plume impingement, scalar or array.
+    :param h: [m] scalar or array, `Q`, `r` and `h` are broadcast together.
     :return U: [m/s]
     """
-    Q = copy.copy(Q) / 1000.0  # Unit: [W] to [kW]
+    Q, r, h = np.broadcast_arrays(np.asarray(Q, dtype=float) / 1000.0, r, h)  # Unit: [W] to [kW]
+    r, h = r.astype(float), h.astype(float)
 
-    if r / h > 0.15:
-        U = 0.195 * Q ** (1 / 3) * h ** (1 / 2) / r ** (5 / 6)
-    else:
-        U = 0.96 * Q / h ** (1 / 3)
+    is_jet = r / h > 0.15
+    U = np.empty(Q.shape)
+    U[is_jet] = 0.195 * Q[is_jet] ** (1 / 3) * h[is_jet] ** (1 / 2) / r[is_jet] ** (5 / 6)
+    U[~is_jet] = 0.96 * (Q[~is_jet] / h[~is_jet]) ** (1 / 3)
 
-    return U
+    return U[()]
 
 
 def _dT_d_dt(U, T_g, T_d, RTI):
@@ -65,6 +67,55 @@ def _Q(alpha, t):
     return Q
 
 
+def sprinkler_activation_time(alpha, r, h, RTI, T_d_activation, time, T_0=273.15):
+    """Calculates sprinkler (or heat detector) activation time under t-squared fires, by integrating [Eq. 11.5] with
+    the ceiling jet [Eq. 11.1 to 11.4] and fire growth [Eq. 6.1].
+
+    All of `alpha`, `r`, `h`, `RTI` and `T_d_activation` are broadcast together and solved in one time loop, e.g.
+    `alpha[:, np.newaxis]` and `r[np.newaxis, :]` solve every growth rate and radial distance combination.
+
+    :param alpha: [W/s2] fire growth rate, see `_Q`, scalar or array.
+    :param r: [m] radial distance from the centre of the fire plume impingement, scalar or array.
+    :param h: [m] scalar or array.
+    :param RTI: [-] response time index, scalar or array.
+    :param T_d_activation: [K] activation temperature, scalar or array.
+    :param time: [s] 1-D time array.
+    :param T_0: [K] initial sprinkler temperature.
+    :return activation_time: [s] NaN if not activated within `time`.
+    :return activation_Q: [W] rate of heat release at activation, NaN if not activated within `time`.
+    """
+    alpha, r, h, RTI, T_d_activation = np.broadcast_arrays(
+        *(np.asarray(i, dtype=float) for i in (alpha, r, h, RTI, T_d_activation))
+    )
+    shape = alpha.shape
+    alpha, r, h, RTI, T_d_activation = (i.ravel() for i in (alpha, r, h, RTI, T_d_activation))
+    time = np.asarray(time, dtype=float)
+
+    activation_time = np.full(alpha.shape, np.nan)
+    T_d = np.full(alpha.shape, T_0)
+    active = np.arange(alpha.size)  # not activated yet
+    for i in range(1, len(time)):
+        Q = _Q(alpha[active], time[i])
+        T_d_1 = T_d[active] + _dT_d_dt(
+            _U(Q, r[active], h[active]), _theta_c(Q, r[active], h[active]), T_d[active], RTI[active]
+        ) * (time[i] - time[i - 1])
+
+        # activated within this step, activation time is interpolated linearly
+        is_activated = T_d_1 >= T_d_activation[active]
+        if np.any(is_activated):
+            T_d_0 = T_d[active][is_activated]
+            activation_time[active[is_activated]] = time[i - 1] + (time[i] - time[i - 1]) * (
+                    T_d_activation[active][is_activated] - T_d_0) / (T_d_1[is_activated] - T_d_0)
+
+        T_d[active] = T_d_1
+        active = active[~is_activated]
+        if active.size == 0:
+            break
+
+    activation_time = activation_time.reshape(shape)
+    return activation_time[()], _Q(alpha.reshape(shape), activation_time)[()]
+
+
 if __name__ == "__main__":
     import numpy as np
 
@@ -0,0 +1,62 @@
+import numpy as np
+
+from .cibse_guide_e import _theta_c, _U, _dT_d_dt, _Q, sprinkler_activation_time
+
+
+def test_theta_c_and_U_array():
+    # radial distances in both the plume and the ceiling jet regimes
+    Q, r, h = 1e6, np.array([0., 0.2, 0.4, 1., 5.]), 2.6
+
+    theta_c, U = _theta_c(Q, r, h), _U(Q, r, h)
+    assert theta_c.shape == U.shape == r.shape
+    for i, r_ in enumerate(r):
+        assert abs(theta_c[i] - _theta_c(Q, r_, h)) < 1e-9
+        assert abs(U[i] - _U(Q, r_, h)) < 1e-9
+
+    # plume regime is independent of r, and scalar inputs give scalar outputs
+    assert theta_c[0] == theta_c[1] == 16.9 * 1000 ** (2 / 3) / 2.6 ** (5 / 3) + 273.15
+    assert abs(_theta_c(Q, 5., h) - (5.38 * (1000 / 5) ** (2 / 3) / 2.6 + 273.15)) < 1e-9
+    assert np.ndim(_U(Q, 5., h)) == 0
+
+    # hand calculated velocities at 1 MW and 3 m, plume 0.96 * (1000 / 3) ** (1 / 3) and ceiling jet
+    # 0.195 * 1000 ** (1 / 3) * 3 ** (1 / 2) / 5 ** (5 / 6)
+    assert abs(_U(Q, 0.3, 3.) - 6.65627) < 1e-5
+    assert abs(_U(Q, 5., 3.) - 0.88332) < 1e-5
+
+
+def test_sprinkler_activation_time():
+    time = np.arange(0, 600, 0.5)
+    alpha = np.array([0.0029e3, 0.0117e3, 0.0469e3])  # slow, medium and fast
+    r = np.array([1., 2.75, 4.])
+
+    activation_time, activation_Q = sprinkler_activation_time(
+        alpha=alpha[:, np.newaxis], r=r[np.newaxis, :], h=2.6, RTI=115, T_d_activation=273.15 + 68, time=time,
+    )
+    assert activation_time.shape == activation_Q.shape == (3, 3)
+
+    # faster growth and closer sprinklers activate earlier
+    assert np.all(np.diff(activation_time, axis=0) < 0)
+    assert np.all(np.diff(activation_time, axis=1) > 0)
+
+    # the same as integrating each case on its own
+    for i, alpha_ in enumerate(alpha):
+        for j, r_ in enumerate(r):
+            T_d, t_act = 273.15, np.nan
+            for k in range(1, len(time)):
+                Q = _Q(alpha_, time[k])
+                T_d_ = T_d + _dT_d_dt(_U(Q, r_, 2.6), _theta_c(Q, r_, 2.6), T_d, 115) * (time[k] - time[k - 1])
+                if T_d_ >= 273.15 + 68:
+                    t_act = time[k - 1] + (time[k] - time[k - 1]) * (273.15 + 68 - T_d) / (T_d_ - T_d)
+                    break
+                T_d = T_d_
+            assert abs(activation_time[i, j] - t_act) < 1e-9
+            assert abs(activation_Q[i, j] - _Q(alpha_, t_act)) < 1e-3
+
+    # not activated within the time
+    activation_time, activation_Q = sprinkler_activation_time(0.0029e3, 4., 2.6, 115, 273.15 + 68, time[:10])
+    assert np.isnan(activation_time) and np.isnan(activation_Q)
+
+
+if __name__ == '__main__':
+    test_theta_c_and_U_array()
+    test_sprinkler_activation_time()
@@ -234,9 +234,9 @@ def eq_55_activation_of_heat_detector_device(
 
 def eq_26_axisymmetric_ceiling_jet_temperature(
         Q_dot_c_kW: float,
-        z_H: float,
+        z_H: Union[float, np.ndarray],
         z_0: float,
-        r: float,
+        r: Union[float, np.ndarray],
 ):
     """Equation 26 in Section 8.4.3.2 PD 7974-1:2019 calculates the temperature of ceiling jet above fire.
 
@@ -262,9 +262,9 @@ def eq_26_axisymmetric_ceiling_jet_temperature(
 
     # Limitations see docstring
     try:
-        assert r / (z_H - z_0) > 0.134
+        assert np.all(r / (z_H - z_0) > 0.134)
     except AssertionError:
-        errmsg = f'Failed to assert `r / (z_H - z_0) = {r / (z_H - z_0):.3f} > 0.134`. ' \
+        errmsg = f'Failed to assert `r / (z_H - z_0) = {np.amin(r / (z_H - z_0)):.3f} > 0.134`. ' \
                  f'Inputs are outside of the Alpert\'s ceiling jet correlation limits.'
         raise ValueError(errmsg)
 
@@ -281,9 +281,9 @@ def eq_26_axisymmetric_ceiling_jet_temperature(
 
 def eq_27_axisymmetric_ceiling_jet_velocity(
         Q_dot_c_kW: float,
-        z_H: float,
+        z_H: Union[float, np.ndarray],
         z_0: float,
-        r: float,
+        r: Union[float, np.ndarray],
 ):
     """Equation 26 in Section 8.4.3.2 PD 7974-1:2019 calculates the temperature of ceiling jet above fire.
 
@@ -309,9 +309,9 @@ def eq_27_axisymmetric_ceiling_jet_velocity(
 
     # Limitations see docstring
     try:
-        assert r / (z_H - z_0) > 0.246
+        assert np.all(r / (z_H - z_0) > 0.246)
     except AssertionError:
-        errmsg = f'Failed to assert `r / (z_H - z_0) = {r / (z_H - z_0)} > 0.246`. ' \
+        errmsg = f'Failed to assert `r / (z_H - z_0) = {np.amin(r / (z_H - z_0))} > 0.246`. ' \
                  f'Inputs are outside of the Alpert\'s ceiling jet correlation limits.'
         raise ValueError(errmsg)
 